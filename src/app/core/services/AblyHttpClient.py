@@ -0,0 +1,197 @@
+import re
+import json
+import requests
+from urllib.parse import urlparse
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from app.core.services.SellerInfoExtractor import SellerInfoExtractor
+from app.core.utils.Logger import Logger
+
+logger = Logger(name="AblyHttpClient", log_file="AblyHttpClient.log").get_logger()
+
+
+class AblyHttpClient:
+    """AblyHttpClient 클래스
+    - 브라우저 없이 requests 세션으로 에이블리 상품 페이지에서 마켓 ID를 찾고
+      마켓 정보 페이지(m.a-bly.com/market/{id}/info)를 읽어
+      AblyScraper._market_infos 와 같은 딕셔너리를 만든다
+    - 페이지 텍스트는 <p> 태그와 내장 데이터(__NEXT_DATA__ 등 JSON)의 문자열에서 찾음
+    - 차단(403/429, 다른 도메인/로그인/챌린지로 이동, 마켓 정보 없음)이 감지되면
+      None을 반환하고 last_block_reason에 이유를 남김 -> 호출자가 브라우저로 재시도
+    """
+
+    GOODS_URL = "https://m.a-bly.com/goods/{goods_sno}"
+    MARKET_URL = "https://a-bly.com/app/markets/{market_id}"
+    MARKET_INFO_URL = "https://m.a-bly.com/market/{market_id}/info"
+
+    USER_AGENT = (
+        "Mozilla/5.0 (iPhone; CPU iPhone OS 16_6 like Mac OS X) AppleWebKit/605.1.15 "
+        "(KHTML, like Gecko) Version/16.6 Mobile/15E148 Safari/604.1"
+    )
+
+    # 상품 페이지 HTML/내장 데이터에서 마켓 ID를 찾는 패턴 (앞에서부터 시도)
+    # - 내장 데이터의 마켓 번호가 우선, 페이지 안 링크는 추천 상품 등 다른
+    #   마켓을 가리킬 수 있어서 마지막에 본다
+    _MARKET_ID_PATTERNS = [
+        re.compile(r'"market_sno"\s*:\s*(\d+)'),
+        re.compile(r'"market"\s*:\s*\{\s*"sno"\s*:\s*(\d+)'),
+        re.compile(r"a-bly\.com/app/markets/(\d+)"),
+        re.compile(r"/markets?/(\d+)"),
+    ]
+
+    _BLOCK_MARKERS = ("captcha", "challenge", "cf-chl", "access denied")
+
+    def __init__(self, timeout=10):
+        self.timeout = timeout
+        self.last_block_reason = None
+
+        self.session = requests.Session()
+        self.session.headers.update(
+            {
+                "User-Agent": AblyHttpClient.USER_AGENT,
+                "Accept-Language": "ko-KR,ko;q=0.9",
+            }
+        )
+        retry = Retry(
+            total=2, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504)
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_maxsize=8)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def fetch_market_infos(self, goods_url, market_id=None):
+        """
+        :param market_id: 이미 알고 있으면 상품 페이지를 읽지 않음
+        :return: _market_infos 형식의 딕셔너리, 실패/차단이면 None
+        """
+        self.last_block_reason = None
+
+        try:
+            if market_id == None:
+                market_id = self.resolve_market_id(goods_url)
+            if market_id == None:
+                return None
+
+            return self.fetch_market_infos_by_id(market_id)
+
+        except Exception as e:
+            logger.error(f"에이블리 HTTP 마켓정보 조회 실패 - {goods_url} - {e}")
+            return None
+
+    def resolve_market_id(self, goods_url):
+        """실패하면 None, 이유는 last_block_reason에 남김"""
+        self.last_block_reason = None
+
+        html = self._get_html(goods_url)
+        if html == None:
+            return None
+
+        for pattern in AblyHttpClient._MARKET_ID_PATTERNS:
+            match = pattern.search(html)
+            if match:
+                return match.group(1)
+
+        self.last_block_reason = "마켓 ID 없음"
+        logger.info(f"상품 페이지에서 마켓 ID를 찾지 못함 - {goods_url}")
+        return None
+
+    def fetch_market_infos_by_id(self, market_id):
+        market_info_url = AblyHttpClient.MARKET_INFO_URL.format(market_id=market_id)
+        html = self._get_html(market_info_url)
+        if html == None:
+            return None
+
+        texts = AblyHttpClient.page_texts(html)
+        seller_infos = SellerInfoExtractor.for_site("ably").extract(texts)
+
+        if seller_infos["사업자번호"] == None and seller_infos["상호"] == None:
+            self.last_block_reason = "마켓 정보 없음"
+            logger.info(f"마켓 정보 페이지에 판매자 정보 없음 - {market_info_url}")
+            return None
+
+        return AblyHttpClient.to_market_infos(
+            AblyHttpClient.MARKET_URL.format(market_id=market_id), seller_infos
+        )
+
+    @staticmethod
+    def to_market_infos(market_link, seller_infos):
+        """SellerInfoExtractor 결과 -> _market_infos 형식 (못 찾은 값은 "스크랩실패")"""
+
+        def value(key):
+            return seller_infos[key] if seller_infos[key] != None else "스크랩실패"
+
+        return {
+            "브랜드 페이지": market_link,
+            "상호 / 대표자": f"{value('상호')} / {value('대표자')}",
+            "브랜드": value("브랜드"),
+            "사업자번호": value("사업자번호"),
+            "통신판매업신고": value("통신판매업신고"),
+            "연락처": value("연락처"),
+            "E-mail": value("E-mail"),
+            "영업소재지": value("영업소재지"),
+            "영문명": "고객요청으로추출X",
+        }
+
+    @staticmethod
+    def page_texts(html):
+        """<p> 텍스트 + 내장 JSON 데이터의 문자열들 (렌더링 전 HTML 대비)"""
+        soup = BeautifulSoup(html, "html.parser")
+        texts = [p.get_text(" ", strip=True) for p in soup.find_all("p")]
+
+        for script in soup.find_all("script"):
+            is_data = script.get("id") == "__NEXT_DATA__"
+            if not is_data and script.get("type") != "application/json":
+                continue
+            try:
+                texts.extend(AblyHttpClient._json_strings(json.loads(script.string)))
+            except (TypeError, ValueError):
+                continue
+
+        return [text for text in texts if text]
+
+    @staticmethod
+    def block_reason(url, html):
+        """
+        도착한 URL과 페이지 내용으로 차단 여부 판단 (브라우저 세션에서도 사용)
+        :return: 차단으로 보이면 이유, 아니면 None
+        """
+        final_host = urlparse(url).netloc
+        if not final_host.endswith("a-bly.com") or "login" in url:
+            return f"리다이렉트 {url}"
+
+        lowered = (html or "")[:5000].lower()
+        if any(marker in lowered for marker in AblyHttpClient._BLOCK_MARKERS):
+            return "챌린지 페이지"
+
+        return None
+
+    def _get_html(self, url):
+        response = self.session.get(url, timeout=self.timeout)
+
+        if response.status_code in (403, 429):
+            block_reason = f"HTTP {response.status_code}"
+        else:
+            block_reason = AblyHttpClient.block_reason(response.url, response.text)
+
+        if block_reason != None:
+            self.last_block_reason = block_reason
+            logger.warning(f"에이블리 차단 감지({block_reason}) - {url}")
+            return None
+
+        response.raise_for_status()
+        return response.text
+
+    @staticmethod
+    def _json_strings(data):
+        strings = []
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                strings.append(node)
+            elif isinstance(node, list):
+                stack.extend(node)
+            elif isinstance(node, dict):
+                stack.extend(node.values())
+        return strings
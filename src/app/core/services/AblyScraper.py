@@ -1,4 +1,3 @@
-import re
 import os
 from selenium.webdriver.common.by import By
 import time
@@ -15,42 +14,106 @@ from selenium.common.exceptions import (
     InvalidArgumentException,
 )
 import json
+from contextlib import contextmanager
 from selenium import webdriver
 from app.core.services.SeniumDravierManager import SeniumDravierManager
+from app.core.services.SeniumDriverPool import SeniumDriverPool
 from app.core.services.SeniumScraper import SeniumScraper
 from app.core.utils import Logger, FileMaker
 from app.core.utils.ImgMaker import save_imgs
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from .KiprisScrapper import KiprisScrapper
+from .AblyHttpClient import AblyHttpClient
+from .AblySessionScheduler import AblySessionScheduler
+from .SellerInfoExtractor import SellerInfoExtractor
+from .KiprisLookupService import KiprisLookupService
+from .TrademarkIndex import TrademarkIndex
+from .SellerProfileStore import SellerProfileStore
 from bs4 import BeautifulSoup
 import requests
 
 logger = Logger(name="AblyScraper", log_file="AblyScraper.log").get_logger()
 
+# "구매중" 문구가 있는 추천 아이템들의 링크(a[href])를 한 번에 읽는 스크립트
+# 링크가 없는 아이템은 null (클릭으로만 이동 가능)
+_ITEM_LINK_SCRIPT = """
+const snapshot = document.evaluate(
+    "//p[contains(text(), '구매중')]", document, null,
+    XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+);
+const hrefs = [];
+for (let i = 0; i < snapshot.snapshotLength; i++) {
+    const anchor = snapshot.snapshotItem(i).closest('a[href]');
+    hrefs.push(anchor ? anchor.href : null);
+}
+return hrefs;
+"""
+
 
 class AblyScraper(SeniumScraper):
 
-    def __init__(self, driver: SeniumDravierManager):
+    BLOCK_PROFILE = "ably"
+
+    BLOCK_RETRIES = 1  # 차단되면 새 세션으로 다시 시도하는 횟수
+
+    def __init__(
+        self,
+        driver: SeniumDravierManager,
+        driver_pool: SeniumDriverPool = None,
+        http_client: AblyHttpClient = None,
+    ):
 
         super().__init__(driver)
 
-        self.kipris_scraper = KiprisScrapper(driver=driver)
+        self.driver_pool = driver_pool
+
+        # 차단 신호가 있을 때만 브라우저를 교체하며 세션을 재사용
+        self.session_scheduler = AblySessionScheduler(driver_pool=driver_pool)
+
+        # 마켓 정보는 HTTP로 먼저 조회하고 차단될 때만 브라우저 사용
+        self.http_client = http_client or AblyHttpClient()
+
+        # 마켓 ID/상품 URL로 저장해둔 판매자 정보 (있으면 마켓 페이지를 열지 않음)
+        self.seller_profiles = SellerProfileStore.shared()
+
+        # 조회 서비스(세션 풀, 진행중 요청 병합, 속도 제한)와 캐시는 스크래퍼끼리 공유
+        kipris_lookup_service = KiprisLookupService.shared()
+        self.kipris_scraper = KiprisScrapper(
+            driver=self.driver,
+            lookup_service=kipris_lookup_service,
+            tm_cache=kipris_lookup_service.tm_cache,
+            tm_index=TrademarkIndex.shared(),
+        )
 
         self.event_links = []
 
-        self.tm_state_r_num_list = []  # 등록된상표권출원번호 리스트
+        # 키프리스 조회중에 모은 등록 상표권 출원번호/사진 (KiprisScrapper와 공유)
+        self.tm_state_r_num_list = self.kipris_scraper.tm_state_r_num_list
 
         self.tm_state_r_img_srcs: dict[str, dict[str, str]] = (
-            {}
+            self.kipris_scraper.tm_state_r_img_srcs
         )  # 등록된상표권출원 사진들
 
         self._scraping_failed_brand_count = 0
 
         self._market_infos = {}
 
+    @contextmanager
+    def _open_driver(self, count_page=True):
+        """
+        스크랩 구간마다 사용할 드라이버를 연다.
+        세션 스케줄러가 차단 신호가 없으면 같은 드라이버를 돌려주고,
+        차단되었거나 재사용 한도에 닿으면 새 드라이버로 교체한다.
+        :param count_page: False면 재사용 한도에 세지 않음 (키프리스 등)
+        """
+        with self.session_scheduler.session(count_page=count_page) as _driver:
+            yield _driver
+
+    def close(self):
+        """세션 스케줄러가 잡고 있는 드라이버를 반납"""
+        self.session_scheduler.close()
+
     def _go_cloth_section(self):
         try:
             self.find_element(
@@ -62,204 +125,314 @@ class AblyScraper(SeniumScraper):
         except Exception as e:
             logger.exception("의류섹션 클릭 - {e}")
 
-    def _scrape_recomended_item_links(
-        self,
-        current_recomended_item_index,
-        recomended_item_links: list = [],
-        max_scraping_size=100,
-    ):
+    def harvest_item_links(self, max_items=100, max_scroll_attempts=10):
+        """
+        한 세션에서 의류 섹션 피드를 스크롤하며 추천 아이템(goods) URL을 모은다.
+        - 아이템의 a[href], 피드 API 응답(JSON)의 상품번호를 먼저 사용하고
+        - 그래도 모자라면 마지막 수단으로 클릭 -> URL 기록 -> 뒤로가기
+        :return: 중복을 제거한 goods URL 리스트 (최대 max_items개)
+        """
+        item_links = []
+        seen = set()
+
+        def add(url):
+            if url and "goods" in url and url not in seen:
+                seen.add(url)
+                item_links.append(url)
+
+        has_unlinked_items = False
+
         try:
-            link_elems = self.find_all_element(
-                by=By.XPATH,
-                expression="//p[contains(text(), '구매중')]",
-                element_description="에이블리 의류섹션 추천아이템링크들",
+            with self.capture_network() as capture:
+                for attempt in range(max_scroll_attempts + 1):
+                    before = len(item_links)
+
+                    hrefs = self.driver.execute_script(_ITEM_LINK_SCRIPT) or []
+                    has_unlinked_items = has_unlinked_items or None in hrefs
+                    for href in hrefs:
+                        add(href)
+
+                    for response in capture.collect(timeout=0.5, idle=0):
+                        goods_snos = AblyScraper._find_goods_snos(response["json"])
+                        for goods_sno in goods_snos:
+                            add(AblyHttpClient.GOODS_URL.format(goods_sno=goods_sno))
+
+                    if len(item_links) >= max_items:
+                        break
+                    if attempt > 0 and len(item_links) == before:
+                        break  # 스크롤해도 새 아이템이 없으면 피드 끝
+
+                    self.scroll_until_settled(settle=0.3, max_steps=1)
+
+        except Exception as e:
+            logger.exception(f"추천아이템 링크 일괄 수집중 - {e}")
+
+        if len(item_links) < max_items and has_unlinked_items:
+            self._harvest_item_links_by_click(
+                max_items, add, item_links, max_scroll_attempts
             )
 
-            len_link_elmes = len(link_elems)
-            if len_link_elmes == 0:
-                logger.info(
-                    "발견된 추천링크가 없음\n" f"타겟링크 {self.target_link} 확인필요"
-                )
-                return None
+        logger.info(f"수집한 추천 아이템 링크 {len(item_links)}개")
+        return item_links[:max_items]
 
-            logger.info(f"발견된 추천 아이템 개수:{len_link_elmes}")
+    def _harvest_item_links_by_click(
+        self, max_items, add, item_links, max_scroll_attempts=10
+    ):
+        """
+        링크가 없는 아이템용: 클릭해서 URL을 기록하고 뒤로가기
+        - 처리한 위치(index)를 기억해 다음 아이템부터 이어서 클릭
+        - 뒤로가기 후 그 위치의 아이템이 아직 없으면 피드를 앞으로 스크롤해서 불러옴
+        """
+        feed_url = self.driver.current_url
+        index = 0
 
-            for i, elem in enumerate(link_elems[:max_scraping_size]):
-                if current_recomended_item_index != i:
-                    continue
+        while len(item_links) < max_items:
+            try:
+                link_elems = self._load_feed_items(index + 1, max_scroll_attempts)
+                if index >= len(link_elems):
+                    break  # 스크롤해도 더 불러올 아이템이 없음
 
-                self.scroll_element_into_view_center(elem)
+                self.scroll_element_into_view_center(link_elems[index])
+                link_elems[index].click()
 
-                elem.click()
+                add(self.wait_url_contains("goods", timeout=30))
 
-                WebDriverWait(self.driver, 30).until(lambda d: "goods" in d.current_url)
+                self.driver.back()
+                self.wait_url_contains(feed_url, timeout=30)
 
-                current_url = self.driver.current_url
+            except Exception as e:
+                logger.exception(f"추천아이템 클릭 수집중 {index}번째 - {e}")
 
-                recomended_item_links.append(current_url)
+            index += 1
 
-            return current_url
-        except Exception as e:
-            logger.exception("에이블리 의류섹션 추천아이템링크들 스크래핑중 - {e}")
-            return []
+    def _load_feed_items(self, min_count, max_scroll_attempts):
+        """피드 아이템이 min_count개 이상 보일 때까지 스크롤 (더 늘지 않으면 중단)"""
+        link_elems = self._find_feed_items()
+
+        for _ in range(max_scroll_attempts):
+            if len(link_elems) >= min_count:
+                break
+
+            before = len(link_elems)
+            self.scroll_until_settled(settle=0.3, max_steps=1)
+            link_elems = self._find_feed_items()
+            if len(link_elems) == before:
+                break
+
+        return link_elems
+
+    def _find_feed_items(self):
+        return self.find_all_element(
+            by=By.XPATH,
+            expression="//p[contains(text(), '구매중')]",
+            element_description="에이블리 의류섹션 추천아이템링크들",
+        )
+
+    @staticmethod
+    def _find_goods_snos(data):
+        """
+        피드 API 응답에서 상품번호를 찾는다
+        (sno와 가격/마켓 정보가 같이 있는 딕셔너리를 상품으로 간주)
+        """
+        goods_snos = []
+        stack = [data]
+
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(reversed(node))
+            elif isinstance(node, dict):
+                if "sno" in node and any(
+                    key in node for key in ("price", "market_sno", "market_name")
+                ):
+                    goods_snos.append(node["sno"])
+                stack.extend(reversed(list(node.values())))
+
+        return goods_snos
 
     def _scrap_market_link(self, recomended_item_url):
         """
-        에이블리의 차단 정책때문에 현재 AblyScraper에서는 필요한 스크랩 구간에서
-        브라우저를 open과 close를 반복하고 있다.
-        이 함수는 market_link를 스크랩 후, 에이블리의 차단이 없으면 market_name을
-        스크랩 한다.
+        에이블리의 차단 정책때문에 예전에는 스크랩 구간마다 브라우저를 open과 close를
+        반복했지만, 지금은 세션 스케줄러가 차단 신호가 있을 때만 브라우저를 교체한다.
+        이 함수는 market_link를 스크랩하고, 차단되면 새 세션으로
+        BLOCK_RETRIES번까지 다시 시도한다.
         """
-        try:
-            with SeniumDravierManager(headless=True) as manager:
-                _driver = manager.driver
+        for _ in range(AblyScraper.BLOCK_RETRIES + 1):
+            try:
+                with self._open_driver() as _driver:
 
-                self.driver = _driver
+                    self.driver = _driver
 
-                self.driver.get(recomended_item_url)
+                    self._get(recomended_item_url)
 
-                market_img_elem = self.find_element(
-                    by=By.CSS_SELECTOR, expression='picture > img[alt="마켓 이미지"]'
-                )
+                    if self.session_scheduler.detect_block(_driver):
+                        continue
 
-                self.scroll_element_into_view_center(target=market_img_elem)
+                    market_img_elem = self.find_element(
+                        by=By.CSS_SELECTOR,
+                        expression='picture > img[alt="마켓 이미지"]',
+                    )
 
-                if market_img_elem == None:
-                    return None
+                    if market_img_elem == None:
+                        self.session_scheduler.report_block("마켓 요소 없음")
+                        continue
 
-                market_img_elem.click()
+                    self.scroll_element_into_view_center(target=market_img_elem)
 
-                WebDriverWait(self.driver, 30).until(
-                    lambda d: "markets" in d.current_url
-                )
-                print(f"찾은 마켓 링크 URL: {self.driver.current_url}")
+                    market_img_elem.click()
 
-                return self.driver.current_url
+                    market_link = self.wait_url_contains("markets", timeout=30)
+                    print(f"찾은 마켓 링크 URL: {market_link}")
 
-        except InvalidArgumentException as e:
-            logger.exception("마켓링크 스크래핑 - {e}\n")
-            logger.exception(f"예외발생 url - {self.driver.current_url}")
-            return None
-        except Exception as e:
-            logger.exception("마켓링크 스크래핑 - {e}\n")
-            logger.exception(f"예외발생 url - {self.driver.current_url}")
-            return None
+                    return market_link
+
+            except InvalidArgumentException as e:
+                logger.exception("마켓링크 스크래핑 - {e}\n")
+                logger.exception(f"예외발생 url - {self.driver.current_url}")
+                return None
+            except Exception as e:
+                logger.exception("마켓링크 스크래핑 - {e}\n")
+                logger.exception(f"예외발생 url - {self.driver.current_url}")
+                return None
+
+        return None
 
     def _scrap_market_infos(self, recomended_item_url):
+        # 스크래퍼 하나로 여러 아이템을 처리하므로 아이템마다 새 딕셔너리
+        self._market_infos = {}
+
         try:
+            # 같은 상품은 페이지를 하나도 열지 않음
+            cached_infos = self.seller_profiles.get("ably_goods", recomended_item_url)
+            if cached_infos != None:
+                self._market_infos.update(cached_infos)
+                return self._market_infos
+
+            # 같은 마켓의 다른 상품은 상품 페이지(HTTP)만 읽고 마켓 정보 페이지는 생략
+            market_id = self._resolve_market_id(recomended_item_url)
+            if self._use_stored_market_infos(recomended_item_url, market_id):
+                return self._market_infos
+
+            # 마켓 ID를 못 찾았으면 상품 페이지를 다시 받지 않고 바로 브라우저로
+            if market_id != None:
+                market_infos = self.http_client.fetch_market_infos(
+                    recomended_item_url, market_id=market_id
+                )
+                if market_infos != None:
+                    self._market_infos.update(market_infos)
+                    self._store_market_infos(recomended_item_url)
+                    return self._market_infos
+
+            logger.info(
+                f"HTTP 마켓정보 조회 실패({self.http_client.last_block_reason}), "
+                f"브라우저로 재시도 - {recomended_item_url}"
+            )
+
             market_link = self._scrap_market_link(recomended_item_url)
 
             if market_link == None:
                 return {}
-            else:
-                self._market_infos["브랜드 페이지"] = market_link
+
+            market_id = SellerProfileStore.ably_market_id(market_link)
+            if self._use_stored_market_infos(recomended_item_url, market_id):
+                return self._market_infos
+
+            self._market_infos["브랜드 페이지"] = market_link
 
             market_info_link = AblyScraper.convert_url(market_link)
 
-            # 에이블리의 차단프로그램 때문에, 브라우저를 닫고 다시 열어서 진행
-            with SeniumDravierManager(headless=True) as manager:
-                _driver = manager.driver
+            # 차단된 세션이었다면 스케줄러가 이미 새 브라우저로 교체해 둠
+            with self._open_driver() as _driver:
 
                 self.driver = _driver
 
-                self.driver.get(market_info_link)
+                self._get(market_info_link)
 
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_all_elements_located((By.TAG_NAME, "p"))
-                )
+                self.waits.wait_present("p", timeout=10)
 
-                company_name = self._scrap_seller_info(keyword="상호:")
-                company_CEO_name = self._scrap_seller_info(keyword="대표자:")
-                self._market_infos["상호 / 대표자"] = (
-                    f"{company_name} / {company_CEO_name}"
-                )
+                self.session_scheduler.detect_block(_driver)
 
-                self._market_infos["브랜드"] = self._scrap_seller_info(
-                    keyword="마켓 정보", cut_after=False
-                )
-                self._market_infos["사업자번호"] = self._scrap_seller_info(
-                    keyword="사업자등록번호:"
-                )
-                self._market_infos["통신판매업신고"] = self._scrap_seller_info(
-                    keyword="통신판매업신고번호:"
-                )
-                self._market_infos["연락처"] = self._scrap_seller_info(
-                    keyword="전화번호:"
-                )
-                self._market_infos["E-mail"] = self._scrap_seller_info(
-                    keyword="이메일:"
-                )
-                self._market_infos["영업소재지"] = self._scrap_seller_info(
-                    keyword="주소:"
+                # 판매자 정보 블록의 <p> 텍스트를 한 번에 읽어 규칙표로 모든 필드를 채움
+                seller_infos = self._extract_seller_infos()
+                if seller_infos["상호"] == None and seller_infos["사업자번호"] == None:
+                    # 아직 렌더링 중일 수 있으므로 요청이 잦아든 뒤 한 번 더
+                    try:
+                        self.waits.wait_network_idle(idle=0.5, timeout=5)
+                    except TimeoutException:
+                        pass
+                    seller_infos = self._extract_seller_infos()
+
+                self._market_infos.update(
+                    AblyHttpClient.to_market_infos(market_link, seller_infos)
                 )
-                self._market_infos["영문명"] = "고객요청으로추출X"
+
+                if seller_infos["상호"] == None and seller_infos["사업자번호"] == None:
+                    self.session_scheduler.report_block("마켓 요소 없음")
+
+            self._store_market_infos(recomended_item_url)
 
         except Exception as e:
             logger.exception(f"마켓 정보 스크래핑중 - {e}")
 
         finally:
-            self.driver.quit()
             return self._market_infos
 
+    def _resolve_market_id(self, recomended_item_url):
+        try:
+            return self.http_client.resolve_market_id(recomended_item_url)
+        except Exception as e:
+            self.http_client.last_block_reason = f"{e}"
+            logger.info(f"마켓 ID 조회 실패 - {recomended_item_url} - {e}")
+            return None
+
+    def _use_stored_market_infos(self, recomended_item_url, market_id):
+        """저장된 마켓 정보가 있으면 _market_infos에 채우고 True"""
+        cached_infos = self.seller_profiles.get("ably_market", market_id)
+        if cached_infos == None:
+            return False
+
+        logger.info(f"저장된 마켓 정보 사용-마켓 {market_id}-{recomended_item_url}")
+        self._market_infos.update(cached_infos)
+        self.seller_profiles.put(cached_infos, ably_goods=recomended_item_url)
+        return True
+
+    def _store_market_infos(self, recomended_item_url):
+        """사업자번호까지 읽힌 마켓 정보만 저장 (실패한 스크랩은 다음에 다시 시도)"""
+        business_number = SellerProfileStore.business_number_key(
+            self._market_infos.get("사업자번호")
+        )
+        if business_number == None:
+            return
+
+        self.seller_profiles.put(
+            self._market_infos,
+            ably_goods=recomended_item_url,
+            ably_market=SellerProfileStore.ably_market_id(
+                self._market_infos.get("브랜드 페이지")
+            ),
+            business_number=business_number,
+        )
+
     def _scrape_prod_codes_on_kipris(self, market_infos: dict):
-        KOR_brand_name = self._market_infos["브랜드"]
+        # AblyThread가 다른 상품의 market_infos로도 호출하므로 인자를 채운다
+        KOR_brand_name = market_infos["브랜드"]
         EN_brand_name = None
 
-        with SeniumDravierManager(headless=True) as manager:
-
-            _driver = manager.driver
+        with self._open_driver(count_page=False) as _driver:
 
             self.kipris_scraper.driver = _driver
 
-            self._market_infos["상품분류코드(한)"] = self.kipris_scraper.scrap(
+            market_infos["상품분류코드(한)"] = self.kipris_scraper.scrap(
                 brand_name=KOR_brand_name,
                 another_lang_brand_name=EN_brand_name,
             )
-            self._market_infos["상품분류코드(영)"] = "고객요청으로추출X"
-
-            return self._market_infos
-
-    def _scrap_seller_info(self, keyword, cut_after=True):
-        try:
-            seller_info_el = self.find_element(
-                by=By.XPATH,
-                expression=f"//p[contains(text(), '{keyword}')]",
-                element_description="브랜드 인포-대표자",
-            )
-
-            if seller_info_el == None:
-                return "스크랩실패"
-
-            seller_info_chunk = seller_info_el.text
-            return AblyScraper.process_reg_expression(
-                flag_word=keyword,
-                chunk_target_word=seller_info_chunk,
-                cut_after=cut_after,
-            )
+            market_infos["상품분류코드(영)"] = "고객요청으로추출X"
 
-        except Exception as e:
-            logger.exception(f"{keyword} 이름 스크래핑 - {e}")
-
-    @staticmethod
-    def process_reg_expression(flag_word, chunk_target_word, cut_after=True):
-        """
-        주어진 flag_word를 기준으로 텍스트를 자릅니다.
-        :param flag_word: 기준 단어
-        :param chunk_target_word: 대상 텍스트
-        :param cut_after: True면 flag_word 뒤 텍스트 추출, False면 flag_word 앞 텍스트 추출
-        :return: 자른 결과 문자열
-        """
-        if cut_after:
-            # flag_word 뒤의 텍스트 추출
-            pattern = rf"{flag_word}\s*(.+)"
-        else:
-            # flag_word 앞의 텍스트 추출
-            pattern = rf"(.+?)\s*{flag_word}"
+            return market_infos
 
-        match = re.search(pattern, chunk_target_word)
-        if match:
-            return match.group(1).strip()
-        return f"정규화작업실패-{chunk_target_word}"
+    def _extract_seller_infos(self):
+        texts = self.extract("p")
+        return SellerInfoExtractor.for_site("ably").extract(texts)
 
     @staticmethod
     def convert_url(url):
@@ -281,7 +454,7 @@ class AblyScraper(SeniumScraper):
             self.driver.switch_to.window(self.driver.window_handles[-1])
 
             # 키프리스 페이지로 이동
-            self.driver.get("http://m.kipris.or.kr/mobile/index.jsp")
+            self._get("http://m.kipris.or.kr/mobile/index.jsp")
 
             time.sleep(1.5)
 
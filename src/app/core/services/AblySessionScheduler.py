@@ -0,0 +1,185 @@
+from collections import deque
+from contextlib import contextmanager
+from app.core.services.AblyHttpClient import AblyHttpClient
+from app.core.services.SeniumDravierManager import SeniumDravierManager
+from app.core.services.SeniumDriverPool import SeniumDriverPool
+from app.core.utils.Logger import Logger
+
+logger = Logger(
+    name="AblySessionScheduler", log_file="AblySessionScheduler.log"
+).get_logger()
+
+
+class AblySessionScheduler:
+    """AblySessionScheduler 클래스
+    - 에이블리 페이지마다 브라우저를 새로 띄우지 않고, 차단 신호가 있을 때까지
+      같은 세션(드라이버)을 재사용
+    - 차단 신호(다른 도메인/로그인으로 리다이렉트, 챌린지 페이지, 마켓 요소 없음)가
+      보고되면 그 세션을 내리고 새 브라우저로 교체(신원 교체)
+    - 세션마다 (사용한 페이지 수, 차단 여부)를 기록하고, 페이지 수별 누적 차단율이
+      TARGET_BLOCK_RATE 이하인 가장 긴 길이를 다음 재사용 한도로 정한다
+      (차단이 없으면 한도를 한 페이지씩 늘려 교체 비용을 줄임)
+
+    사용 예:
+        with scheduler.session() as driver:
+            driver.get(url)
+            if scheduler.detect_block(driver):
+                ...  # report_block()은 detect_block()이 호출
+    """
+
+    INITIAL_LIMIT = 5
+    MIN_LIMIT = 1
+    MAX_LIMIT = 50
+    TARGET_BLOCK_RATE = 0.1
+    # 최근 세션만 보고 조정 -> 오래된 차단 기록이 빠지면 더 긴 세션을 다시 시도
+    HISTORY_SIZE = 20
+
+    def __init__(
+        self,
+        driver_pool: SeniumDriverPool = None,
+        headless=True,
+        initial_limit=None,
+    ):
+        self.driver_pool = driver_pool
+        self.headless = headless
+        self.reuse_limit = initial_limit or AblySessionScheduler.INITIAL_LIMIT
+
+        self._driver = None
+        self._manager = None  # 풀 없이 직접 띄운 브라우저
+        self._pages = 0  # 현재 세션에서 연 에이블리 페이지 수
+        self._block_reason = None
+
+        # 최근에 끝난 세션들의 (페이지 수, 차단 여부)
+        self._history = deque(maxlen=AblySessionScheduler.HISTORY_SIZE)
+
+        self.sessions = 0
+        self.blocked_sessions = 0
+        self.pages = 0
+
+    @contextmanager
+    def session(self, count_page=True):
+        """
+        :param count_page: False면 재사용 한도에 세지 않음 (에이블리가 아닌 페이지)
+        """
+        if self._driver == None:
+            self._open()
+
+        if count_page:
+            self._pages += 1
+
+        try:
+            yield self._driver
+        except Exception:
+            # 드라이버 상태를 알 수 없으므로 기록 없이 교체
+            self._close(record=False)
+            raise
+
+        if self._block_reason != None or self._pages >= self.reuse_limit:
+            self.rotate()
+
+    def detect_block(self, driver):
+        """
+        현재 페이지가 차단으로 보이면 report_block() 후 이유를 반환
+        :return: 차단 이유, 아니면 None
+        """
+        try:
+            block_reason = AblyHttpClient.block_reason(
+                driver.current_url, driver.page_source
+            )
+        except Exception as e:
+            block_reason = f"페이지 확인 실패 {e}"
+
+        if block_reason != None:
+            self.report_block(block_reason)
+        return block_reason
+
+    def report_block(self, reason):
+        """현재 세션이 차단됨 -> session() 블록이 끝나면 교체"""
+        if self._block_reason == None:
+            logger.warning(
+                f"에이블리 차단 감지({reason}) - 세션 {self._pages}페이지째"
+            )
+        self._block_reason = reason
+
+    def rotate(self):
+        self._close(record=True)
+
+    def close(self):
+        self._close(record=True)
+        logger.info(f"에이블리 세션 통계: {self.stats()}")
+
+    def stats(self):
+        sessions = self.sessions
+        return {
+            "sessions": sessions,
+            "blocked": self.blocked_sessions,
+            "block_rate": self.blocked_sessions / sessions if sessions else 0.0,
+            "pages_per_session": self.pages / sessions if sessions else 0.0,
+            "reuse_limit": self.reuse_limit,
+        }
+
+    def _open(self):
+        if self.driver_pool:
+            self._driver = self.driver_pool.checkout()
+        else:
+            self._manager = SeniumDravierManager(headless=self.headless)
+            self._manager.__enter__()
+            self._driver = self._manager.driver
+
+        self._pages = 0
+        self._block_reason = None
+
+    def _close(self, record):
+        if self._driver == None:
+            return
+
+        was_blocked = self._block_reason != None
+        if record and self._pages > 0:
+            self.sessions += 1
+            self.blocked_sessions += was_blocked
+            self.pages += self._pages
+            self._history.append((self._pages, was_blocked))
+            self._tune()
+
+        try:
+            if self.driver_pool:
+                # 차단된 브라우저는 쿠키만 지워서는 같은 신원이므로 내린다
+                self.driver_pool.checkin(self._driver, retire=was_blocked)
+            else:
+                self._manager.__exit__(None, None, None)
+        finally:
+            self._driver = None
+            self._manager = None
+            self._pages = 0
+            self._block_reason = None
+
+    def _tune(self):
+        """페이지 수별 누적 차단율로 재사용 한도 조정"""
+        longest = max(pages for pages, _ in self._history)
+        reached = [0] * (longest + 1)  # k페이지째까지 간 세션 수
+        blocked_at = [0] * (longest + 1)  # k페이지째에서 차단된 세션 수
+
+        for pages, was_blocked in self._history:
+            for k in range(1, pages + 1):
+                reached[k] += 1
+            if was_blocked:
+                blocked_at[pages] += 1
+
+        survival = 1.0
+        limit = 0
+        for k in range(1, longest + 1):
+            survival *= 1 - blocked_at[k] / reached[k]
+            if 1 - survival > AblySessionScheduler.TARGET_BLOCK_RATE:
+                break
+            limit = k
+
+        # 기록된 가장 긴 세션까지 차단이 드물었으면 한 페이지 더 재사용해 본다
+        if limit == longest:
+            limit += 1
+
+        limit = max(AblySessionScheduler.MIN_LIMIT, limit)
+        limit = min(AblySessionScheduler.MAX_LIMIT, limit)
+
+        if limit != self.reuse_limit:
+            logger.info(f"에이블리 세션 재사용 한도 {self.reuse_limit} -> {limit}")
+        self.reuse_limit = limit
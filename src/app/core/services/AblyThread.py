@@ -1,4 +1,3 @@
-import time
 import sys
 import traceback
 import datetime
@@ -7,9 +6,13 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import WebDriverException
 from app.core.services.SeniumDravierManager import SeniumDravierManager
+from app.core.services.SeniumDriverPool import SeniumDriverPool
 from app.core.services.AblyScraper import AblyScraper
 from app.core.services.KiprisScrapper import KiprisScrapper
+from app.core.services.NetworkBlocker import NetworkBlocker
+from app.core.services.SellerInfoExtractor import SellerInfoExtractor
 from app.core.utils.Logger import Logger
+from app.core.utils.ImgMaker import save_imgs
 
 logger = Logger(name="AblyThread", log_file="AblyThread.log").get_logger()
 
@@ -32,34 +35,58 @@ class AblyThread(QtCore.QThread):
         self.current_recomended_item_index = 0
         self.max_scroll_attempts = 0
         self._market_info_list = []
+        self.driver_pool = None
+        self.driver_pool_size = 2
 
     def run(self):
         try:
             # max_scroll_attempts를 max_scraping_size의 비율에 따라 계산
             self.max_scroll_attempts = max(5, ((self.max_scraping_size // 10)) - 2)
 
-            for i in range(self.max_scraping_size):
-                clicked_item_url = self._scrap_recomended_item_link(
-                    max_scroll_attempts=self.max_scroll_attempts
-                )
-                if clicked_item_url == None:
+            # 단계마다 브라우저를 새로 띄우지 않고 미리 띄워둔 드라이버를 돌려 쓴다
+            with SeniumDriverPool(
+                size=self.driver_pool_size, headless=True
+            ) as driver_pool:
+                self.driver_pool = driver_pool
+
+                # 피드는 한 세션에서 한 번만 스크롤하며 아이템 링크를 모두 모은다
+                self.recomended_item_links = self._harvest_recomended_item_links()
+                if len(self.recomended_item_links) == 0:
                     logger.warning("에이블리의류 섹션에서 상품(아이템)링크 스크랩실패")
-                    continue
 
-                market_infos = self.scraper._scrap_market_infos(clicked_item_url)
+                for clicked_item_url in self.recomended_item_links:
+                    market_infos = self.scraper._scrap_market_infos(clicked_item_url)
 
-                if len(market_infos) == 0:
-                    continue
+                    if len(market_infos) == 0:
+                        continue
 
-                market_info_add_prod_codes = self.scraper._scrape_prod_codes_on_kipris(
-                    market_infos=market_infos
-                )
+                    # 키프리스 조회는 조회 서비스에서 도는 동안 다음 상품으로 진행
+                    self.scraper.kipris_scraper.prefetch(
+                        brand_name=market_infos.get("브랜드"),
+                        another_lang_brand_name=None,
+                    )
 
-                self._market_info_list.append(market_info_add_prod_codes)
-                self.update_progress.emit(len(self._market_info_list))
+                    self._market_info_list.append(market_infos)
+                    self.update_progress.emit(len(self._market_info_list))
+
+                for market_infos in self._market_info_list:
+                    self.scraper._scrape_prod_codes_on_kipris(
+                        market_infos=market_infos
+                    )
+
+                if self.scraper:
+                    self.scraper.close()
 
             self.results = self._market_info_list
 
+            # 키프리스 조회중에 모은 등록 상표권 사진 저장
+            if self.scraper and self.scraper.tm_state_r_img_srcs:
+                save_imgs(self.scraper.tm_state_r_img_srcs)
+
+            NetworkBlocker.report()
+            SellerInfoExtractor.report_all()
+            SeniumDravierManager.launch_stats()
+
         except WebDriverException as e:
             error_trace = traceback.format_exc()
             self.error_occurred.emit("웹 드라이버 오류 발생.", error_trace)
@@ -68,35 +95,32 @@ class AblyThread(QtCore.QThread):
             error_trace = traceback.format_exc()
             self.error_occurred.emit("알 수 없는 오류 발생.", error_trace)
 
-    def _scrap_recomended_item_link(self, max_scroll_attempts=5):
-        clicked_item_url = None
+    def _harvest_recomended_item_links(self):
+        """
+        피드를 스크롤하며 추천 아이템 링크를 모은다
+        - 웹 드라이버 오류는 run()에서 error_occurred로 알리도록 그대로 올림
+        """
+        item_links = []
         try:
-            with SeniumDravierManager(headless=True) as manager:
-                driver = manager.driver
-                self.scraper = AblyScraper(driver=driver)
+            with self.driver_pool.lease() as driver:
+                self.scraper = AblyScraper(
+                    driver=driver, driver_pool=self.driver_pool
+                )
 
                 self.scraper.goto(url=self.url)
 
                 self.scraper._go_cloth_section()
 
-                time.sleep(1)
-
-                self.scraper.scroll_page_to_end(
-                    sleep=1, max_attempts=self.max_scroll_attempts
-                )
-
-                clicked_item_url = self.scraper._scrape_recomended_item_links(
-                    max_scraping_size=self.max_scraping_size,
-                    current_recomended_item_index=self.current_recomended_item_index,
-                    recomended_item_links=self.recomended_item_links,
+                item_links = self.scraper.harvest_item_links(
+                    max_items=self.max_scraping_size,
+                    max_scroll_attempts=self.max_scroll_attempts,
                 )
+                logger.info(f"현재 모든 추천 아이템 링크들: {item_links}")
 
-                self.current_recomended_item_index += 1
-                print(f"현재 모든 추천 아이템 링크들: {self.recomended_item_links}")
+        except WebDriverException:
+            raise
 
         except Exception as e:
-            print(e)
+            logger.exception(f"추천 아이템 링크 수집중-예외발생\n" f"Err: {e}\n")
 
-        finally:
-            self.scraper.driver.quit()
-            return clicked_item_url
+        return item_links
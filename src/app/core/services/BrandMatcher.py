@@ -0,0 +1,183 @@
+import re
+import unicodedata
+
+_SEPARATORS = re.compile(r"[\W_]+")
+
+
+def fold(text):
+    """NFKC 정규화 + 대소문자 무시 + 공백/기호 제거 (예: "Nike Korea!" -> "nikekorea")"""
+    if text is None:
+        return ""
+    return _SEPARATORS.sub("", unicodedata.normalize("NFKC", str(text)).casefold())
+
+
+def tokenize(text):
+    """NFKC 정규화 + 대소문자 무시 후 공백/기호로 나눈 토큰들"""
+    if text is None:
+        return []
+    normalized = unicodedata.normalize("NFKC", str(text)).casefold()
+    return [token for token in _SEPARATORS.split(normalized) if token]
+
+
+def bounded_distance(a, b, max_distance):
+    """
+    a, b의 편집거리, max_distance를 넘으면 max_distance + 1
+    (길이 차이로 먼저 거르고, 한 행의 최소값이 한도를 넘으면 바로 중단)
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char_a != char_b),
+                )
+            )
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+
+    return min(previous[-1], max_distance + 1)
+
+
+class BrandMatcher:
+    """BrandMatcher 클래스
+    - 브랜드 하나에 대해 한 번 만들어 두고 상표권 이름들을 비교
+    - 한/영 브랜드명과 그 조합(한영, 영한)을 fold()한 값을 미리 집합으로 계산
+      (공백 유무, 대소문자, 전각/반각, 기호 차이는 같은 이름으로 취급)
+    - 비어있거나 None인 이름은 후보에서 제외 ("None" 문자열과 매칭되지 않음)
+    - max_distance > 0이면 편집거리 max_distance 이내도 매칭,
+      이때 토큰 인덱스로 토큰이 겹치는 후보만 먼저 비교
+    """
+
+    def __init__(self, brand_name, another_lang_brand_name=None, max_distance=0):
+        self.brand_name = brand_name
+        self.another_lang_brand_name = another_lang_brand_name
+        self.max_distance = max_distance
+
+        names = [fold(name) for name in (brand_name, another_lang_brand_name)]
+        names = [name for name in names if name]
+
+        self.variants = set(names)
+        if len(names) == 2:
+            self.variants.add(names[0] + names[1])
+            self.variants.add(names[1] + names[0])
+
+        # 토큰 -> 그 토큰을 포함하는 variant들
+        self._token_index = {}
+        for name in (brand_name, another_lang_brand_name):
+            for token in tokenize(name):
+                self._token_index.setdefault(token, set()).update(
+                    variant for variant in self.variants if token in variant
+                )
+
+        self._cache = {}  # fold한 이름 -> 매칭 결과
+
+    def matches(self, name):
+        key = fold(name)
+        if not key:
+            return False
+
+        result = self._cache.get(key)
+        if result is None:
+            result = self._match_key(key, name)
+            self._cache[key] = result
+        return result
+
+    def match_all(self, names):
+        """이름 리스트를 한 번에 비교, :return: 같은 순서의 bool 리스트"""
+        return [self.matches(name) for name in names]
+
+    def filter_rows(self, rows, key="name"):
+        """매칭되는 행만 반환 (rows: dict 리스트)"""
+        return [row for row in rows if self.matches(row.get(key))]
+
+    def _match_key(self, key, name):
+        if key in self.variants:
+            return True
+
+        if self.max_distance <= 0:
+            return False
+
+        candidates = set()
+        for token in tokenize(name):
+            candidates |= self._token_index.get(token, set())
+        if not candidates:
+            # 한 단어짜리 오타는 토큰이 겹치지 않으므로 전체 variant와 비교
+            candidates = self.variants
+
+        return any(
+            bounded_distance(key, variant, self.max_distance) <= self.max_distance
+            for variant in candidates
+        )
+
+
+class BrandIndex:
+    """BrandIndex 클래스
+    - 여러 사이트에서 모은 브랜드명을 같은 브랜드끼리 묶기 위한 인덱스
+    - fold()한 이름으로 바로 찾고, max_distance > 0이면 토큰이 겹치는 브랜드만
+      편집거리로 비교
+    """
+
+    def __init__(self, max_distance=0):
+        self.max_distance = max_distance
+        self._by_key = {}  # fold한 이름 -> 브랜드 id
+        self._token_index = {}  # 토큰 -> 브랜드 id 집합
+        self._keys_by_id = {}  # 브랜드 id -> fold한 이름들
+        self._next_id = 0
+
+    def add(self, brand_name, another_lang_brand_name=None):
+        """이미 있는 브랜드면 그 id, 아니면 새 id를 반환 (이름이 비어있으면 None)"""
+        brand_id = self.find(brand_name)
+        if brand_id is None:
+            brand_id = self.find(another_lang_brand_name)
+        if brand_id is None:
+            if not fold(brand_name) and not fold(another_lang_brand_name):
+                return None
+            brand_id = self._next_id
+            self._next_id += 1
+
+        for name in (brand_name, another_lang_brand_name):
+            key = fold(name)
+            if not key:
+                continue
+            self._by_key.setdefault(key, brand_id)
+            self._keys_by_id.setdefault(brand_id, set()).add(key)
+            for token in tokenize(name):
+                self._token_index.setdefault(token, set()).add(brand_id)
+
+        return brand_id
+
+    def find(self, name):
+        key = fold(name)
+        if not key:
+            return None
+
+        brand_id = self._by_key.get(key)
+        if brand_id is not None or self.max_distance <= 0:
+            return brand_id
+
+        candidates = set()
+        for token in tokenize(name):
+            candidates |= self._token_index.get(token, set())
+
+        for candidate in sorted(candidates):
+            if any(
+                bounded_distance(key, other, self.max_distance) <= self.max_distance
+                for other in self._keys_by_id[candidate]
+            ):
+                return candidate
+
+        return None
+
+    def dedupe(self, brands):
+        """
+        :param brands: [(브랜드명, 다른언어 브랜드명), ...]
+        :return: 같은 순서의 브랜드 id 리스트
+        """
+        return [self.add(name, another) for name, another in brands]
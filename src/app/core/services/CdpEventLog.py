@@ -0,0 +1,78 @@
+import json
+import threading
+from collections import deque
+from app.core.utils.Logger import Logger
+
+
+class CdpEventLog:
+    """CdpEventLog 클래스
+    - 드라이버의 Chrome performance 로그(CDP 이벤트)를 드라이버당 하나의 버퍼에 모은다
+    - performance 로그는 읽으면 사라지므로, 여러 소비자(NetworkCapture 등)는
+      커서(cursor)를 들고 같은 버퍼를 나눠 읽는다
+    """
+
+    logger = Logger(name="CdpEventLog", log_file="CdpEventLog.log").get_logger()
+
+    MAX_EVENTS = 5000  # 드라이버당 보관할 최대 이벤트 수
+
+    _logs = {}  # id(driver) -> CdpEventLog
+    _logs_lock = threading.Lock()
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._events = deque(maxlen=CdpEventLog.MAX_EVENTS)
+        self._first_index = 0  # _events[0]의 절대 인덱스
+        self._lock = threading.Lock()
+
+    @classmethod
+    def of(cls, driver):
+        """driver의 이벤트 로그 (SupervisedDriver면 현재 원본 드라이버 기준)"""
+        driver = getattr(driver, "wrapped_driver", driver)
+        with cls._logs_lock:
+            event_log = cls._logs.get(id(driver))
+            if event_log is None or event_log.driver is not driver:
+                event_log = cls(driver)
+                cls._logs[id(driver)] = event_log
+            return event_log
+
+    @classmethod
+    def forget(cls, driver):
+        driver = getattr(driver, "wrapped_driver", driver)
+        with cls._logs_lock:
+            cls._logs.pop(id(driver), None)
+
+    def pull(self):
+        """chromedriver에 쌓인 performance 로그를 버퍼로 가져온다"""
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception as e:
+            self.logger.debug(f"performance 로그 읽기 실패: {e}")
+            return
+
+        with self._lock:
+            for entry in entries:
+                try:
+                    message = json.loads(entry["message"])["message"]
+                except (KeyError, ValueError):
+                    continue
+
+                if len(self._events) == self._events.maxlen:
+                    self._first_index += 1
+                self._events.append(message)
+
+    def cursor(self):
+        """지금까지의 이벤트를 건너뛰는 커서"""
+        self.pull()
+        with self._lock:
+            return self._first_index + len(self._events)
+
+    def read(self, cursor):
+        """
+        cursor 이후의 새 이벤트와 다음 커서를 반환
+        :return: ([{"method", "params"}, ...], next_cursor)
+        """
+        self.pull()
+        with self._lock:
+            start = max(cursor - self._first_index, 0)
+            events = list(self._events)[start:]
+            return events, self._first_index + len(self._events)
@@ -8,6 +8,9 @@ from selenium.webdriver.common.by import By
 from selenium.common.exceptions import WebDriverException
 from app.core.services.SeniumDravierManager import SeniumDravierManager
 from app.core.services.MusinsaScrapper import MusinsaScrapper
+from app.core.services.NetworkBlocker import NetworkBlocker
+from app.core.services.SellerInfoExtractor import SellerInfoExtractor
+from app.core.utils.ImgMaker import save_imgs
 
 
 class CrawlerThread(QtCore.QThread):
@@ -29,6 +32,8 @@ class CrawlerThread(QtCore.QThread):
             # max_scroll_attempts를 max_scraping_size의 비율에 따라 계산
             max_scroll_attempts = max(5, self.max_scraping_size // 10)
 
+            SeniumDravierManager.reap_orphans()
+
             with SeniumDravierManager(headless=True) as manager:
                 driver = manager.driver
                 self.scraper = MusinsaScrapper(driver=driver)
@@ -49,12 +54,29 @@ class CrawlerThread(QtCore.QThread):
 
                 brands_info_list = []
                 for i, link in enumerate(event_links):
-                    brand_info = self.scraper.scrap(link=link)
+                    # 키프리스 조회는 조회 서비스에서 도는 동안 다음 브랜드로 진행
+                    brand_info = self.scraper.scrap(link=link, defer_kipris=True)
                     brands_info_list.append(brand_info)
                     self.update_progress.emit(len(brands_info_list))
 
+                    # 요청 횟수/메모리 한도를 넘었으면 브라우저 교체
+                    recycled_driver = manager.recycle_if_needed()
+                    if recycled_driver:
+                        self.scraper.driver = recycled_driver
+                        self.scraper.kipris_scraper.driver = self.scraper.driver
+
+                self.scraper.resolve_deferred_kipris()
+
                 self.results = brands_info_list
 
+            # 키프리스 조회중에 모은 등록 상표권 사진 저장
+            if self.scraper.tm_state_r_img_srcs:
+                save_imgs(self.scraper.tm_state_r_img_srcs)
+
+            NetworkBlocker.report()
+            SellerInfoExtractor.report_all()
+            SeniumDravierManager.launch_stats()
+
         except WebDriverException as e:
             error_trace = traceback.format_exc()
             self.error_occurred.emit("웹 드라이버 오류 발생.", error_trace)
@@ -0,0 +1,208 @@
+import re
+import requests
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from app.core.utils.Logger import Logger
+
+logger = Logger(name="KiprisHttpClient", log_file="KiprisHttpClient.log").get_logger()
+
+
+class KiprisHttpClient:
+    """KiprisHttpClient 클래스
+    - 브라우저 없이 requests 세션으로 키프리스 모바일 검색을 요청하고
+      상표 결과 행을 KiprisScrapper._TM_ROW_SCHEMA 와 같은 형태로 파싱
+    - 검색 폼(action, hidden input)과 상표 탭(button#TM)의 요청 주소는
+      index 페이지/검색 결과 HTML에서 읽어서 브라우저와 같은 요청을 보낸다
+    - base_url을 바꾸면 로컬 대역 서버로도 동작
+    - rate_limiter(acquire())를 주면 모든 요청 전에 호출해서 요청 속도를 제한
+    """
+
+    INDEX_PATH = "/mobile/index.jsp"
+    NO_RESULT_TEXT = "검색결과가 없습니다"
+    ROW_SELECTOR = "#tmResult .row .content-data-text"
+
+    USER_AGENT = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/111.0.0.0 Safari/537.36"
+    )
+
+    def __init__(self, base_url="http://m.kipris.or.kr", timeout=15, rate_limiter=None):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": KiprisHttpClient.USER_AGENT})
+
+        retry = Retry(
+            total=2, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504)
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_maxsize=8)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._search_form = None  # (method, action, hidden inputs)
+
+    def search_tm_rows(self, brand_name):
+        """
+        :return: [{"name", "state", "prod_codes"}, ...]
+                 검색결과가 없으면 [], 요청 실패/알 수 없는 응답이면 None
+        """
+        try:
+            search_form = self._get_search_form()
+            if search_form == None:
+                return None
+
+            method, action, fields = search_form
+            data = dict(fields)
+            data["searchQuery"] = brand_name
+
+            html = self._request(method, action, data)
+            tm_count = self.parse_tm_count(html)
+
+            tm_rows = self.parse_tm_rows(html, page_url=action)
+            if tm_rows:
+                return self._complete_or_none(brand_name, tm_rows, tm_count)
+
+            # 결과 페이지에 상표 목록이 없으면 상표 탭 요청을 직접 보낸다
+            tm_tab_url = self._find_tm_tab_url(html, action)
+            if tm_tab_url:
+                html = self._request(method, tm_tab_url, data)
+                tm_count = self.parse_tm_count(html) or tm_count
+                tm_rows = self.parse_tm_rows(html, page_url=tm_tab_url)
+                if tm_rows:
+                    return self._complete_or_none(brand_name, tm_rows, tm_count)
+
+            if self.is_no_result(html):
+                return []
+
+            logger.warning(
+                f"키프리스 HTTP 응답에서 결과를 해석할 수 없음 // 브랜드-{brand_name}"
+            )
+            return None
+
+        except Exception as e:
+            logger.exception(
+                f"키프리스 HTTP 조회중 예외발생 // 브랜드-{brand_name} - {e}"
+            )
+            return None
+
+    @classmethod
+    def parse_tm_rows(cls, html, page_url=None):
+        soup = BeautifulSoup(html, "html.parser")
+        tm_rows = []
+
+        for row in soup.select(cls.ROW_SELECTOR):
+            img = row.select_one("img")
+            img_src = img.get("src") if img else None
+            if img_src and page_url:
+                img_src = urljoin(page_url, img_src)
+
+            tm_rows.append(
+                {
+                    "name": cls._select_text(row, "a"),
+                    "state": cls._select_text(row, "span.state"),
+                    "prod_codes": cls._select_text(
+                        row, "ul > li:nth-child(2) > span"
+                    ),
+                    "application_number": cls._select_text(
+                        row, "ul > li:nth-child(1) > span"
+                    ),
+                    "img_src": img_src,
+                }
+            )
+
+        return tm_rows
+
+    @classmethod
+    def parse_tm_count(cls, html):
+        """상표 탭(button#TM span)에 표시된 결과 개수, 없으면 None"""
+        soup = BeautifulSoup(html, "html.parser")
+        tm_count = soup.select_one("button#TM span")
+        if tm_count == None:
+            return None
+
+        digits = re.sub(r"[^0-9]", "", tm_count.get_text())
+        return int(digits) if digits else None
+
+    @classmethod
+    def is_no_result(cls, html):
+        if cls.NO_RESULT_TEXT in html:
+            return True
+
+        soup = BeautifulSoup(html, "html.parser")
+        tm_count = soup.select_one("button#TM span")
+        return tm_count != None and tm_count.get_text(strip=True) == "0"
+
+    def _complete_or_none(self, brand_name, tm_rows, tm_count):
+        """
+        첫 페이지 HTML에 전체 결과가 다 들어있지 않으면(스크롤로 더 불러오는 경우)
+        일부 결과가 캐시되지 않도록 None을 돌려 브라우저 조회로 넘긴다
+        """
+        if tm_count and len(tm_rows) < tm_count:
+            logger.info(
+                f"키프리스 HTTP 결과 {tm_count}개 중 {len(tm_rows)}개만 포함 "
+                f"- 브라우저 조회 필요 // 브랜드-{brand_name}"
+            )
+            return None
+        return tm_rows
+
+    def _get_search_form(self):
+        if self._search_form != None:
+            return self._search_form
+
+        index_url = f"{self.base_url}{KiprisHttpClient.INDEX_PATH}"
+        html = self._request("get", index_url)
+        soup = BeautifulSoup(html, "html.parser")
+
+        search_input = soup.select_one("input[name='searchQuery']")
+        form = search_input.find_parent("form") if search_input else None
+        if form == None:
+            logger.error("키프리스 index 페이지에서 검색 폼을 찾지 못함")
+            return None
+
+        fields = {
+            field.get("name"): field.get("value", "")
+            for field in form.select("input[name]")
+            if field.get("type", "text").lower() in ("hidden", "text", "search")
+        }
+        action = urljoin(index_url, form.get("action") or index_url)
+        method = (form.get("method") or "get").lower()
+
+        self._search_form = (method, action, fields)
+        return self._search_form
+
+    def _find_tm_tab_url(self, html, page_url):
+        soup = BeautifulSoup(html, "html.parser")
+        tm_tab = soup.select_one("button#TM")
+        if tm_tab == None:
+            return None
+
+        target = tm_tab.get("data-url") or tm_tab.get("data-href")
+        if not target:
+            match = re.search(
+                r"['\"]([^'\"]+\.(?:do|jsp)[^'\"]*)['\"]", tm_tab.get("onclick", "")
+            )
+            target = match.group(1) if match else None
+
+        return urljoin(page_url, target) if target else None
+
+    def _request(self, method, url, data=None):
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+        if method == "post":
+            response = self.session.post(url, data=data, timeout=self.timeout)
+        else:
+            response = self.session.get(url, params=data, timeout=self.timeout)
+        response.raise_for_status()
+        # charset이 없는 응답은 requests가 ISO-8859-1로 가정해서 한글이 깨짐
+        if not response.encoding or response.encoding.lower() == "iso-8859-1":
+            response.encoding = response.apparent_encoding
+        return response.text
+
+    @staticmethod
+    def _select_text(parent, selector):
+        el = parent.select_one(selector)
+        return el.get_text(strip=True) if el else None
@@ -0,0 +1,170 @@
+import time
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from app.core.services.KiprisHttpClient import KiprisHttpClient
+from app.core.services.TrademarkCache import TrademarkCache
+from app.core.utils.Logger import Logger
+
+logger = Logger(
+    name="KiprisLookupService", log_file="KiprisLookupService.log"
+).get_logger()
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate=2.0, burst=4):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰이 생길 때까지 기다렸다가 하나 사용"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class KiprisLookupService:
+    """KiprisLookupService 클래스
+    - 스크래퍼와 분리된 키프리스 조회 서비스 (HTTP 전용, 브라우저 재시도는 호출자 몫)
+    - KiprisHttpClient(세션) pool_size개를 풀로 두고 같은 수의 작업 스레드로 조회
+    - 같은 검색어(정규화 기준)가 진행중이면 새 요청 없이 같은 Future를 돌려줌
+    - 모든 HTTP 요청은 TokenBucket으로 호스트 요청 속도를 제한
+    - 성공한 결과(결과없음 포함)는 tm_cache에 저장해서 Future가 끝난 뒤에도 재사용
+
+    사용 예:
+        service = KiprisLookupService.shared()
+        future = service.submit("나이키")  # 다음 브랜드로 진행
+        ...
+        tm_rows = future.result()  # 결과 행 리스트 / [] / None(통신오류)
+    """
+
+    POOL_SIZE = 3
+    RATE = 2.0  # 초당 요청 수
+    BURST = 4
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        pool_size=None,
+        rate=None,
+        burst=None,
+        tm_cache: TrademarkCache = None,
+        base_url="http://m.kipris.or.kr",
+    ):
+        pool_size = pool_size or KiprisLookupService.POOL_SIZE
+
+        self.tm_cache = tm_cache
+        self.rate_limiter = TokenBucket(
+            rate=rate or KiprisLookupService.RATE,
+            burst=burst or KiprisLookupService.BURST,
+        )
+
+        self._clients = queue.Queue()
+        for _ in range(pool_size):
+            self._clients.put(
+                KiprisHttpClient(base_url=base_url, rate_limiter=self.rate_limiter)
+            )
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix="kipris-lookup"
+        )
+        self._inflight = {}  # 정규화한 검색어 -> Future
+        self._lock = threading.RLock()
+
+        self.submitted = 0
+        self.coalesced = 0
+
+    @classmethod
+    def shared(cls):
+        """프로세스에서 같이 쓰는 서비스 (스크래퍼들이 같은 풀/캐시를 공유)"""
+        with cls._shared_lock:
+            if cls._shared == None:
+                cls._shared = cls(tm_cache=TrademarkCache())
+            return cls._shared
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def submit(self, brand_name):
+        """:return: Future -> 결과 행 리스트 / [] / None(통신오류)"""
+        query = TrademarkCache.normalize(brand_name)
+
+        if self.tm_cache != None:
+            tm_rows = self.tm_cache.get(brand_name)
+            if tm_rows != None:
+                return KiprisLookupService._done_future(tm_rows)
+
+        with self._lock:
+            future = self._inflight.get(query)
+            if future != None:
+                self.coalesced += 1
+                return future
+
+            self.submitted += 1
+            future = self._executor.submit(self._lookup, brand_name)
+            self._inflight[query] = future
+            future.add_done_callback(
+                lambda done, query=query: self._on_done(query, brand_name, done)
+            )
+            return future
+
+    def lookup(self, brand_name, timeout=None):
+        return self.submit(brand_name).result(timeout=timeout)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "submitted": self.submitted,
+                "coalesced": self.coalesced,
+                "inflight": len(self._inflight),
+            }
+
+    def close(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        logger.info(f"키프리스 조회 서비스 종료: {self.stats()}")
+
+    def _lookup(self, brand_name):
+        client = self._clients.get()
+        try:
+            return client.search_tm_rows(brand_name)
+        finally:
+            self._clients.put(client)
+
+    def _on_done(self, query, brand_name, future):
+        with self._lock:
+            if self._inflight.get(query) is future:
+                del self._inflight[query]
+
+        if future.cancelled() or future.exception() != None:
+            return
+
+        if self.tm_cache != None:
+            self.tm_cache.put(brand_name, future.result())  # None은 저장 안 함
+
+    @staticmethod
+    def _done_future(result):
+        future = Future()
+        future.set_result(result)
+        return future
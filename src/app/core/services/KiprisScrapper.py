@@ -1,4 +1,4 @@
-import time
+import re
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import (
     ElementClickInterceptedException,
@@ -6,10 +6,12 @@ from selenium.common.exceptions import (
     StaleElementReferenceException,
     TimeoutException,
 )
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from app.core.services.SeniumDravierManager import SeniumDravierManager
 from app.core.services.SeniumScraper import SeniumScraper
+from app.core.services.KiprisLookupService import KiprisLookupService
+from app.core.services.TrademarkCache import TrademarkCache
+from app.core.services.BrandMatcher import BrandMatcher
+from app.core.services.TrademarkIndex import TrademarkIndex
 from app.core.utils import Logger, FileMaker
 
 logger = Logger(name="KiprisScrapper", log_file="KiprisScrapper.log")
@@ -20,11 +22,43 @@ class KiprisScrapper(SeniumScraper):
     _RESULT_EXECTION_TM = "통신오류"
     _TM_STATE_R = "등록"
 
-    def __init__(self, driver: SeniumDravierManager):
+    BLOCK_PROFILE = "kipris"
+
+    MATCH_MAX_DISTANCE = 0  # 상표권 이름 매칭 허용 편집거리 (0이면 정확히 일치)
+
+    # 상표권 결과 행을 한 번의 execute_script로 읽는 스키마
+    _TM_ROW_SCHEMA = {
+        "selector": "#tmResult .row .content-data-text",
+        "fields": {
+            "name": "a",
+            "state": "span.state",
+            "prod_codes": "ul > li:nth-child(2) > span",
+            "application_number": "ul > li:nth-child(1) > span",
+            "img_src": {"selector": "img", "attr": "src"},
+        },
+    }
+
+    def __init__(
+        self,
+        driver: SeniumDravierManager,
+        lookup_service: KiprisLookupService = None,
+        tm_cache: TrademarkCache = None,
+        tm_index: TrademarkIndex = None,
+    ):
         super().__init__(driver)
+        self.tm_index = tm_index  # 대량 데이터 인덱스, 있으면 가장 먼저 확인
+        self.lookup_service = lookup_service  # 브라우저 없이 먼저 조회할 HTTP 서비스
+        self.tm_cache = tm_cache  # 검색어별 결과 행 디스크 캐시
         self._base_url = None
         self._target_brand_name = None
         self._another_lang_brand_name = None
+        self._tm_count = None  # 상표 탭에 표시된 결과 개수
+        self._tm_rows_complete = True  # 마지막 조회가 상표 탭 개수만큼 다 읽혔는지
+
+        self.tm_state_r_num_list = []  # 등록된상표권출원번호 리스트
+        self.tm_state_r_img_srcs: dict[str, dict[str, str]] = (
+            {}
+        )  # 등록된상표권출원 사진들
 
     def scrap(
         self,
@@ -35,13 +69,226 @@ class KiprisScrapper(SeniumScraper):
         self._base_url = base_url
         self._target_brand_name = brand_name
         self._another_lang_brand_name = another_lang_brand_name
-        tm_prod_codes_by_brand_name = {}
-        tm_prod_codes = []
+
+        tm_rows = self._resolve_offline(brand_name, another_lang_brand_name)
+        if tm_rows != None:
+            return self._tm_rows_to_result(tm_rows)
+
+        tm_rows = self._search_tm_rows_cached(brand_name=brand_name)
+
+        if tm_rows == None:
+            return KiprisScrapper._RESULT_EXECTION_TM
+
+        return self._tm_rows_to_result(tm_rows)
+
+    def scrap_both_langs(
+        self,
+        brand_name,
+        another_lang_brand_name,
+        another_lang_is_slug=False,
+        base_url="http://m.kipris.or.kr/mobile/index.jsp",
+    ):
+        """
+        한/영 브랜드명 검색 결과를 합친 한 결과 행 집합으로
+        상품분류코드(한), 상품분류코드(영) 값을 같이 구한다.
+        - 두 검색어는 조회 서비스로 동시에 조회 (브라우저 재시도는 순서대로)
+        - another_lang_is_slug: 영문명이 URL에서 뽑은 값이면 첫 검색 결과에
+          이미 포함됐을 때 두 번째 검색을 생략
+        :return: (한 결과, 영 결과)
+        """
+        self._base_url = base_url
+
+        tm_rows = self._resolve_offline(brand_name, another_lang_brand_name)
+        if tm_rows != None:
+            return self._tm_rows_to_results_both_langs(
+                tm_rows, brand_name, another_lang_brand_name
+            )
+
+        queries = self._plan_queries(brand_name, another_lang_brand_name)
+
+        if another_lang_is_slug and len(queries) == 2:
+            first_rows = self._search_tm_rows_cached(brand_name=queries[0])
+            results = [first_rows]
+
+            if first_rows and self._tm_rows_cover(first_rows, queries[1]):
+                logger.get_logger().info(
+                    f"영문명 검색 생략 - 첫 검색에 포함됨 // 브랜드-{queries[1]}"
+                )
+            else:
+                results.append(self._search_tm_rows_cached(brand_name=queries[1]))
+        else:
+            results = self._search_tm_rows_concurrently(queries)
+
+        found = [tm_rows for tm_rows in results if tm_rows != None]
+        if results and len(found) == 0:
+            return (
+                KiprisScrapper._RESULT_EXECTION_TM,
+                KiprisScrapper._RESULT_EXECTION_TM,
+            )
+
+        tm_rows = KiprisScrapper._dedupe_tm_rows(found)
+
+        return self._tm_rows_to_results_both_langs(
+            tm_rows, brand_name, another_lang_brand_name
+        )
+
+    def _tm_rows_to_results_both_langs(
+        self, tm_rows, brand_name, another_lang_brand_name
+    ):
+        self._target_brand_name = brand_name
+        self._another_lang_brand_name = another_lang_brand_name
+        result = self._tm_rows_to_result(tm_rows)
+
+        self._target_brand_name = another_lang_brand_name
+        self._another_lang_brand_name = brand_name
+        result_another_lang = self._tm_rows_to_result(tm_rows)
+
+        return result, result_another_lang
+
+    def _resolve_offline(self, brand_name, another_lang_brand_name):
+        """대량 데이터 인덱스에서 찾으면 결과 행, 없거나 오래된 데이터면 None"""
+        if self.tm_index == None:
+            return None
+
+        tm_rows = self.tm_index.resolve(brand_name, another_lang_brand_name)
+        if tm_rows != None:
+            logger.get_logger().info(f"상표권 인덱스 사용 // 브랜드-{brand_name}")
+        return tm_rows
+
+    def prefetch(self, brand_name, another_lang_brand_name, another_lang_is_slug=False):
+        """
+        scrap_both_langs가 쓸 검색을 미리 조회 서비스에 넣어두고 바로 반환
+        (조회가 도는 동안 호출자는 다음 브랜드로 진행)
+        """
+        if self.lookup_service == None:
+            return []
+
+        if self._resolve_offline(brand_name, another_lang_brand_name) != None:
+            return []
+
+        queries = self._plan_queries(brand_name, another_lang_brand_name)
+        if another_lang_is_slug:
+            queries = queries[:1]  # 영문 slug 검색은 첫 결과를 보고 결정
+
+        return [self.lookup_service.submit(query) for query in queries]
+
+    def _plan_queries(self, brand_name, another_lang_brand_name):
+        queries = []
+        seen = set()
+        for name in (brand_name, another_lang_brand_name):
+            normalized = TrademarkCache.normalize(name)
+            if normalized and normalized not in seen:
+                seen.add(normalized)
+                queries.append(name)
+        return queries
+
+    def _search_tm_rows_concurrently(self, queries):
+        """캐시 -> 조회 서비스에 동시 요청 -> 실패한 검색어만 브라우저로 순서대로 재시도"""
+        if self.lookup_service == None or len(queries) < 2:
+            return [self._search_tm_rows_cached(brand_name=q) for q in queries]
+
+        results = [self._cache_get(q) for q in queries]
+        missing = [i for i, tm_rows in enumerate(results) if tm_rows == None]
+
+        futures = {i: self.lookup_service.submit(queries[i]) for i in missing}
+        for i, future in futures.items():
+            results[i] = future.result()
+
+        for i in missing:
+            self._tm_rows_complete = True
+            if results[i] == None and self.driver != None:
+                results[i] = self._search_tm_rows_in_browser(brand_name=queries[i])
+            self._cache_put_if_complete(queries[i], results[i])
+
+        return results
+
+    @staticmethod
+    def _tm_rows_cover(tm_rows, query):
+        """결과 행의 상표권 이름 중에 query(공백/기호 제외)가 들어간 이름이 있는지"""
+
+        def compact(text):
+            return re.sub(r"[\W_]+", "", TrademarkCache.normalize(text))
+
+        compact_query = compact(query)
+        if not compact_query:
+            return False
+
+        return any(compact_query in compact(tm_row.get("name")) for tm_row in tm_rows)
+
+    @staticmethod
+    def _dedupe_tm_rows(tm_rows_list):
+        tm_rows = []
+        seen = set()
+
+        for rows in tm_rows_list:
+            for tm_row in rows:
+                key = (
+                    tm_row.get("name"),
+                    tm_row.get("state"),
+                    tm_row.get("prod_codes"),
+                )
+                if key in seen:
+                    continue
+                seen.add(key)
+                tm_rows.append(tm_row)
+
+        return tm_rows
+
+    def _search_tm_rows_cached(self, brand_name):
+        tm_rows = self._cache_get(brand_name)
+        if tm_rows != None:
+            return tm_rows
+
+        self._tm_rows_complete = True
+        tm_rows = self._search_tm_rows(brand_name=brand_name)
+        self._cache_put_if_complete(brand_name, tm_rows)
+        return tm_rows
+
+    def _cache_get(self, brand_name):
+        if self.tm_cache == None:
+            return None
+
+        tm_rows = self.tm_cache.get(brand_name)
+        if tm_rows != None:
+            logger.get_logger().info(f"상표권 캐시 사용 // 브랜드-{brand_name}")
+        return tm_rows
+
+    def _cache_put_if_complete(self, brand_name, tm_rows):
+        # 일부만 로드된 결과는 이번 판정에만 쓰고 캐시에 남기지 않음
+        if self._tm_rows_complete:
+            self._cache_put(brand_name, tm_rows)
+
+    def _cache_put(self, brand_name, tm_rows):
+        if self.tm_cache != None:
+            self.tm_cache.put(brand_name, tm_rows)  # 통신오류(None)는 저장 안 함
+
+    def _search_tm_rows(self, brand_name):
+        """
+        브랜드명으로 키프리스 상표권 결과 행들을 가져온다.
+        - lookup_service가 있으면 브라우저 없이 먼저 조회하고, 실패 시 브라우저로 재시도
+        :return: [{"name", "state", "prod_codes"}, ...], 결과없음이면 [], 통신오류면 None
+        """
+        if self.lookup_service:
+            tm_rows = self.lookup_service.lookup(brand_name)
+            if tm_rows != None:
+                return tm_rows
+
+            if self.driver == None:
+                return None
+
+            logger.get_logger().info(
+                f"키프리스 HTTP 조회 실패, 브라우저로 재시도 // 브랜드-{brand_name}"
+            )
+
+        return self._search_tm_rows_in_browser(brand_name=brand_name)
+
+    def _search_tm_rows_in_browser(self, brand_name):
+        self._tm_count = None
 
         self._goto_kipris_searchbox(brand_name=brand_name, timeout=30)
 
         self._request_brand_name_in_searchbox(
-            brand_name=self._target_brand_name, timeout_for_submit_form=30
+            brand_name=brand_name, timeout_for_submit_form=30
         )
 
         # self.check_page_loading_with_wait(
@@ -55,7 +302,7 @@ class KiprisScrapper(SeniumScraper):
         )
         if did_exist_loading_bar == None:
             self._close_kipris()
-            return KiprisScrapper._RESULT_EXECTION_TM
+            return None
 
         tm_tab = self._click_tm_tab(sleep_for_loading=2)
 
@@ -63,14 +310,14 @@ class KiprisScrapper(SeniumScraper):
 
         if have_tm_result == False:
             self._close_kipris()
-            return KiprisScrapper._RESULT_NO_MATCH_TM
+            return []
 
         elif have_tm_result == None:
             have_tm_result_in_html = self._check_tm_result_in_html()
 
             if have_tm_result_in_html == False:
                 self._close_kipris()
-                return KiprisScrapper._RESULT_NO_MATCH_TM
+                return []
 
             elif have_tm_result_in_html == None:
                 logger.get_logger().exception(
@@ -84,48 +331,69 @@ class KiprisScrapper(SeniumScraper):
 
         if len(tm_elems) == 0:
             self._close_kipris()
-            return KiprisScrapper._RESULT_NO_MATCH_TM
+            return []
 
-        self.scroll_page_to_end(
-            max_attempts=100,
-            sleep=0.5,
+        # 상표 탭 개수만큼 행이 로드되면 안정화 대기 없이 바로 중지
+        loaded_count = self.scroll_until_settled(
+            item_selector=KiprisScrapper._TM_ROW_SCHEMA["selector"],
+            target_count=self._tm_count,
+            timeout=50,
         )
+        if self._tm_count and loaded_count < self._tm_count:
+            self._tm_rows_complete = False
+            logger.get_logger().warning(
+                f"상표권 결과 {self._tm_count}개 중 {loaded_count}개만 로드됨 "
+                f"// 브랜드-{brand_name}"
+            )
 
-        for tm_el in tm_elems:
-
-            tm_name_el = self._find_tm_name_el(tm_el=tm_el)
-
-            if tm_name_el == None:
-                continue
+        tm_rows = self.extract(KiprisScrapper._TM_ROW_SCHEMA)
+        if tm_rows == None:
+            # 일괄 추출 스크립트가 실패하면 행마다 대기 없이(probe) 읽는다
+            tm_rows = self._probe_tm_rows()
 
-            tm_name = tm_name_el.text
-            if self._is_matching_brand_name(tm_name=tm_name) == False:
-                continue
+        self._close_kipris()
 
-            tm_state_el = self._check_tm_state_el(tm_el=tm_el)
+        return tm_rows
 
-            if tm_state_el == None:
-                continue
+    def _probe_tm_rows(self):
+        """
+        extract()가 실패했을 때 결과 행을 읽는 대체 경로
+        - 필드마다 probe()로 대기 없이 확인 (상태 span 등은 없는 행도 있음)
+        :return: 결과 행 리스트, 행 목록을 못 읽으면 None (결과없음으로 캐시되지 않게)
+        """
+        schema = KiprisScrapper._TM_ROW_SCHEMA
 
-            if KiprisScrapper._TM_STATE_R != tm_state_el.text:
-                continue
+        try:
+            tm_elems = self.driver.find_elements(By.CSS_SELECTOR, schema["selector"])
+        except Exception as e:
+            logger.log_exception(message="상표권 결과 행 대체 추출중", obj=e)
+            return None
 
-            tm_pd_code_el = self._find_prod_code_el(tm_el=tm_el)
+        tm_rows = []
+        for tm_elem in tm_elems:
+            tm_row = {}
+            for key, field in schema["fields"].items():
+                if isinstance(field, str):
+                    field = {"selector": field, "attr": "text"}
 
-            if tm_pd_code_el == None:
-                continue
+                field_el = self.probe(
+                    by=By.CSS_SELECTOR, expression=field["selector"], within=tm_elem
+                )
+                if field_el == None:
+                    tm_row[key] = None
+                elif field["attr"] == "text":
+                    tm_row[key] = field_el.text.strip()
+                else:
+                    tm_row[key] = field_el.get_attribute(field["attr"])
 
-            try:
-                prod_codes_result = tm_prod_codes_by_brand_name[tm_name]
-                prod_codes_result.append(tm_pd_code_el.text)
+            tm_rows.append(tm_row)
 
-            except:
-                tm_prod_codes.append(tm_pd_code_el.text)
-                tm_prod_codes_by_brand_name[tm_name] = tm_prod_codes
+        return tm_rows
 
-        self._close_kipris()
+    def _tm_rows_to_result(self, tm_rows):
+        tm_prod_codes_by_brand_name = self._group_registered_prod_codes(tm_rows)
 
-        if len(tm_prod_codes) == 0:
+        if len(tm_prod_codes_by_brand_name) == 0:
             return KiprisScrapper._RESULT_NO_MATCH_TM
 
         prod_excel_val = self._convet_prod_codes_to_excel_values(
@@ -133,51 +401,70 @@ class KiprisScrapper(SeniumScraper):
         )
         return f"{prod_excel_val}"
 
+    def _group_registered_prod_codes(self, tm_rows):
+        """
+        추출한 결과 행 중 브랜드명이 일치하고 등록 상태인 행의 상품분류코드를
+        상표권 이름별로 모은다.
+        :param tm_rows: [{"name", "state", "prod_codes"}, ...]
+        """
+        tm_prod_codes_by_brand_name = {}
+
+        # 브랜드별로 한 번만 만들고 결과 행 이름 전체를 한 번에 비교
+        brand_matcher = BrandMatcher(
+            self._target_brand_name,
+            self._another_lang_brand_name,
+            max_distance=KiprisScrapper.MATCH_MAX_DISTANCE,
+        )
+        is_matching = brand_matcher.match_all(
+            [tm_row.get("name") for tm_row in tm_rows]
+        )
+
+        for tm_row, is_matching_brand_name in zip(tm_rows, is_matching):
+            tm_name = tm_row.get("name")
+            tm_state = tm_row.get("state")
+            tm_prod_code = tm_row.get("prod_codes")
+
+            if not tm_name or tm_state is None or tm_prod_code is None:
+                continue
+
+            if is_matching_brand_name == False:
+                continue
+
+            if KiprisScrapper._TM_STATE_R != tm_state:
+                continue
+
+            tm_prod_codes_by_brand_name.setdefault(tm_name, []).append(tm_prod_code)
+            self._collect_tm_img(tm_row)
+
+        return tm_prod_codes_by_brand_name
+
+    def _collect_tm_img(self, tm_row):
+        """등록 상표권 이미지를 {'상표권이름': {'출원번호': '이미지 URL'}}에 모은다"""
+        application_number = tm_row.get("application_number")
+        img_src = tm_row.get("img_src")
+        if not application_number or not img_src:
+            return
+
+        if application_number not in self.tm_state_r_num_list:
+            self.tm_state_r_num_list.append(application_number)
+        self.tm_state_r_img_srcs.setdefault(tm_row.get("name"), {})[
+            application_number
+        ] = img_src
+
     def check_page_loading_with_wait(self, context, timeout=30):
         try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda driver: driver.execute_script("return document.readyState")
-                == "complete"
-            )
+            self.waits.wait_document_ready(timeout=timeout)
             print("페이지 로딩 완료")
         except Exception as e:
             logger.log_exception(message=context, obj=e)
 
     def wait_for_network_idle(self, timeout=30):
         try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda d: d.execute_script(
-                    "return window.performance.getEntriesByType('resource').filter(e => e.initiatorType === 'xmlhttprequest' || e.initiatorType === 'fetch').length === 0"
-                )
-            )
+            self.wait_network_idle(timeout=timeout)
             print("모든 네트워크 요청 완료")
         except Exception as e:
             print(f"네트워크 요청 대기 중 오류 발생: {e}")
 
-    def _is_matching_brand_name(self, tm_name: str):
-        try:
-            # 브랜드 이름 리스트
-            brand_names = [
-                f"{self._target_brand_name}",
-                f"{self._target_brand_name} {self._another_lang_brand_name}",
-                f"{self._target_brand_name}{self._another_lang_brand_name}",
-                f"{self._another_lang_brand_name}",
-                f"{self._another_lang_brand_name} {self._target_brand_name}",
-                f"{self._another_lang_brand_name}{self._target_brand_name}",
-            ]
-
-            # 대소문자 구별 없이 비교를 위해 입력 텍스트와 브랜드 이름 리스트를 소문자로 변환
-            input_text_lower = tm_name.lower()
-            brand_names_lower = [name.lower() for name in brand_names]
-
-            # 일치 여부 확인
-            return input_text_lower in brand_names_lower
-        except Exception as e:
-            logger.log_exception(
-                message=f"상표권이름를 브랜드이름리스트에서 검사중 // 브랜드-{self._target_brand_name}",
-                obj=e,
-            )
-
     def _check_tm(self, tm_tab):
         try:
             tm_result = self.find_element_in_parent(
@@ -187,6 +474,9 @@ class KiprisScrapper(SeniumScraper):
                 expression="span",
             ).text
 
+            # 스크롤을 결과 개수만큼만 하기 위해 기억
+            self._tm_count = KiprisScrapper._parse_tm_count(tm_result)
+
             if tm_result != "0":
                 return True
             else:
@@ -201,6 +491,12 @@ class KiprisScrapper(SeniumScraper):
             )
             return None
 
+    @staticmethod
+    def _parse_tm_count(text):
+        """상표 탭 결과 개수 (예: "1,234") -> 1234, 숫자가 없으면 None"""
+        digits = re.sub(r"[^0-9]", "", text or "")
+        return int(digits) if digits else None
+
     def _check_tm_result_in_html(self):
         try:
             html_source = self.driver.page_source
@@ -219,73 +515,14 @@ class KiprisScrapper(SeniumScraper):
             )
             return None
 
-    def _find_prod_code_el(self, tm_el):
-        try:
-            scraped_tm_category_codes = self.find_element_in_parent(
-                parent=tm_el,
-                by=By.CSS_SELECTOR,
-                element_description="상품분류코드들",
-                expression="ul > li:nth-child(2) > span",
-                timeout=5,
-            )
-
-            return scraped_tm_category_codes
-
-        except Exception as e:
-            logger.log_exception(message="상품분류코드 찾는중", obj=e)
-            return None
-
-    def _check_tm_state_el(self, tm_el):
-        try:
-            tm_state_el = self.find_element_in_parent(
-                parent=tm_el,
-                by=By.CSS_SELECTOR,
-                element_description="상표권등록상태여부",
-                expression="span.state",
-                timeout=5,
-            )
-            return tm_state_el
-
-        except Exception as e:
-            logger.log_exception(
-                message=f"상표권등록상태여부 검사중 // 브랜드-{self._target_brand_name}",
-                obj=e,
-            )
-            return None
-
-    def _find_tm_name_el(self, tm_el):
-
-        try:
-            tm_name_el = self.find_element_in_parent(
-                parent=tm_el,
-                by=By.CSS_SELECTOR,
-                element_description=f"브랜드네임과 상표권매칭중 // 브랜드-{self._target_brand_name}",
-                expression="a",
-                timeout=2,
-            )
-
-            return tm_name_el
-
-        except Exception as e:
-            logger.log_exception(
-                message=f"브랜드네임과 상표권매칭중 // 브랜드-{self._target_brand_name}",
-                obj=e,
-            )
-            return None
-
     def _goto_kipris_searchbox(self, brand_name, timeout=10):
-
-        if not self.driver or not self.driver.service.is_connectable():
-            print("드라이버가 종료되어 재초기화합니다.")
-
-            self.driver = SeniumDravierManager(headless=True)._init_driver()
- 
+        # 드라이버가 종료된 경우의 재초기화는 SupervisedDriver가 처리
         try:
             # self.driver.execute_script("window.open('');")
             # self.driver.switch_to.window(self.driver.window_handles[-1])
 
             # 키프리스 페이지로 이동
-            self.driver.get("http://m.kipris.or.kr/mobile/index.jsp")
+            self._get("http://m.kipris.or.kr/mobile/index.jsp")
 
         except Exception as e:
             logger.log_exception(
@@ -302,7 +539,7 @@ class KiprisScrapper(SeniumScraper):
                 expression="input[name='searchQuery']",
                 timeout=timeout_for_submit_form,
             )
-            search_box.send_keys(self._target_brand_name)
+            search_box.send_keys(brand_name)
             search_box.submit()
 
         except Exception as e:
@@ -319,10 +556,8 @@ class KiprisScrapper(SeniumScraper):
             # loading-bar 존재 여부 확인
             loading_bar_present = False
             try:
-                # 요소가 존재하는지 확인 (최대 3초 대기)
-                WebDriverWait(self.driver, timeout=timeout_check_bar).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.loading-bar"))
-                )
+                # 요소가 존재하는지 확인 (최대 timeout_check_bar초 대기)
+                self.waits.wait_present("div.loading-bar", timeout=timeout_check_bar)
                 loading_bar_present = True
             except TimeoutException:
                 print("Loading bar is not present. Proceeding without wait.")
@@ -335,11 +570,7 @@ class KiprisScrapper(SeniumScraper):
                     f"로딩바가 존재 완료할때까지 {timeout_for_loading_bar} 대기 // 브랜드-{self._target_brand_name}"
                 )
 
-                WebDriverWait(self.driver, timeout=timeout_for_loading_bar).until(
-                    EC.invisibility_of_element_located(
-                        (By.CSS_SELECTOR, "div.loading-bar")
-                    )
-                )
+                self.wait_gone("div.loading-bar", timeout=timeout_for_loading_bar)
                 logger.get_logger().info(
                     f"로딩바 로딩완료 display:none으로 숨김처리됨 // 브랜드-{self._target_brand_name}"
                 )
@@ -358,7 +589,11 @@ class KiprisScrapper(SeniumScraper):
             return None
 
     def _click_tm_tab(self, sleep_for_loading=3):
-        time.sleep(sleep_for_loading)
+        # 고정 sleep 대신 네트워크가 잠잠해지는 즉시 진행 (최대 sleep_for_loading초)
+        try:
+            self.wait_network_idle(idle=0.3, timeout=sleep_for_loading)
+        except TimeoutException:
+            pass
 
         try:
             # 키프리스 상표 탭 클릭
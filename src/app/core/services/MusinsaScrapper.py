@@ -24,28 +24,67 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from .KiprisScrapper import KiprisScrapper
+from .KiprisLookupService import KiprisLookupService
+from .TrademarkIndex import TrademarkIndex
+from .SellerProfileStore import SellerProfileStore
+from .SellerInfoExtractor import SellerInfoExtractor
 
 logger = Logger(name="MusinsaScrapper", log_file="MuScrappe.log").get_logger()
 
+# 상품 페이지에 내장된 상태 데이터(__NEXT_DATA__, JSON 스크립트, window 전역 상태)를
+# JSON으로 변환 가능한 값들의 리스트로 읽는 스크립트
+_PAGE_DATA_SCRIPT = """
+const states = [];
+for (const script of document.querySelectorAll(
+    'script#__NEXT_DATA__, script[type="application/json"]'
+)) {
+    try { states.push(JSON.parse(script.textContent)); } catch (e) {}
+}
+for (const name of ['__MSS__', '__INITIAL_STATE__', '__PRELOADED_STATE__']) {
+    if (!window[name]) continue;
+    try { states.push(JSON.parse(JSON.stringify(window[name]))); } catch (e) {}
+}
+return states;
+"""
+
 
 class MusinsaScrapper(SeniumScraper):
 
+    BLOCK_PROFILE = "musinsa"
+
+    # True면 상품 페이지로 바로 이동해 내장 데이터/API 응답에서 판매자 정보를 읽고,
+    # 못 읽으면 기존처럼 스크롤 후 판매자정보보기를 클릭
+    USE_PAGE_DATA = True
+
     def __init__(self, driver: SeniumDravierManager):
 
         super().__init__(driver)
 
-        self.kipris_scraper = KiprisScrapper(driver=driver)
+        # 조회 서비스(세션 풀, 진행중 요청 병합, 속도 제한)와 캐시는 스크래퍼끼리 공유
+        kipris_lookup_service = KiprisLookupService.shared()
+        self.kipris_scraper = KiprisScrapper(
+            driver=self.driver,
+            lookup_service=kipris_lookup_service,
+            tm_cache=kipris_lookup_service.tm_cache,
+            tm_index=TrademarkIndex.shared(),
+        )
 
         self.event_links = []
 
-        self.tm_state_r_num_list = []  # 등록된상표권출원번호 리스트
+        # 키프리스 조회중에 모은 등록 상표권 출원번호/사진 (KiprisScrapper와 공유)
+        self.tm_state_r_num_list = self.kipris_scraper.tm_state_r_num_list
 
         self.tm_state_r_img_srcs: dict[str, dict[str, str]] = (
-            {}
+            self.kipris_scraper.tm_state_r_img_srcs
         )  # 등록된상표권출원 사진들
 
         self._scraping_failed_brand_count = 0
 
+        self._deferred_kipris = []  # 키프리스 조회를 미룬 brand_infos
+
+        # 브랜드 slug로 저장해둔 판매자 정보 (있으면 상품 페이지를 열지 않음)
+        self.seller_profiles = SellerProfileStore.shared()
+
     def scrap_all_musinsa_event_link(
         self,
         max_scraping_size=100,
@@ -69,19 +108,84 @@ class MusinsaScrapper(SeniumScraper):
         return self.event_links
 
     def _goto_target_link(self, link):
+        """
+        :return: 상품 페이지 내장 데이터에서 읽은 판매자 정보,
+                 못 읽었으면 None (판매자정보 드롭다운을 연 상태)
+        """
 
         self.driver.execute_script("window.open('');")
 
         self.driver.switch_to.window(self.driver.window_handles[-1])
 
-        self.driver.get(link)
+        self._get(link)
 
-        self._click_first_prod_thumb(link=link)
+        seller_infos = None
+        prod_href = self._first_prod_href() if MusinsaScrapper.USE_PAGE_DATA else None
 
-        self._drop_down_seller_infos(link_to_debug=link)
+        if prod_href:
+            seller_infos = self._read_seller_infos_from_page_data(prod_href)
+        else:
+            self._click_first_prod_thumb(link=link)
+
+        if seller_infos == None:
+            self._drop_down_seller_infos(link_to_debug=link)
 
         logger.info(f"타겟링크move - {link}")
 
+        return seller_infos
+
+    def _first_prod_href(self):
+        try:
+            self.waits.wait_present("a.new-brand__goods-item", timeout=10)
+        except TimeoutException:
+            return None
+
+        return self.extract(
+            {"selector": "a.new-brand__goods-item", "many": False, "attr": "href"}
+        )
+
+    def _read_seller_infos_from_page_data(self, prod_href):
+        """
+        클릭 없이 상품 페이지로 이동해 내장 상태 데이터를 먼저 읽고,
+        판매자 정보가 없으면 그동안 받은 api 응답(NetworkCapture)에서 찾는다
+        :return: scrap_brand_infos 형식의 딕셔너리, 못 찾으면 None
+        """
+        extractor = SellerInfoExtractor.for_site("musinsa_data")
+
+        with self.capture_network() as capture:
+            self._get(prod_href)
+
+            try:
+                states = self.driver.execute_script(_PAGE_DATA_SCRIPT) or []
+            except Exception as e:
+                logger.info(f"상품 페이지 내장 데이터 읽기 실패 - {prod_href} - {e}")
+                states = []
+
+            seller_infos = extractor.extract_data(states, count=False)
+            if seller_infos["상호"] == None and seller_infos["사업자번호"] == None:
+                states += [
+                    response["json"]
+                    for response in capture.responses(timeout=5, idle=0.5)
+                ]
+
+        seller_infos = extractor.extract_data(states)
+        if seller_infos["상호"] == None and seller_infos["사업자번호"] == None:
+            logger.info(f"내장 데이터에 판매자 정보 없음, 클릭 방식으로 진행 - {prod_href}")
+            return None
+
+        company = " / ".join(
+            value for value in (seller_infos["상호"], seller_infos["대표자"]) if value
+        )
+        return {
+            "상호 / 대표자": company or None,
+            "브랜드": seller_infos["브랜드"],
+            "사업자번호": seller_infos["사업자번호"],
+            "통신판매업신고": seller_infos["통신판매업신고"],
+            "연락처": seller_infos["연락처"],
+            "E-mail": seller_infos["E-mail"],
+            "영업소재지": seller_infos["영업소재지"],
+        }
+
     def _close_target_link(self, link=""):
         self.driver.close()
         self.driver.switch_to.window(self.driver.window_handles[0])
@@ -89,37 +193,52 @@ class MusinsaScrapper(SeniumScraper):
         if link != "":
             logger.info(f"타겟링크close - {link}")
 
-    def scrap(self, link):
+    def scrap(self, link, defer_kipris=False):
+        """
+        :param defer_kipris: True면 키프리스 조회를 조회 서비스에 넣어두고 바로 반환,
+                             상품분류코드는 resolve_deferred_kipris()에서 채운다
+        """
         brand_infos = {}
         brand_name = None
         is_brnad_scraping_ok = None
         is_kipris_scraping_ok = None
 
+        brand_slug = self._extract_brand_name(url=link)
+        cached_infos = self.seller_profiles.get("musinsa_brand", brand_slug)
+        if cached_infos != None:
+            cached_infos["브랜드 페이지"] = link
+            logger.info(f"저장된 판매자 정보 사용-브랜드 {brand_slug}-{link}")
+            try:
+                self._scrap_prod_codes(cached_infos, defer_kipris)
+            except Exception as e:
+                logger.exception(f"타겟브랜드스크래핑중-예외발생\n" f"Err: {e}\n")
+            return cached_infos
+
+        page_seller_infos = None
         try:
-            self._goto_target_link(link=link)
+            page_seller_infos = self._goto_target_link(link=link)
 
         except Exception as e:
             logger.exception(f"타겟링크이동중-예외발생-{link}\n" f"Err: {e}\n")
 
         try:
 
-            brand_infos = self.scrap_brand_infos(url=link)
-            KOR_brand_name = brand_infos["브랜드"]
-            EN_brand_name = brand_infos["영문명"]
-
-            tm_prod_codes = self.kipris_scraper.scrap(
-                brand_name=KOR_brand_name,
-                another_lang_brand_name=EN_brand_name,
+            brand_infos = self.scrap_brand_infos(
+                url=link, seller_infos=page_seller_infos
             )
 
-            brand_infos["상품분류코드(한)"] = tm_prod_codes
-
-            tm_prod_codes_en_brand_name = self.kipris_scraper.scrap(
-                brand_name=EN_brand_name,
-                another_lang_brand_name=KOR_brand_name,
+            # 사업자번호까지 읽힌 정보만 저장 (실패한 스크랩은 다음에 다시 시도)
+            business_number = SellerProfileStore.business_number_key(
+                brand_infos.get("사업자번호")
             )
+            if business_number != None:
+                self.seller_profiles.put(
+                    brand_infos,
+                    musinsa_brand=brand_slug,
+                    business_number=business_number,
+                )
 
-            brand_infos["상품분류코드(영)"] = tm_prod_codes_en_brand_name
+            self._scrap_prod_codes(brand_infos, defer_kipris)
 
             is_brnad_scraping_ok = True
 
@@ -130,6 +249,46 @@ class MusinsaScrapper(SeniumScraper):
             self._close_target_link(link=link)
             return brand_infos
 
+    def _scrap_prod_codes(self, brand_infos, defer_kipris):
+        KOR_brand_name = brand_infos["브랜드"]
+        EN_brand_name = brand_infos["영문명"]
+
+        if defer_kipris:
+            # 영문명은 브랜드 페이지 URL에서 뽑은 값
+            self.kipris_scraper.prefetch(
+                brand_name=KOR_brand_name,
+                another_lang_brand_name=EN_brand_name,
+                another_lang_is_slug=True,
+            )
+            self._deferred_kipris.append(brand_infos)
+        else:
+            self._fill_prod_codes(brand_infos)
+
+    def resolve_deferred_kipris(self):
+        """defer_kipris로 미뤄둔 브랜드들의 상품분류코드를 채운다"""
+        while self._deferred_kipris:
+            brand_infos = self._deferred_kipris.pop(0)
+            try:
+                self._fill_prod_codes(brand_infos)
+            except Exception as e:
+                logger.exception(
+                    f"미뤄둔 키프리스 조회중-예외발생-브랜드 {brand_infos.get('브랜드')}\n"
+                    f"Err: {e}\n"
+                )
+
+    def _fill_prod_codes(self, brand_infos):
+        # 영문명은 브랜드 페이지 URL에서 뽑은 값
+        tm_prod_codes, tm_prod_codes_en_brand_name = (
+            self.kipris_scraper.scrap_both_langs(
+                brand_name=brand_infos["브랜드"],
+                another_lang_brand_name=brand_infos["영문명"],
+                another_lang_is_slug=True,
+            )
+        )
+
+        brand_infos["상품분류코드(한)"] = tm_prod_codes
+        brand_infos["상품분류코드(영)"] = tm_prod_codes_en_brand_name
+
     def _goto_kipris_searchbox(self, brand_name):
         try:
             self.driver.execute_script("window.open('');")
@@ -228,14 +387,13 @@ class MusinsaScrapper(SeniumScraper):
     def _drop_down_seller_infos(self, link_to_debug):
         did_dropped = False
 
-        self.scroll_page_to_end(sleep=0.25)
+        self.scroll_until_settled(settle=0.25)
 
         try:
-            seller_info_btn = self.find_element(
+            # 판매자정보 버튼은 없는 상품도 있어 대기 없이 확인
+            seller_info_btn = self.probe(
                 by=By.XPATH,
-                element_description="셀러정보",
                 expression='//div[@data-button-name="판매자정보보기"]',
-                timeout=1,
             )
 
             if seller_info_btn:
@@ -272,48 +430,17 @@ class MusinsaScrapper(SeniumScraper):
 
             return did_dropped
 
-    def scrap_brand_infos(self, url):
-        # 특정 속성을 가진 div 요소 찾기
-        opened_seller_infos = self.find_element(
-            by=By.XPATH,
-            element_description="열린판매자정보",
-            expression='//div[@data-state="open" and @data-orientation="vertical"]',
-            timeout=1,
-        )
-
-        if opened_seller_infos == None:
-            return {}
-
-        # 해당 div 내부의 모든 span 요소 찾기
-        span_elements = opened_seller_infos.find_elements(By.TAG_NAME, "span")
-
-        if span_elements == None:
-            return {}
-
-        # 모든 정보 키 초기화
-        title = None
-        infos_list = []
-
-        infos = {
-            "상호 / 대표자": None,
-            "브랜드": None,
-            "사업자번호": None,
-            "통신판매업신고": None,
-            "연락처": None,
-            "E-mail": None,
-            "영업소재지": None,
-        }
-
-        for index, span in enumerate(span_elements):
-            if index % 2 == 0:
-                title = span.text
-                infos[f"{title}"] = None
-                continue
-
-            if index % 2 == 1:
-                props_matching_title = span.text
-                infos[f"{title}"] = props_matching_title
-                continue
+    def scrap_brand_infos(self, url, seller_infos=None):
+        """
+        :param seller_infos: 상품 페이지 내장 데이터에서 이미 읽은 판매자 정보,
+                             None이면 열린 판매자정보의 span들에서 읽는다
+        """
+        if seller_infos != None:
+            infos = dict(seller_infos)
+        else:
+            infos = self._read_opened_seller_infos()
+            if infos == None:
+                return {}
 
         injected_infos = self._inject_data_to_scraped(
             infos=infos,
@@ -323,8 +450,6 @@ class MusinsaScrapper(SeniumScraper):
             ],
         )
 
-        infos_list.append(injected_infos)  # 모든 키가 포함된 infos를 리스트에 추가
-
         logger.info(
             f"스크래핑완료-타겟브랜드-{infos['브랜드']}\n"
             f"스크래핑완료-타겟링크-{url}\n\n"
@@ -332,6 +457,27 @@ class MusinsaScrapper(SeniumScraper):
 
         return injected_infos
 
+    def _read_opened_seller_infos(self):
+        # 특정 속성을 가진 div 요소 찾기
+        opened_seller_infos = self.find_element(
+            by=By.XPATH,
+            element_description="열린판매자정보",
+            expression='//div[@data-state="open" and @data-orientation="vertical"]',
+            timeout=1,
+        )
+
+        if opened_seller_infos == None:
+            return None
+
+        # 해당 div 내부의 모든 span 텍스트를 한 번에 읽기
+        span_texts = self.extract("span", within=opened_seller_infos)
+
+        if span_texts == None:
+            return None
+
+        # [제목, 값, 제목, 값, ...] 쌍을 규칙표로 해석 (모든 정보 키는 None으로 시작)
+        return SellerInfoExtractor.for_site("musinsa").extract(span_texts)
+
     @classmethod
     def _extract_brand_name(cls, url):
         # URL을 슬래시(/)로 나눈 후 필요한 부분만 가져오기
@@ -0,0 +1,187 @@
+import threading
+from app.core.utils.Logger import Logger
+from .CdpEventLog import CdpEventLog
+
+_IMAGES = ["*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.avif*", "*.ico*"]
+_FONTS = ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"]
+_MEDIA = ["*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*"]
+_TRACKERS = [
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*googleadservices.com*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*facebook.net*",
+    "*facebook.com/tr*",
+    "*criteo.*",
+    "*adnxs.com*",
+    "*analytics.tiktok.com*",
+    "*ads-twitter.com*",
+    "*scorecardresearch.com*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+    "*amplitude.com*",
+    "*appsflyer.com*",
+    "*braze.com*",
+    "*wcs.naver.net*",
+    "*mixpanel.com*",
+]
+
+# 페이지 로딩 시간 / 전송량 측정
+# - transferSize는 Timing-Allow-Origin이 없는 교차 출처 리소스에서 0이므로
+#   CDP 이벤트를 못 읽었을 때만 쓰는 하한값
+_PAGE_METRICS_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+let bytes = nav ? (nav.transferSize || 0) : 0;
+for (const r of resources) { bytes += r.transferSize || 0; }
+return {
+    loadMs: nav ? Math.round(nav.loadEventEnd || nav.domContentLoadedEventEnd || 0) : 0,
+    bytes: bytes,
+    requests: resources.length,
+};
+"""
+
+
+class NetworkBlocker:
+    """NetworkBlocker 클래스
+    - 사이트별 차단 프로필(musinsa, ably, kipris)을 CDP Network.setBlockedURLs로 적용
+    - 프로필별 페이지 수, 로딩 시간, 전송량, 차단된 요청 수를 집계해 리포트
+      (차단 없이(none) 측정한 기준값이 있으면 페이지당 절감량도 함께)
+    - 전송량/차단 수는 CDP Network 이벤트(loadingFinished, loadingFailed)로 세고,
+      이벤트를 못 읽으면 Resource Timing의 transferSize로 대신함 (교차 출처는 누락)
+    """
+
+    logger = Logger(name="NetworkBlocker", log_file="NetworkBlocker.log").get_logger()
+
+    PROFILES = {
+        "none": [],
+        "musinsa": _IMAGES + _FONTS + _MEDIA + _TRACKERS,
+        # 에이블리는 마켓 이미지(img[alt="마켓 이미지"])를 클릭해야 하므로 이미지는 허용
+        "ably": _FONTS + _MEDIA + _TRACKERS,
+        "kipris": _IMAGES + _FONTS + _MEDIA + _TRACKERS,
+    }
+
+    # (id(driver), 탭 핸들) -> 적용된 프로필 이름
+    # (Network.setBlockedURLs는 명령을 보낸 탭에만 적용되므로 탭마다 따로 기록)
+    _applied = {}
+    _stats = {}  # 프로필 이름 -> {"pages", "bytes", "load_ms", "blocked"}
+    _lock = threading.Lock()
+
+    @classmethod
+    def apply(cls, driver, profile):
+        """driver의 현재 탭에 프로필 적용, 그 탭에 이미 같은 프로필이면 CDP 호출 생략"""
+        driver = getattr(driver, "wrapped_driver", driver)
+        if profile is None:
+            return
+
+        key = cls._key(driver)
+        if cls._applied.get(key) == profile:
+            return
+
+        patterns = cls.PROFILES.get(profile)
+        if patterns is None:
+            raise ValueError(f"ValueError - 정의되지 않은 차단 프로필: {profile}")
+
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+            cls._applied[key] = profile
+        except Exception as e:
+            cls.logger.error(f"차단 프로필 {profile} 적용 실패: {e}")
+
+    @classmethod
+    def forget(cls, driver):
+        """driver의 모든 탭 기록 삭제"""
+        for key in [key for key in cls._applied if key[0] == id(driver)]:
+            cls._applied.pop(key, None)
+
+    @staticmethod
+    def _key(driver):
+        try:
+            handle = driver.current_window_handle
+        except Exception:
+            handle = None
+        return (id(driver), handle)
+
+    @classmethod
+    def measure(cls, driver, profile, cursor=None):
+        """
+        방금 로드한 페이지의 로딩 시간과 전송량, 차단된 요청 수를 프로필 통계에 누적
+        :param cursor: 이동 직전의 CdpEventLog 커서, 있으면 그 이후 CDP 이벤트로 집계
+        """
+        if profile is None:
+            return None
+
+        try:
+            metrics = driver.execute_script(_PAGE_METRICS_SCRIPT)
+        except Exception:
+            return None
+
+        metrics["blocked"] = 0
+        if cursor != None:
+            events, _ = CdpEventLog.of(driver).read(cursor)
+            metrics.update(cls._count_network_events(events))
+
+        with cls._lock:
+            stat = cls._stats.setdefault(
+                profile, {"pages": 0, "bytes": 0, "load_ms": 0, "blocked": 0}
+            )
+            stat["pages"] += 1
+            stat["bytes"] += metrics.get("bytes", 0)
+            stat["load_ms"] += metrics.get("loadMs", 0)
+            stat["blocked"] += metrics["blocked"]
+
+        return metrics
+
+    @staticmethod
+    def _count_network_events(events):
+        """CDP 이벤트에서 실제 수신 바이트와 차단된(blockedReason) 요청 수를 센다"""
+        received = 0
+        blocked = 0
+        finished = 0
+        for event in events:
+            method = event.get("method")
+            params = event.get("params", {})
+            if method == "Network.loadingFinished":
+                received += params.get("encodedDataLength", 0)
+                finished += 1
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                blocked += 1
+
+        counts = {"blocked": blocked}
+        if finished > 0:
+            counts["bytes"] = int(received)
+        return counts
+
+    @classmethod
+    def report(cls):
+        """프로필별 합계 / 평균 로딩시간 / 전송량 / 차단 수 / (기준값 대비) 절감량"""
+        with cls._lock:
+            stats = {name: dict(stat) for name, stat in cls._stats.items()}
+
+        baseline = stats.get("none")
+        base_bytes = baseline["bytes"] / baseline["pages"] if baseline else None
+        base_ms = baseline["load_ms"] / baseline["pages"] if baseline else None
+
+        report = {}
+        for name, stat in stats.items():
+            avg_bytes = stat["bytes"] / stat["pages"]
+            avg_ms = stat["load_ms"] / stat["pages"]
+            row = {
+                "pages": stat["pages"],
+                "blocked_requests": stat["blocked"],
+                "total_kb": round(stat["bytes"] / 1024, 1),
+                "total_load_s": round(stat["load_ms"] / 1000, 1),
+                "avg_kb": round(avg_bytes / 1024, 1),
+                "avg_load_ms": round(avg_ms),
+                "avg_blocked": round(stat["blocked"] / stat["pages"], 1),
+            }
+            if base_bytes is not None and name != "none":
+                row["saved_kb_per_page"] = round((base_bytes - avg_bytes) / 1024, 1)
+                row["saved_ms_per_page"] = round(base_ms - avg_ms)
+            report[name] = row
+
+            cls.logger.info(f"차단 프로필 {name}: {row}")
+
+        return report
@@ -0,0 +1,135 @@
+import re
+import json
+import time
+import base64
+from app.core.services.CdpEventLog import CdpEventLog
+from app.core.utils.Logger import Logger
+
+
+class NetworkCapture:
+    """NetworkCapture 클래스
+    - CDP Network.responseReceived 이벤트 중 URL 패턴이 맞는 응답을 골라
+      Network.getResponseBody로 본문을 읽고 JSON으로 디코딩해서 스트림으로 제공
+    - 렌더링된 DOM 대신 XHR/fetch 응답의 구조화된 데이터를 바로 사용하기 위함
+
+    사용 예:
+        with scraper.capture_network() as capture:
+            more_btn.click()
+            for response in capture.responses(timeout=5):
+                response["url"], response["json"]
+    """
+
+    logger = Logger(name="NetworkCapture", log_file="NetworkCapture.log").get_logger()
+
+    # 사이트별 XHR/fetch 응답 URL 패턴 (SeniumScraper.BLOCK_PROFILE 이름과 동일)
+    SITE_PATTERNS = {
+        "musinsa": [r"api\.musinsa\.com/", r"musinsa\.com/api2?/"],
+        "ably": [r"api\.a-bly\.com/api/"],
+        "kipris": [r"kipris\.or\.kr/.*\.do"],
+    }
+
+    _JSON_MIME_TYPES = ("json", "javascript", "text/plain")
+
+    def __init__(self, driver, patterns):
+        self.driver = driver
+        self.patterns = [re.compile(pattern) for pattern in patterns]
+        self._event_log = None
+        self._cursor = 0
+        self._pending = {}  # requestId -> responseReceived params
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._pending.clear()
+
+    def start(self):
+        """이 시점 이후의 응답만 캡처"""
+        self._event_log = CdpEventLog.of(self.driver)
+        self._cursor = self._event_log.cursor()
+        self._pending.clear()
+
+    def matches(self, url):
+        return any(pattern.search(url) for pattern in self.patterns)
+
+    def responses(self, timeout=10, idle=1.0):
+        """
+        매칭된 응답의 JSON 본문을 도착하는 대로 yield
+        - timeout: 전체 최대 대기 시간 (초)
+        - idle: 새 응답 없이 진행중인 요청도 없으면 이 시간 뒤 종료 (초)
+        :yield: {"url", "status", "json"}
+        """
+        if self._event_log is None:
+            self.start()
+
+        deadline = time.monotonic() + timeout
+        last_activity = time.monotonic()
+
+        while time.monotonic() < deadline:
+            events, self._cursor = self._event_log.read(self._cursor)
+
+            for event in events:
+                response = self._handle_event(event)
+                if response is not None:
+                    last_activity = time.monotonic()
+                    yield response
+
+            if not self._pending and time.monotonic() - last_activity >= idle:
+                return
+
+            time.sleep(0.05)
+
+    def collect(self, timeout=10, idle=1.0):
+        return list(self.responses(timeout=timeout, idle=idle))
+
+    def _handle_event(self, event):
+        method = event.get("method")
+        params = event.get("params", {})
+
+        if method == "Network.responseReceived":
+            response = params.get("response", {})
+            url = response.get("url", "")
+            mime_type = response.get("mimeType", "")
+            if self.matches(url) and any(
+                mime in mime_type for mime in NetworkCapture._JSON_MIME_TYPES
+            ):
+                self._pending[params.get("requestId")] = response
+            return None
+
+        if method == "Network.loadingFailed":
+            self._pending.pop(params.get("requestId"), None)
+            return None
+
+        if method != "Network.loadingFinished":
+            return None
+
+        response = self._pending.pop(params.get("requestId"), None)
+        if response is None:
+            return None
+
+        body = self._read_body(params.get("requestId"), response.get("url"))
+        if body is None:
+            return None
+
+        return {
+            "url": response.get("url"),
+            "status": response.get("status"),
+            "json": body,
+        }
+
+    def _read_body(self, request_id, url):
+        try:
+            result = self.driver.execute_cdp_cmd(
+                "Network.getResponseBody", {"requestId": request_id}
+            )
+            body = result.get("body", "")
+            if result.get("base64Encoded"):
+                body = base64.b64decode(body).decode("utf-8", errors="replace")
+            return json.loads(body)
+        except ValueError:
+            self.logger.debug(f"JSON이 아닌 응답 본문: {url}")
+            return None
+        except Exception as e:
+            self.logger.error(f"응답 본문 읽기 실패: {url} - {e}")
+            return None
@@ -0,0 +1,231 @@
+import re
+import threading
+from app.core.utils.Logger import Logger
+
+logger = Logger(
+    name="SellerInfoExtractor", log_file="SellerInfoExtractor.log"
+).get_logger()
+
+
+class SellerInfoExtractor:
+    """SellerInfoExtractor 클래스
+    - 판매자 정보 블록의 텍스트를 한 번에 받아 사이트별 규칙표로 모든 필드를 채운다
+    - 규칙: (키, 라벨 정규식, 모드), 정규식은 생성할 때 한 번만 컴파일
+        after: "라벨 값" 에서 라벨 뒤 (예: "상호: 무신사" -> "무신사")
+        before: "값 라벨" 에서 라벨 앞 (예: "무신사 마켓 정보" -> "무신사")
+        pair: [제목, 값, 제목, 값, ...] 에서 제목이 라벨과 같으면 다음 값
+        data: 내장 JSON/API 응답에서 키 이름이 라벨과 같은 값 (extract_data)
+              판매자 필드가 가장 많이 모인 객체 하나에서만 읽음
+        data_any: data와 같지만 그 객체에 없으면 다른 객체에서도 찾음 (브랜드명 등)
+    - 필드별 성공/실패 횟수를 모아 report()로 로그
+
+    사용 예:
+        extractor = SellerInfoExtractor.for_site("ably")
+        seller_infos = extractor.extract(texts)  # {키: 값 또는 None}
+    """
+
+    SITE_RULES = {
+        "ably": [
+            ("상호", r"상호\s*:", "after"),
+            ("대표자", r"대표자\s*:", "after"),
+            ("브랜드", r"마켓 정보", "before"),
+            ("사업자번호", r"사업자등록번호\s*:", "after"),
+            ("통신판매업신고", r"통신판매업신고번호\s*:", "after"),
+            ("연락처", r"전화번호\s*:", "after"),
+            ("E-mail", r"이메일\s*:", "after"),
+            ("영업소재지", r"주소\s*:", "after"),
+        ],
+        "musinsa": [
+            ("상호 / 대표자", r"상호\s*/\s*대표자", "pair"),
+            ("브랜드", r"브랜드", "pair"),
+            ("사업자번호", r"사업자(?:등록)?번호", "pair"),
+            ("통신판매업신고", r"통신판매업\s*신고(?:번호)?", "pair"),
+            ("연락처", r"연락처|전화번호", "pair"),
+            ("E-mail", r"(?i:e-?mail)|이메일", "pair"),
+            ("영업소재지", r"영업소재지|사업장\s*소재지|주소", "pair"),
+        ],
+        # 상품 페이지 내장 상태(__NEXT_DATA__ 등)와 api 응답, 키는 소문자로 _-없이 비교
+        "musinsa_data": [
+            ("상호", r"(?:company|business|seller|corp)(?:name|nm)?", "data"),
+            ("대표자", r"(?:ceo|representative|owner)(?:name|nm)?", "data"),
+            ("브랜드", r"brand(?:name|nm)(?:kor|ko)?", "data_any"),
+            (
+                "사업자번호",
+                r"(?:business|biz|company)"
+                r"(?:license|reg(?:istration)?)?(?:no|num|number)",
+                "data",
+            ),
+            (
+                "통신판매업신고",
+                r"(?:mailorder|communicationsales|ecommerce)\w*(?:no|num|number)",
+                "data",
+            ),
+            ("연락처", r"(?:cs|seller|company)?(?:phone|tel)(?:no|number)?", "data"),
+            ("E-mail", r"(?:cs|seller|company)?e?mail", "data"),
+            ("영업소재지", r"(?:company|business|seller)?address\w*", "data"),
+        ],
+    }
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, site, rules):
+        self.site = site
+        self.keys = [key for key, _, _ in rules]
+
+        self._text_rules = []  # (키, 컴파일된 정규식) - after / before
+        self._pair_rules = []  # (키, 컴파일된 정규식) - pair
+        self._data_rules = []  # (키, 컴파일된 정규식, 다른 객체에서도 찾을지)
+        for key, label, mode in rules:
+            if mode == "after":
+                self._text_rules.append((key, re.compile(rf"(?:{label})\s*(.+)")))
+            elif mode == "before":
+                self._text_rules.append((key, re.compile(rf"(.+?)\s*(?:{label})")))
+            elif mode == "pair":
+                self._pair_rules.append((key, re.compile(rf"\s*(?:{label})\s*:?\s*")))
+            elif mode in ("data", "data_any"):
+                self._data_rules.append((key, re.compile(label), mode == "data_any"))
+            else:
+                raise ValueError(f"알 수 없는 규칙 모드: {mode}")
+
+        self._lock = threading.Lock()
+        self._hits = {key: 0 for key in self.keys}
+        self._misses = {key: 0 for key in self.keys}
+
+    @classmethod
+    def for_site(cls, site):
+        """사이트마다 하나만 만들어 스크래퍼끼리 통계를 같이 모은다"""
+        with cls._shared_lock:
+            extractor = cls._shared.get(site)
+            if extractor == None:
+                extractor = cls(site, cls.SITE_RULES[site])
+                cls._shared[site] = extractor
+            return extractor
+
+    @classmethod
+    def report_all(cls):
+        with cls._shared_lock:
+            extractors = list(cls._shared.values())
+        for extractor in extractors:
+            extractor.report()
+
+    def extract(self, texts, count=True):
+        """
+        :param texts: 판매자 정보 블록의 텍스트 리스트 (<p> 등)
+        :param count: False면 성공/실패 횟수에 넣지 않음 (미리 확인용)
+        :return: {키: 값 또는 None}, pair 규칙이 있으면 처리하지 못한 제목도 키로 포함
+        """
+        # 빈 텍스트도 자리를 지켜야 제목/값 쌍이 어긋나지 않음
+        texts = [(text or "").strip() for text in texts or []]
+        infos = {key: None for key in self.keys}
+
+        pending = list(self._text_rules)
+        for text in texts:
+            if not pending:
+                break
+            if not text:
+                continue
+            for rule in list(pending):
+                key, pattern = rule
+                match = pattern.search(text)
+                if match:
+                    infos[key] = match.group(1).strip()
+                    pending.remove(rule)
+
+        if self._pair_rules:
+            for title, value in zip(texts[0::2], texts[1::2]):
+                key = self._pair_key(title)
+                if key == None and title:
+                    # 규칙표에 없는 제목도 기존처럼 그대로 남긴다
+                    infos[title] = value
+                elif key != None and infos[key] == None:
+                    infos[key] = value
+
+        if count:
+            self._count(infos)
+        return infos
+
+    def extract_data(self, data, count=True):
+        """
+        :param data: JSON으로 디코딩한 값 (여러 개면 리스트로)
+        :param count: False면 성공/실패 횟수에 넣지 않음 (미리 확인용)
+        :return: {키: 값 또는 None}
+        """
+        infos = {key: None for key in self.keys}
+
+        best = {}
+        found_anywhere = {}
+        for node in SellerInfoExtractor._walk_dicts(data):
+            found = self._data_fields(node)
+            for key, value in found.items():
+                found_anywhere.setdefault(key, value)
+            # 판매자 필드가 두 개 이상 모인 객체만 판매자 정보로 본다
+            if len(found) >= 2 and len(found) > len(best):
+                best = found
+
+        for key, _, anywhere in self._data_rules:
+            value = best.get(key)
+            if value == None and anywhere:
+                value = found_anywhere.get(key)
+            infos[key] = value
+
+        if count:
+            self._count(infos)
+        return infos
+
+    def stats(self):
+        with self._lock:
+            return {
+                key: {"hit": self._hits[key], "miss": self._misses[key]}
+                for key in self.keys
+            }
+
+    def report(self):
+        stats = self.stats()
+        summary = ", ".join(
+            f"{key} {counts['hit']}/{counts['hit'] + counts['miss']}"
+            for key, counts in stats.items()
+        )
+        logger.info(f"{self.site} 판매자 정보 필드별 성공: {summary}")
+        return stats
+
+    def _pair_key(self, title):
+        for key, pattern in self._pair_rules:
+            if pattern.fullmatch(title):
+                return key
+        return None
+
+    def _data_fields(self, node):
+        found = {}
+        for name, value in node.items():
+            if isinstance(value, bool) or not isinstance(value, (str, int)):
+                continue
+            value = str(value).strip()
+            if not value:
+                continue
+
+            name = re.sub(r"[_\-\s]", "", str(name)).lower()
+            for key, pattern, _ in self._data_rules:
+                if key not in found and pattern.fullmatch(name):
+                    found[key] = value
+                    break
+        return found
+
+    @staticmethod
+    def _walk_dicts(data):
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                yield node
+                stack.extend(reversed(list(node.values())))
+            elif isinstance(node, list):
+                stack.extend(reversed(node))
+
+    def _count(self, infos):
+        with self._lock:
+            for key in self.keys:
+                if infos[key] == None:
+                    self._misses[key] += 1
+                else:
+                    self._hits[key] += 1
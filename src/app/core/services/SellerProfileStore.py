@@ -0,0 +1,156 @@
+import os
+import re
+import json
+import time
+import sqlite3
+import threading
+from app.core.utils.Logger import Logger
+
+logger = Logger(
+    name="SellerProfileStore", log_file="SellerProfileStore.log"
+).get_logger()
+
+
+class SellerProfileStore:
+    """SellerProfileStore 클래스
+    - 스크랩한 판매자 정보(_market_infos / brand_infos)를 SQLite에 TTL과 함께 저장
+    - 같은 정보를 여러 키로 찾을 수 있음
+        ably_goods: 에이블리 상품 URL
+        ably_market: 에이블리 마켓 ID
+        musinsa_brand: 무신사 브랜드 slug
+        business_number: 사업자번호 (숫자만)
+    - 실행 중에는 메모리에도 두어서 같은 마켓/브랜드가 반복되면 DB도 읽지 않음
+    """
+
+    DB_PATH = ".data/seller_profiles.sqlite3"
+    TTL = 60 * 60 * 24 * 14  # 14일
+
+    KINDS = ("ably_goods", "ably_market", "musinsa_brand", "business_number")
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, db_path=None, ttl=None):
+        self.db_path = db_path or SellerProfileStore.DB_PATH
+        self.ttl = SellerProfileStore.TTL if ttl is None else ttl
+
+        self.hits = 0
+        self.misses = 0
+
+        self._memory = {}  # (kind, key) -> (expires_at, profile)
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+
+    @classmethod
+    def shared(cls):
+        with cls._shared_lock:
+            if cls._shared == None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def business_number_key(business_number):
+        """"123-45-67890" -> "1234567890", 숫자가 10자리가 아니면 None"""
+        digits = re.sub(r"[^0-9]", "", business_number or "")
+        return digits if len(digits) == 10 else None
+
+    @staticmethod
+    def ably_market_id(market_link):
+        """a-bly.com/app/markets/{id} 또는 /market/{id}/info 에서 마켓 ID"""
+        match = re.search(r"/markets?/(\d+)", market_link or "")
+        return match.group(1) if match else None
+
+    def get(self, kind, key):
+        """:return: 저장된 판매자 정보(복사본), 없거나 만료되면 None"""
+        if not key:
+            return None
+        key = str(key)
+
+        now = time.time()
+        with self._lock:
+            cached = self._memory.get((kind, key))
+            if cached == None:
+                row = self._conn.execute(
+                    "SELECT profile, expires_at FROM seller_profiles "
+                    "WHERE kind = ? AND key = ?",
+                    (kind, str(key)),
+                ).fetchone()
+                if row != None:
+                    cached = (row[1], json.loads(row[0]))
+                    self._memory[(kind, key)] = cached
+
+        if cached == None or cached[0] < now:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return dict(cached[1])
+
+    def put(self, profile: dict, **keys):
+        """
+        :param keys: ably_goods=..., ably_market=..., musinsa_brand=...,
+                     business_number=... 중 값이 있는 것만 저장
+        """
+        keys = {
+            kind: str(key) for kind, key in keys.items() if kind in self.KINDS and key
+        }
+        if not profile or not keys:
+            return
+
+        now = time.time()
+        expires_at = now + self.ttl
+        data = json.dumps(profile, ensure_ascii=False)
+
+        with self._lock:
+            for kind, key in keys.items():
+                self._memory[(kind, key)] = (expires_at, dict(profile))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO seller_profiles "
+                "(kind, key, profile, fetched_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                [(kind, key, data, now, expires_at) for kind, key in keys.items()],
+            )
+            self._conn.commit()
+
+    def purge_expired(self):
+        now = time.time()
+        with self._lock:
+            self._memory = {
+                key: value for key, value in self._memory.items() if value[0] >= now
+            }
+            cursor = self._conn.execute(
+                "DELETE FROM seller_profiles WHERE expires_at < ?", (now,)
+            )
+            self._conn.commit()
+
+        logger.info(f"만료된 판매자 정보 {cursor.rowcount}건 삭제")
+        return cursor.rowcount
+
+    def stats(self):
+        with self._lock:
+            total = self._conn.execute(
+                "SELECT COUNT(*) FROM seller_profiles"
+            ).fetchone()[0]
+        return {"entries": total, "hits": self.hits, "misses": self.misses}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _connect(self):
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS seller_profiles ("
+            "kind TEXT NOT NULL, "
+            "key TEXT NOT NULL, "
+            "profile TEXT NOT NULL, "
+            "fetched_at REAL NOT NULL, "
+            "expires_at REAL NOT NULL, "
+            "PRIMARY KEY (kind, key))"
+        )
+        conn.commit()
+        return conn
@@ -1,7 +1,12 @@
 import os
+import json
+import queue
+import socket
+import atexit
 import tempfile
 import threading
-import random
+from collections import deque
+from urllib.parse import urlparse
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -9,8 +14,15 @@ from webdriver_manager.chrome import ChromeDriverManager
 import time
 import shutil
 from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from app.core.services.NetworkBlocker import NetworkBlocker
+from app.core.services.CdpEventLog import CdpEventLog
 from app.core.utils.Logger import Logger
 
+try:
+    import psutil
+except ImportError:  # psutil이 없으면 메모리 측정/고아 프로세스 정리는 건너뜀
+    psutil = None
+
 logger = Logger(
     name="SeniumDravierManager", log_file="SeniumDravierManager.log"
 ).get_logger()
@@ -19,20 +31,55 @@ logger = Logger(
 class SeniumDravierManager:
     """SeniumDravierManager 클래스
     - 각 요청이 독립적인 Chrome 창을 열도록 설계
+    - 페이지 이동 횟수(MAX_REQUEST)나 Chrome + chromedriver 메모리(MAX_RSS_MB)가
+      한도를 넘으면 드라이버를 내리고 새 드라이버로 교체(recycle)
+    - 빠른 실행: 미리 초기화한 템플릿 프로필 복제, 빈 포트 할당,
+      프로필 삭제는 백그라운드 스레드에서 처리
     """
 
-    MAX_REQUEST = 10
+    MAX_REQUEST = 100
+    MAX_RSS_MB = 2048
+    PROFILE_PREFIX = "senium_profile_"
+    DRIVER_MANIFEST_PATH = ".data/chromedriver_manifest.json"
+    TEMPLATE_PROFILE_DIR = ".data/chrome_profile_template"
+    USE_TEMPLATE_PROFILE = True
+
+    _driver_path = None  # 프로세스 단위로 한 번만 찾은 chromedriver 경로
+    _driver_path_lock = threading.Lock()
+
+    _live_managers = {}  # id(driver) -> SeniumDravierManager
+    # recycle로 내린 드라이버 -> 매니저 (이전 드라이버를 들고 있던 쪽도 같은 매니저를 찾도록)
+    _retired_managers = {}  # id(driver) -> (driver, SeniumDravierManager)
+    _live_lock = threading.Lock()
+
+    _template_ready = None  # None: 미확인, True/False: 템플릿 사용 가능 여부
+    _template_lock = threading.Lock()
+
+    _reserved_ports = set()  # 이 프로세스에서 할당해 준 디버깅 포트
+    _port_lock = threading.Lock()
+
+    _profile_reap_queue = queue.Queue()  # 삭제 대기중인 임시 프로필
+    _profile_reaper = None
+    _profile_reaper_lock = threading.Lock()
+
+    _launch_latencies = deque(maxlen=1000)  # 드라이버 실행 소요시간(초)
 
     logger = Logger(
         name="SeniumDravierManager", log_file="SeniumDravierManager.log"
     ).get_logger()
 
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, max_request=None, max_rss_mb=None):
         self.driver = None
         self._request_count = 0  # 요청 횟수
+        self.visited_origins = set()  # 이동한 페이지의 origin (풀 반납 시 정리용)
+        self.on_recycle = None  # recycle 후 호출할 콜백 (이전 드라이버, 새 드라이버)
+        self._supervised = None  # 이 매니저의 드라이버를 감싸는 SupervisedDriver (공유)
         self._lock = threading.Lock()  # 동시성 제어를 위한 Lock
         self._temp_profile_dir = None  # 임시 프로필 디렉터리
+        self._debug_port = None  # 할당받은 디버깅 포트
         self.options = {"headless": headless}
+        self.max_request = max_request or SeniumDravierManager.MAX_REQUEST
+        self.max_rss_mb = max_rss_mb or SeniumDravierManager.MAX_RSS_MB
 
     def __enter__(self):
 
@@ -47,14 +94,281 @@ class SeniumDravierManager:
         self._quit_driver()
 
     def _init_driver(self):
+        started_at = time.perf_counter()
+
         options = self._configure_options()
-        service = Service(ChromeDriverManager().install())
+        service = Service(SeniumDravierManager._resolve_driver_path())
         driver = webdriver.Chrome(service=service, options=options)
+        self._request_count = 0
+        self.visited_origins = set()
+
+        SeniumDravierManager._launch_latencies.append(time.perf_counter() - started_at)
+
+        with SeniumDravierManager._live_lock:
+            SeniumDravierManager._live_managers[id(driver)] = self
+
         return driver
 
-    def _quit_driver(self):
+    @classmethod
+    def _resolve_driver_path(cls):
+        """
+        chromedriver 경로를 프로세스당 한 번만 찾는다.
+        1. 설치된 Chrome 버전을 로컬에서 확인(네트워크 X)
+        2. 디스크 매니페스트에 해당 버전의 드라이버가 있으면 그대로 사용
+        3. 없으면 ChromeDriverManager().install() 후 매니페스트에 기록
+        4. 설치도 실패하면(오프라인) 매니페스트의 마지막 드라이버 사용
+        """
+        with cls._driver_path_lock:
+            if cls._driver_path and os.path.exists(cls._driver_path):
+                return cls._driver_path
+
+            chrome_version = cls._get_chrome_version()
+            manifest = cls._load_driver_manifest()
+
+            entry = manifest.get(chrome_version) if chrome_version else None
+            if entry and os.path.exists(entry):
+                cls._driver_path = entry
+                cls.logger.info(f"chromedriver 캐시 사용: {chrome_version}")
+                return entry
+
+            try:
+                driver_path = ChromeDriverManager().install()
+            except Exception as e:
+                cls.logger.error(f"ChromeDriverManager 설치 실패: {e}")
+                driver_path = cls._latest_cached_driver(manifest)
+                if not driver_path:
+                    raise
+                cls.logger.warning(f"오프라인 - 캐시된 드라이버 사용: {driver_path}")
+            else:
+                if chrome_version:
+                    manifest[chrome_version] = driver_path
+                    manifest["_latest"] = driver_path
+                    cls._save_driver_manifest(manifest)
+
+            cls._driver_path = driver_path
+            return driver_path
+
+    @staticmethod
+    def _get_chrome_version():
+        """설치된 Chrome 버전 (예: 131.0.6778.265), 확인 불가 시 None"""
+        try:
+            from webdriver_manager.core.os_manager import (
+                ChromeType,
+                OperationSystemManager,
+            )
+
+            return OperationSystemManager().get_browser_version_from_os(
+                ChromeType.GOOGLE
+            )
+        except Exception:
+            return None
+
+    @classmethod
+    def _load_driver_manifest(cls):
+        try:
+            with open(cls.DRIVER_MANIFEST_PATH, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def _save_driver_manifest(cls, manifest):
+        # 다른 프로세스가 읽는 중에도 깨지지 않도록 임시파일에 쓰고 교체
+        try:
+            os.makedirs(os.path.dirname(cls.DRIVER_MANIFEST_PATH), exist_ok=True)
+            temp_path = f"{cls.DRIVER_MANIFEST_PATH}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=4)
+            os.replace(temp_path, cls.DRIVER_MANIFEST_PATH)
+        except OSError as e:
+            cls.logger.error(f"chromedriver 매니페스트 저장 실패: {e}")
+
+    @staticmethod
+    def _latest_cached_driver(manifest):
+        latest = manifest.get("_latest")
+        if latest and os.path.exists(latest):
+            return latest
+        for path in manifest.values():
+            if os.path.exists(path):
+                return path
+        return None
+
+    @classmethod
+    def of(cls, driver):
+        """driver를 띄운 매니저를 찾는다. 직접 만든 드라이버면 None"""
+        driver = getattr(driver, "wrapped_driver", driver)
+        with cls._live_lock:
+            return cls._live_managers.get(id(driver))
+
+    @classmethod
+    def owner_of(cls, driver):
+        """of()와 같지만 recycle로 이미 교체된 드라이버여도 매니저를 찾는다"""
+        driver = getattr(driver, "wrapped_driver", driver)
+        with cls._live_lock:
+            manager = cls._live_managers.get(id(driver))
+            if manager:
+                return manager
+
+            retired = cls._retired_managers.get(id(driver))
+            if retired and retired[0] is driver:
+                return retired[1]
+        return None
+
+    def supervised(self):
+        """
+        이 매니저의 드라이버를 감싸는 SupervisedDriver
+        - 매니저당 하나만 만들어 모든 스크래퍼가 공유 (재실행 결과도 공유됨)
+        """
+        # SupervisedDriver가 이 모듈을 import하므로 여기서 import
+        from app.core.services.SupervisedDriver import SupervisedDriver
+
+        with self._lock:
+            if self._supervised is None:
+                self._supervised = SupervisedDriver(
+                    self.driver, headless=self.options["headless"]
+                )
+            return self._supervised
+
+    @classmethod
+    def count_request(cls, driver, url=None):
+        """driver의 페이지 이동 횟수를 1 증가, url이 있으면 origin도 기록"""
+        manager = cls.of(driver)
+        if manager:
+            manager._request_count += 1
+            origin = cls.origin_of(url)
+            if origin:
+                manager.visited_origins.add(origin)
+
+    @staticmethod
+    def origin_of(url):
+        """http(s) URL의 origin (예: "https://m.a-bly.com"), 아니면 None"""
+        parsed = urlparse(url or "")
+        if parsed.scheme not in ("http", "https") or not parsed.netloc:
+            return None
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    def get_rss_mb(self):
+        """chromedriver와 그 자식 Chrome 프로세스들의 RSS 합 (MB)"""
+        if psutil is None or not self.driver:
+            return 0
+
+        try:
+            root = psutil.Process(self.driver.service.process.pid)
+            procs = [root] + root.children(recursive=True)
+        except Exception:
+            return 0
+
+        rss = 0
+        for proc in procs:
+            try:
+                rss += proc.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return rss / (1024 * 1024)
+
+    def needs_recycle(self):
+        if self._request_count >= self.max_request:
+            self.logger.info(
+                f"페이지 이동 {self._request_count}회, 한도 {self.max_request}회 도달"
+            )
+            return True
+
+        rss_mb = self.get_rss_mb()
+        if rss_mb >= self.max_rss_mb:
+            self.logger.info(
+                f"브라우저 메모리 {rss_mb:.0f}MB, 한도 {self.max_rss_mb}MB 초과"
+            )
+            return True
+
+        return False
+
+    def recycle(self):
+        """현재 드라이버를 내리고 새 드라이버로 교체 후 반환"""
+        with self._lock:
+            old_driver = self.driver
+            self._quit_driver(retiring=True)
+            self.driver = self._init_driver()
+            if not self.driver:
+                raise RuntimeError("Failed to initialize WebDriver.")
+            self.logger.info("드라이버 교체(recycle) 완료")
+
+            if old_driver:
+                with SeniumDravierManager._live_lock:
+                    SeniumDravierManager._retired_managers[id(old_driver)] = (
+                        old_driver,
+                        self,
+                    )
+            if self._supervised:
+                self._supervised.rebind(self.driver)
+
+        if self.on_recycle:
+            self.on_recycle(old_driver, self.driver)
+        return self.driver
+
+    def recycle_if_needed(self):
+        """한도를 넘었으면 교체한 새 드라이버를, 아니면 None을 반환"""
+        if not self.driver or not self.needs_recycle():
+            return None
+        return self.recycle()
+
+    @classmethod
+    def reap_orphans(cls):
+        """
+        크래시로 남은 chrome / chromedriver 프로세스를 정리한다.
+        - 부모 프로세스가 사라진 chromedriver
+        - 임시 프로필(PROFILE_PREFIX)을 쓰면서 chromedriver 밑에 있지 않은 chrome
+          (브라우저 루트 프로세스만 종료하면 렌더러 등 자식 프로세스도 같이 종료됨)
+        """
+        if psutil is None:
+            cls.logger.warning("psutil 미설치 - 고아 프로세스 정리 건너뜀")
+            return 0
+
+        reaped = 0
+        for proc in psutil.process_iter(["name", "cmdline", "ppid"]):
+            try:
+                name = (proc.info["name"] or "").lower()
+                ppid = proc.info["ppid"]
+
+                if "chromedriver" in name:
+                    is_orphan = ppid in (0, 1) or not psutil.pid_exists(ppid)
+                elif "chrome" in name:
+                    cmdline = " ".join(proc.info["cmdline"] or [])
+                    if cls.PROFILE_PREFIX not in cmdline:
+                        continue
+                    parent = proc.parent()
+                    is_orphan = (
+                        parent is None or "chrome" not in parent.name().lower()
+                    )
+                else:
+                    continue
+
+                if is_orphan:
+                    proc.kill()
+                    reaped += 1
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+
+        if reaped:
+            cls.logger.info(f"고아 chrome/chromedriver 프로세스 {reaped}개 정리")
+        return reaped
+
+    def _quit_driver(self, retiring=False):
+        """
+        :param retiring: recycle 중이면 True (교체 전 드라이버 기록을 남겨둠)
+        """
+        if not retiring:
+            with SeniumDravierManager._live_lock:
+                retired_managers = SeniumDravierManager._retired_managers
+                for key, (_, manager) in list(retired_managers.items()):
+                    if manager is self:
+                        retired_managers.pop(key, None)
 
         if self.driver:
+            with SeniumDravierManager._live_lock:
+                SeniumDravierManager._live_managers.pop(id(self.driver), None)
+            NetworkBlocker.forget(self.driver)
+            CdpEventLog.forget(self.driver)
+
             try:
                 self.driver.quit()
 
@@ -63,14 +377,147 @@ class SeniumDravierManager:
             finally:
                 self.driver = None  # 드라이버 해제
 
-        # 임시 프로필 디렉터리 삭제
+        if self._debug_port:
+            with SeniumDravierManager._port_lock:
+                SeniumDravierManager._reserved_ports.discard(self._debug_port)
+            self._debug_port = None
+
+        # 임시 프로필 디렉터리 삭제는 백그라운드 스레드에서 (Chrome 종료 대기 X)
         if self._temp_profile_dir and os.path.exists(self._temp_profile_dir):
+            SeniumDravierManager._schedule_profile_removal(self._temp_profile_dir)
+        self._temp_profile_dir = None
+
+    @classmethod
+    def _schedule_profile_removal(cls, profile_dir):
+        with cls._profile_reaper_lock:
+            if cls._profile_reaper is None or not cls._profile_reaper.is_alive():
+                cls._profile_reaper = threading.Thread(
+                    target=cls._reap_profiles, name="ProfileReaper", daemon=True
+                )
+                cls._profile_reaper.start()
+                atexit.register(cls._drain_profile_queue)
+
+        cls._profile_reap_queue.put((profile_dir, 0))
+
+    @classmethod
+    def _reap_profiles(cls, max_attempts=10):
+        """Chrome이 파일을 놓을 때까지 재시도하며 프로필 삭제"""
+        while True:
+            profile_dir, attempts = cls._profile_reap_queue.get()
+            try:
+                shutil.rmtree(profile_dir)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                if attempts + 1 >= max_attempts:
+                    cls.logger.error(
+                        f"Error deleting temporary profile directory: {e}"
+                    )
+                    continue
+                time.sleep(0.2 * (attempts + 1))
+                cls._profile_reap_queue.put((profile_dir, attempts + 1))
+
+    @classmethod
+    def _drain_profile_queue(cls):
+        while not cls._profile_reap_queue.empty():
             try:
-                time.sleep(2)  # Chrome 프로세스 종료 대기
-                shutil.rmtree(self._temp_profile_dir)
+                profile_dir, _ = cls._profile_reap_queue.get_nowait()
+            except queue.Empty:
+                break
+            shutil.rmtree(profile_dir, ignore_errors=True)
 
+    @classmethod
+    def launch_stats(cls):
+        """드라이버 실행 소요시간 백분위수(초)"""
+        latencies = sorted(cls._launch_latencies)
+        if not latencies:
+            return {}
+
+        def percentile(p):
+            index = min(len(latencies) - 1, int(round(p / 100 * len(latencies))) - 1)
+            return round(latencies[max(index, 0)], 3)
+
+        stats = {
+            "count": len(latencies),
+            "p50": percentile(50),
+            "p90": percentile(90),
+            "p99": percentile(99),
+            "max": round(latencies[-1], 3),
+        }
+        cls.logger.info(f"드라이버 실행 소요시간(초): {stats}")
+        return stats
+
+    @classmethod
+    def _ensure_template_profile(cls, headless=True):
+        """
+        최초 1회 Chrome을 띄워 초기화한 프로필을 템플릿으로 저장한다.
+        이후 실행은 빈 프로필 대신 템플릿을 복제해서 첫 실행 초기화 비용을 줄인다.
+        """
+        with cls._template_lock:
+            if cls._template_ready is not None:
+                return cls._template_ready
+
+            template_dir = os.path.abspath(cls.TEMPLATE_PROFILE_DIR)
+            if os.path.isdir(template_dir) and os.listdir(template_dir):
+                cls._template_ready = True
+                return True
+
+            building_dir = f"{template_dir}.{os.getpid()}.tmp"
+            try:
+                options = Options()
+                if headless:
+                    options.add_argument("--headless")
+                options.add_argument("--no-sandbox")
+                options.add_argument("--disable-dev-shm-usage")
+                options.add_argument(f"--user-data-dir={building_dir}")
+
+                driver = webdriver.Chrome(
+                    service=Service(cls._resolve_driver_path()), options=options
+                )
+                driver.get("about:blank")
+                driver.quit()
+
+                # 캐시와 잠금 파일은 템플릿에서 제외
+                for name in ("Cache", "Code Cache", "GPUCache", "ShaderCache"):
+                    shutil.rmtree(
+                        os.path.join(building_dir, "Default", name),
+                        ignore_errors=True,
+                    )
+                    shutil.rmtree(os.path.join(building_dir, name), ignore_errors=True)
+
+                os.makedirs(os.path.dirname(template_dir), exist_ok=True)
+                os.replace(building_dir, template_dir)
+                cls._template_ready = True
+                cls.logger.info(f"템플릿 프로필 생성: {template_dir}")
             except Exception as e:
-                self.logger.error(f"Error deleting temporary profile directory: {e}")
+                cls.logger.error(f"템플릿 프로필 생성 실패 - 빈 프로필 사용: {e}")
+                shutil.rmtree(building_dir, ignore_errors=True)
+                cls._template_ready = False
+
+            return cls._template_ready
+
+    def _create_profile_dir(self):
+        profile_dir = tempfile.mkdtemp(prefix=SeniumDravierManager.PROFILE_PREFIX)
+
+        if not SeniumDravierManager.USE_TEMPLATE_PROFILE:
+            return profile_dir
+
+        if not SeniumDravierManager._ensure_template_profile(
+            headless=self.options["headless"]
+        ):
+            return profile_dir
+
+        try:
+            shutil.copytree(
+                os.path.abspath(SeniumDravierManager.TEMPLATE_PROFILE_DIR),
+                profile_dir,
+                dirs_exist_ok=True,
+                ignore=shutil.ignore_patterns("Singleton*", "*.lock", "lockfile"),
+            )
+        except Exception as e:
+            self.logger.error(f"템플릿 프로필 복제 실패 - 빈 프로필 사용: {e}")
+
+        return profile_dir
 
     def _configure_options(self):
         options = Options()
@@ -82,6 +529,7 @@ class SeniumDravierManager:
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--disable-gpu")
         options.add_argument("--window-size=1920,1080")
+        # 이미지 차단은 사이트별 NetworkBlocker 프로필에서 처리
         # options.add_argument("--blink-settings=imagesEnabled=false")
 
         # options.add_argument("--disable-webgl")  # WebGL 비활성화
@@ -90,12 +538,19 @@ class SeniumDravierManager:
 
         options.page_load_strategy = "normal"
 
-        # 고유한 사용자 데이터 디렉터리 생성
-        self._temp_profile_dir = tempfile.mkdtemp()
+        # CDP Network/Page 이벤트를 performance 로그로 받기 (NetworkCapture 등에서 사용)
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        options.add_experimental_option(
+            "perfLoggingPrefs", {"enableNetwork": True, "enablePage": True}
+        )
+
+        # 고유한 사용자 데이터 디렉터리 생성 (템플릿 프로필 복제)
+        self._temp_profile_dir = self._create_profile_dir()
         options.add_argument(f"--user-data-dir={self._temp_profile_dir}")
 
         # 고유한 디버깅 포트 설정
         unique_port = self._get_unique_port()
+        self._debug_port = unique_port
         options.add_argument(f"--remote-debugging-port={unique_port}")
         self.logger.debug(f"Using unique debugging port: {unique_port}")
 
@@ -110,7 +565,16 @@ class SeniumDravierManager:
         return options
 
     def _get_unique_port(self):
-        """고유한 포트를 생성 (추가 충돌 방지)"""
-        base_port = 9222  # 기본 포트 번호
-        random_offset = random.randint(1, 1000)  # 1~1000 범위의 랜덤 값
-        return base_port + random_offset
+        """
+        고유한 포트를 생성 (추가 충돌 방지)
+        OS에 빈 포트를 받아오고, 이 프로세스에서 이미 나눠준 포트는 건너뛴다.
+        """
+        with SeniumDravierManager._port_lock:
+            while True:
+                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                    sock.bind(("127.0.0.1", 0))
+                    port = sock.getsockname()[1]
+
+                if port not in SeniumDravierManager._reserved_ports:
+                    SeniumDravierManager._reserved_ports.add(port)
+                    return port
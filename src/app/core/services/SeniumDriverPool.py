@@ -0,0 +1,259 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from app.core.services.SeniumDravierManager import SeniumDravierManager
+from app.core.utils.Logger import Logger
+
+
+class SeniumDriverPool:
+    """SeniumDriverPool 클래스
+    - 미리 띄워둔 Chrome 드라이버 N개를 checkout / checkin 으로 재사용
+    - 대여(lease)할 때마다 탭, 쿠키, 스토리지 상태를 초기화
+    - 대여/반납 시 헬스체크를 해서 죽은 드라이버는 새 드라이버로 교체
+    - 반납 시 요청 횟수/메모리 한도를 넘은 드라이버는 교체(recycle)
+    """
+
+    logger = Logger(
+        name="SeniumDriverPool", log_file="SeniumDriverPool.log"
+    ).get_logger()
+
+    def __init__(self, size=2, headless=True, checkout_timeout=120):
+        self.size = size
+        self.headless = headless
+        self.checkout_timeout = checkout_timeout
+        self._idle = queue.LifoQueue()  # 최근 반납된 드라이버부터 재사용
+        self._managers = {}  # id(driver) -> SeniumDravierManager
+        # recycle로 교체된 드라이버: id(이전 드라이버) -> (이전 드라이버, 새 드라이버)
+        self._replaced = {}
+        self._lock = threading.Lock()
+        self._pending = 0  # 락 밖에서 생성 중인 드라이버 수 (자리 예약분)
+        self._closed = False
+
+    def __enter__(self):
+        self.warm_up()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def warm_up(self):
+        """풀 크기만큼 드라이버를 동시에 띄워둔다."""
+        SeniumDravierManager.reap_orphans()
+
+        with self._lock:
+            missing = self.size - len(self._managers) - self._pending
+            if missing <= 0:
+                return
+            self._pending += missing
+
+        try:
+            with ThreadPoolExecutor(max_workers=missing) as executor:
+                drivers = list(
+                    executor.map(lambda _: self._launch_or_none(), range(missing))
+                )
+        finally:
+            with self._lock:
+                self._pending -= missing
+
+        for driver in drivers:
+            if driver is not None:
+                self._idle.put(driver)
+
+    def checkout(self, timeout=None):
+        if self._closed:
+            raise RuntimeError("이미 종료된 드라이버 풀")
+
+        timeout = self.checkout_timeout if timeout is None else timeout
+
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            driver = self._launch_if_room()
+            if driver is None:
+                driver = self._wait_idle(timeout)
+
+        if not self._is_healthy(driver):
+            self.logger.warning("헬스체크 실패 드라이버 교체")
+            self._discard(driver)
+            driver = self._launch_if_room()
+            if driver is None:
+                driver = self._wait_idle(timeout)
+
+        return driver
+
+    def checkin(self, driver, retire=False):
+        """
+        :param retire: True면 재사용하지 않고 내린다 (사이트에 차단된 브라우저 등)
+        """
+        if driver is None:
+            return
+
+        driver = self._current(driver)
+
+        if retire or self._closed or not self._is_healthy(driver):
+            self._discard(driver)
+            return
+
+        manager = self._managers.get(id(driver))
+        if manager and manager.needs_recycle():
+            self._discard(driver)
+            return
+
+        if not self._reset_state(driver):
+            self._discard(driver)
+            return
+
+        self._idle.put(driver)
+
+    @contextmanager
+    def lease(self, timeout=None):
+        driver = self.checkout(timeout=timeout)
+        try:
+            yield driver
+        finally:
+            self.checkin(driver)
+
+    def close(self):
+        self._closed = True
+        with self._lock:
+            managers = list(self._managers.values())
+            self._managers.clear()
+            self._replaced.clear()
+
+        for manager in managers:
+            manager._quit_driver()
+
+        while not self._idle.empty():
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+
+    def _wait_idle(self, timeout):
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise RuntimeError(f"{timeout}초 동안 반납된 풀 드라이버가 없음") from None
+
+    def _launch_if_room(self):
+        """
+        풀에 자리가 있으면 락 안에서 자리를 예약하고 드라이버를 띄운다
+        - 자리가 없으면 None, 생성에 실패하면 RuntimeError (예약한 자리는 반환)
+        """
+        with self._lock:
+            if len(self._managers) + self._pending >= self.size:
+                return None
+            self._pending += 1
+
+        try:
+            return self._launch()
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _launch_or_none(self):
+        try:
+            return self._launch()
+        except RuntimeError:
+            return None
+
+    def _launch(self):
+        manager = SeniumDravierManager(headless=self.headless)
+        try:
+            manager.__enter__()
+        except Exception as e:
+            self.logger.error(f"풀 드라이버 생성 실패: {e}")
+            manager._quit_driver()
+            raise RuntimeError("풀 드라이버 생성 실패") from e
+
+        manager.on_recycle = self._rekey
+        with self._lock:
+            self._managers[id(manager.driver)] = manager
+
+        self.logger.info(f"풀 드라이버 생성 - 현재 {len(self._managers)}/{self.size}")
+        return manager.driver
+
+    def _rekey(self, old_driver, new_driver):
+        """
+        대여 중에 매니저가 드라이버를 교체(SupervisedDriver 재실행 등)하면
+        새 드라이버 기준으로 다시 등록하고, 이전 드라이버로 반납해도 찾을 수 있게 둔다
+        """
+        with self._lock:
+            manager = self._managers.pop(id(old_driver), None)
+            if manager is None:
+                return
+            self._managers[id(new_driver)] = manager
+            self._replaced[id(old_driver)] = (old_driver, new_driver)
+
+    def _current(self, driver):
+        """교체된 드라이버로 반납하면 교체 후 드라이버를 반환"""
+        driver = getattr(driver, "wrapped_driver", driver)
+        with self._lock:
+            while id(driver) in self._replaced:
+                old_driver, new_driver = self._replaced.pop(id(driver))
+                if old_driver is not driver:
+                    break
+                driver = new_driver
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            manager = self._managers.pop(id(driver), None)
+
+        if manager:
+            manager._quit_driver()
+        else:
+            try:
+                driver.quit()
+            except Exception as e:
+                self.logger.error(f"Error quitting WebDriver: {e}")
+
+    def _is_healthy(self, driver):
+        try:
+            if not driver.service.is_connectable():
+                return False
+            driver.current_window_handle
+            return True
+        except Exception:
+            return False
+
+    def _reset_state(self, driver):
+        """
+        다음 대여자가 이전 세션의 흔적을 보지 않도록 상태 초기화
+        - 쿠키는 도메인과 관계없이 Network.clearBrowserCookies로 모두 삭제
+        - 스토리지(localStorage, IndexedDB 등)는 이동했던 origin마다 삭제
+        """
+        manager = self._managers.get(id(driver))
+        origins = set(manager.visited_origins) if manager else set()
+
+        try:
+            handles = driver.window_handles
+            for handle in reversed(handles):
+                driver.switch_to.window(handle)
+                origins.add(SeniumDravierManager.origin_of(driver.current_url))
+                if handle != handles[0]:
+                    driver.close()
+            driver.switch_to.window(handles[0])
+
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+
+            for origin in origins:
+                if not origin:
+                    continue
+                try:
+                    driver.execute_cdp_cmd(
+                        "Storage.clearDataForOrigin",
+                        {"origin": origin, "storageTypes": "all"},
+                    )
+                except Exception as e:
+                    self.logger.warning(f"스토리지 초기화 실패({origin}): {e}")
+
+            driver.get("about:blank")
+            if manager:
+                manager.visited_origins.clear()
+
+            return True
+        except Exception as e:
+            self.logger.error(f"풀 드라이버 상태 초기화 실패: {e}")
+            return False
@@ -9,26 +9,177 @@ from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from contextlib import contextmanager
+from urllib.parse import urlparse
+from app.core.services.SeniumDravierManager import SeniumDravierManager
+from app.core.services.NetworkBlocker import NetworkBlocker
+from app.core.services.SupervisedDriver import SupervisedDriver
+from app.core.services.CdpEventLog import CdpEventLog
+from app.core.services.NetworkCapture import NetworkCapture
+from app.core.services.TimeoutPolicy import TimeoutPolicy
+from app.core.services.WaitEngine import WaitEngine
 from app.core.utils.Logger import Logger
 
-MAX_REQUEST = 10
+MAX_REQUEST = SeniumDravierManager.MAX_REQUEST
+
+# extract(schema) 에서 사용하는 스키마 순회 스크립트
+_EXTRACT_SCRIPT = """
+const schema = arguments[0];
+const scope = arguments[1] || document;
+
+function normalise(spec) {
+    return typeof spec === 'string' ? {selector: spec} : spec;
+}
+function readValue(el, spec) {
+    if (!el) return null;
+    if (spec.fields) return readObject(el, spec.fields);
+    const attr = spec.attr || 'text';
+    if (attr === 'text') return (el.innerText || el.textContent || '').trim();
+    if (attr === 'html') return el.innerHTML;
+    if (attr in el && typeof el[attr] === 'string') return el[attr];
+    return el.getAttribute(attr);
+}
+function readField(parent, spec) {
+    spec = normalise(spec);
+    if (spec.many) {
+        const els = spec.selector ? parent.querySelectorAll(spec.selector) : [parent];
+        return Array.from(els).map(el => readValue(el, spec));
+    }
+    const el = spec.selector ? parent.querySelector(spec.selector) : parent;
+    return readValue(el, spec);
+}
+function readObject(el, fields) {
+    const out = {};
+    for (const [key, spec] of Object.entries(fields)) out[key] = readField(el, spec);
+    return out;
+}
+return readField(scope, Object.assign({many: true}, normalise(schema)));
+"""
+
+# scroll_until_settled 에서 사용하는 스크롤 1회 + 안정화 대기 스크립트
+# - MutationObserver로 DOM 변경 시각을, fetch/XHR 후킹으로 진행중인 요청 수를 기록
+# - 요청이 없고 settleMs 동안 DOM 변경이 없으면 바로 반환
+_SCROLL_SETTLE_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const [settleMs, stepTimeoutMs, selector, targetCount] = arguments;
+
+const watch = window.__seniumScrollWatch || (function () {
+    const state = {lastChange: performance.now(), inflight: 0};
+    const touch = () => { state.lastChange = performance.now(); };
+    new MutationObserver(touch).observe(document.body, {childList: true, subtree: true});
+    if (window.fetch) {
+        const originalFetch = window.fetch;
+        window.fetch = function (...args) {
+            state.inflight++;
+            return originalFetch.apply(this, args).finally(() => { state.inflight--; touch(); });
+        };
+    }
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        state.inflight++;
+        this.addEventListener('loadend', () => { state.inflight--; touch(); }, {once: true});
+        return originalSend.apply(this, args);
+    };
+    window.__seniumScrollWatch = state;
+    return state;
+})();
+
+const count = () => selector ? document.querySelectorAll(selector).length : 0;
+const startHeight = document.body.scrollHeight;
+const startCount = count();
+const startedAt = performance.now();
+watch.lastChange = startedAt;
+
+window.scrollTo(0, document.body.scrollHeight);
+
+(function check() {
+    const now = performance.now();
+    const current = count();
+    const height = document.body.scrollHeight;
+    const result = {
+        height: height,
+        count: current,
+        grew: height > startHeight || current > startCount,
+    };
+    if (targetCount && current >= targetCount) return done(result);
+    const settled = watch.inflight <= 0 && now - watch.lastChange >= settleMs;
+    if (settled || now - startedAt >= stepTimeoutMs) return done(result);
+    setTimeout(check, 50);
+})();
+"""
 
 
 class SeniumScraper:
 
     logger = Logger(name="SeniumScraper", log_file="SeniumScraper.log").get_logger()
 
+    BLOCK_PROFILE = None  # NetworkBlocker.PROFILES 중 하위 스크래퍼가 사용할 프로필
+
+    timeout_policy = TimeoutPolicy()  # 모든 스크래퍼가 공유하는 셀렉터별 대기시간 학습
+
     def __init__(self, driver: webdriver.Chrome):
         self.driver = driver
         self.target_link = None
         self._cookies = []
+        self._current_domain = ""
+
+    @property
+    def driver(self):
+        return self._driver
+
+    @driver.setter
+    def driver(self, driver):
+        # 크래시가 나도 재실행 후 이어서 진행하도록 모든 드라이버를 감독 래퍼로 감싼다
+        # (같은 매니저의 드라이버는 스크래퍼끼리 래퍼 하나를 공유)
+        self._driver = SupervisedDriver.wrap(driver)
+        self._waits = None
+
+    @property
+    def waits(self):
+        """CDP 이벤트/MutationObserver 기반 대기 엔진"""
+        if self._waits is None:
+            self._waits = WaitEngine(self.driver)
+        return self._waits
+
+    def wait_network_idle(self, idle=0.5, timeout=30):
+        return self.waits.wait_network_idle(idle=idle, timeout=timeout)
+
+    def wait_url_contains(self, text, timeout=30):
+        return self.waits.wait_url_contains(text, timeout=timeout)
+
+    def wait_gone(self, selector, timeout=30):
+        return self.waits.wait_gone(selector, timeout=timeout)
 
     def goto(self, url):
         self.target_link = url
-        self.driver.get(url)
+        self._get(url)
         self.driver.maximize_window()
         self._cookies = self.driver.get_cookies()
 
+    def _get(self, url):
+        """
+        페이지 이동
+        - 스크래퍼의 차단 프로필(BLOCK_PROFILE)을 적용 후 이동
+        - 드라이버 매니저의 요청 횟수(MAX_REQUEST)에 집계됨
+        """
+        NetworkBlocker.apply(self.driver, self.BLOCK_PROFILE)
+        # 이전 페이지의 performance 로그를 비우고, 이 페이지 이벤트의 시작 위치를 기억
+        cursor = CdpEventLog.of(self.driver).cursor()
+        self._current_domain = urlparse(url).netloc
+        self.driver.get(url)
+        SeniumDravierManager.count_request(self.driver, url)
+        NetworkBlocker.measure(self.driver, self.BLOCK_PROFILE, cursor=cursor)
+
+    def capture_network(self, patterns=None):
+        """
+        XHR/fetch JSON 응답 캡처를 시작한다.
+        :param patterns: 응답 URL 정규식 리스트
+            (기본값: BLOCK_PROFILE 사이트의 NetworkCapture.SITE_PATTERNS)
+        :return: NetworkCapture (with 문으로 사용)
+        """
+        if patterns is None:
+            patterns = NetworkCapture.SITE_PATTERNS.get(self.BLOCK_PROFILE, [])
+        return NetworkCapture(self.driver, patterns)
+
     def search_keyword_in_form(self, keyword, by, expression):
         if not keyword:
             raise ValueError("ValueError - 검색에 사용되는 키워드 입력은 필수")
@@ -56,6 +207,76 @@ class SeniumScraper:
             )
             return False
 
+    def extract(self, schema, within=None):
+        """
+        선언형 CSS 셀렉터 스키마를 브라우저 안에서 한 번에(execute_script 1회) 읽는다.
+        :param schema: 셀렉터 문자열 또는 {"selector", "many", "attr", "fields"} 딕셔너리
+            - selector: CSS 셀렉터 (없으면 현재 요소 자신)
+            - many: True면 매칭되는 모든 요소를 리스트로 (최상위 기본값 True)
+            - attr: "text"(기본), "html", 또는 속성 이름 (예: "href", "src")
+            - fields: {키: 하위 스키마} - 요소마다 딕셔너리로 반환
+        :param within: 탐색 시작 요소 (기본값: document)
+        :return: JSON으로 변환 가능한 리스트/딕셔너리, 실패 시 None
+
+        예: 키프리스 결과 행 전체를 한 번에 읽기
+            self.extract({
+                "selector": "#tmResult .row .content-data-text",
+                "fields": {"name": "a", "state": "span.state"},
+            })
+        """
+        try:
+            return self.driver.execute_script(_EXTRACT_SCRIPT, schema, within)
+        except Exception as e:
+            SeniumScraper.handle_exception(
+                context="스키마 일괄 추출", expression=schema, exception=e
+            )
+            return None
+
+    def probe(self, by, expression, within=None):
+        """
+        대기 없이 지금 존재하는 요소만 확인 (선택적인 요소용)
+        - implicitly_wait 설정과 무관하게 브라우저에서 바로 조회
+        - 없으면 예외/로그 없이 None
+        """
+        if by == By.XPATH:
+            script = (
+                "return document.evaluate(arguments[0], arguments[1] || document, "
+                "null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;"
+            )
+        elif by == By.CSS_SELECTOR:
+            script = "return (arguments[1] || document).querySelector(arguments[0]);"
+        else:
+            raise ValueError(f"ValueError - probe는 CSS_SELECTOR, XPATH만 지원: {by}")
+
+        try:
+            return self.driver.execute_script(script, expression, within)
+        except Exception:
+            return None
+
+    def _adaptive_wait(self, waitable, condition, by, expression, timeout):
+        """
+        TimeoutPolicy가 학습한 대기시간(최대 timeout)으로 WebDriverWait 실행
+        찾는데 걸린 시간/시간초과 여부를 다시 학습에 반영
+        """
+        selector = f"{by}:{expression}"
+        wait_timeout = SeniumScraper.timeout_policy.timeout_for(
+            self._current_domain, selector, timeout
+        )
+
+        started_at = time.monotonic()
+        try:
+            result = WebDriverWait(waitable, timeout=wait_timeout).until(condition)
+        except TimeoutException:
+            SeniumScraper.timeout_policy.record_miss(
+                self._current_domain, selector, time.monotonic() - started_at
+            )
+            raise
+
+        SeniumScraper.timeout_policy.record(
+            self._current_domain, selector, time.monotonic() - started_at
+        )
+        return result
+
     def find_element(
         self,
         by,
@@ -69,8 +290,12 @@ class SeniumScraper:
 
         try:
 
-            element = WebDriverWait(self.driver, timeout=timeout).until(
-                EC.visibility_of_element_located((by, expression))
+            element = self._adaptive_wait(
+                self.driver,
+                EC.visibility_of_element_located((by, expression)),
+                by=by,
+                expression=expression,
+                timeout=timeout,
             )
 
             if not element:
@@ -99,8 +324,12 @@ class SeniumScraper:
 
         try:
 
-            elements = WebDriverWait(self.driver, timeout=timeout).until(
-                EC.presence_of_all_elements_located((by, expression))
+            elements = self._adaptive_wait(
+                self.driver,
+                EC.presence_of_all_elements_located((by, expression)),
+                by=by,
+                expression=expression,
+                timeout=timeout,
             )
 
             if not elements:
@@ -125,8 +354,12 @@ class SeniumScraper:
         timeout=10,
     ):
         try:
-            children = WebDriverWait(parent, timeout=timeout).until(
-                EC.presence_of_element_located((by, expression))
+            children = self._adaptive_wait(
+                parent,
+                EC.presence_of_element_located((by, expression)),
+                by=by,
+                expression=expression,
+                timeout=timeout,
             )
 
             return children
@@ -229,15 +462,73 @@ class SeniumScraper:
 
         scroll_attempts = 0
         while scroll_attempts < max_scroll_attempts:
-            self.scroll_page_to_end(sleep=sleep_for_loading)
+            self.scroll_until_settled(step_timeout=sleep_for_loading * 5)
 
             more_btn.click()
 
-            self.scroll_page_to_end(sleep=sleep_for_loading)
+            self.scroll_until_settled(step_timeout=sleep_for_loading * 5)
 
             scroll_attempts += 1
         return True
 
+    def scroll_until_settled(
+        self,
+        settle=0.4,
+        step_timeout=5,
+        timeout=60,
+        item_selector=None,
+        target_count=None,
+        max_steps=None,
+    ):
+        """
+        고정 sleep 없이 새 콘텐츠가 안정될 때까지만 기다리며 끝까지 스크롤하는 메서드.
+        - settle: 진행중인 fetch/XHR이 없고 DOM 변경이 없는 상태가 유지되어야 하는 시간 (초)
+        - step_timeout: 스크롤 1회당 최대 대기 시간 (초)
+        - timeout: 전체 스크롤 최대 시간 (초)
+        - item_selector: 로드된 아이템 개수를 셀 CSS 셀렉터
+        - target_count: item_selector 개수가 이 값에 도달하면 바로 중지
+        - max_steps: 스크롤 횟수 제한 (무한 피드에서 조금씩 스크롤할 때)
+        :return: 마지막으로 센 아이템 개수 (item_selector가 없으면 0)
+        """
+        deadline = time.monotonic() + timeout
+        attempts = 0
+        result = {"count": 0}
+
+        try:
+            self.driver.set_script_timeout(step_timeout + 5)
+
+            while time.monotonic() < deadline:
+                result = self.driver.execute_async_script(
+                    _SCROLL_SETTLE_SCRIPT,
+                    int(settle * 1000),
+                    int(step_timeout * 1000),
+                    item_selector,
+                    target_count,
+                )
+                attempts += 1
+
+                if target_count and result["count"] >= target_count:
+                    self.logger.info(
+                        f"목표 아이템 {target_count}개 도달, 스크롤 {attempts}회"
+                    )
+                    break
+
+                # 스크롤 후 안정화됐는데 높이/개수 변화가 없으면 끝까지 로드된 것
+                if not result["grew"]:
+                    self.logger.info(f"총 {attempts}번 페이지 끝까지 스크롤 시도했음")
+                    break
+
+                if max_steps and attempts >= max_steps:
+                    break
+
+        except Exception as e:
+            SeniumScraper.handle_exception(
+                context="이벤트 기반 스크롤", expression=item_selector, exception=e
+            )
+            self.scroll_page_to_end()
+
+        return result.get("count", 0)
+
     def scroll_page_to_end(self, sleep=0.5, max_attempts=10):
         """
         웹 페이지가 끝까지 로드될 때까지 스크롤하는 메서드.
@@ -293,9 +584,9 @@ class SeniumScraper:
         :param exception: 발생한 예외 객체
         """
         if isinstance(exception, TimeoutException):
-            SeniumScraper.logger.exception(
-                f"TimeoutException: {context}에서 '{expression}' 처리 중 시간초과\n"
-                f"Msg: {exception}"
+            # 시간초과는 요소가 없는 정상 흐름인 경우가 많아 스택트레이스 없이 기록
+            SeniumScraper.logger.warning(
+                f"TimeoutException: {context}에서 '{expression}' 처리 중 시간초과"
             )
         elif isinstance(exception, NoSuchElementException):
             SeniumScraper.logger.exception(
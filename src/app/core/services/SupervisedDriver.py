@@ -0,0 +1,215 @@
+import atexit
+import threading
+from urllib.parse import urlparse
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from app.core.services.SeniumDravierManager import SeniumDravierManager
+from app.core.utils.Logger import Logger
+
+
+class SupervisedDriver:
+    """SupervisedDriver 클래스
+    - webdriver.Chrome을 감싸서 세션이 죽었는지(크래시, 연결 끊김) 감지
+    - 죽었으면 SeniumDravierManager로 다시 띄우고 쿠키와 현재 URL을 복원한 뒤
+      실패한 호출을 한 번 더 실행
+    - 그 외 속성/메서드는 원래 드라이버에 그대로 위임
+    """
+
+    logger = Logger(
+        name="SupervisedDriver", log_file="SupervisedDriver.log"
+    ).get_logger()
+
+    MAX_RESTARTS = 5  # 연속 재실행 한도 (크래시 루프 방지)
+
+    _DEAD_SESSION_MESSAGES = (
+        "invalid session id",
+        "session deleted",
+        "chrome not reachable",
+        "disconnected",
+        "tab crashed",
+        "target crashed",
+        "unable to receive message from renderer",
+        "failed to establish a new connection",
+        "connection refused",
+        "max retries exceeded",
+    )
+
+    def __init__(self, driver, headless=True):
+        self.__dict__["_driver"] = driver
+        self.__dict__["_headless"] = headless
+        self.__dict__["_own_manager"] = None  # 직접 띄운 드라이버의 매니저
+        self.__dict__["_last_url"] = None
+        self.__dict__["_cookies"] = []
+        self.__dict__["_restarts"] = 0
+        self.__dict__["_restart_lock"] = threading.Lock()
+        self.__dict__["_atexit_registered"] = False
+
+    @classmethod
+    def wrap(cls, driver, headless=True):
+        """
+        driver를 감독 래퍼로 감싼다
+        - 매니저가 띄운 드라이버면 매니저가 공유하는 래퍼를 반환 (headless도 매니저 설정)
+        - 직접 만든 드라이버면 새 래퍼
+        """
+        if driver is None or isinstance(driver, cls):
+            return driver
+
+        owner = SeniumDravierManager.owner_of(driver)
+        if owner:
+            return owner.supervised()
+        return cls(driver, headless=headless)
+
+    @property
+    def wrapped_driver(self):
+        return self._driver
+
+    def rebind(self, driver):
+        """매니저가 드라이버를 교체(recycle)했을 때 새 드라이버로 바꿔 끼운다"""
+        self.__dict__["_driver"] = driver
+
+    def __getattr__(self, name):
+        try:
+            attr = getattr(self._driver, name)
+        except Exception as e:
+            # current_url, page_source 같은 프로퍼티 접근도 세션이 죽으면 예외
+            if not self._is_dead_session(e):
+                raise
+            self._relaunch()
+            return getattr(self._driver, name)
+
+        if not callable(attr) or name.startswith("_"):
+            return attr
+
+        def supervised_call(*args, **kwargs):
+            return self._call(name, *args, **kwargs)
+
+        return supervised_call
+
+    def __setattr__(self, name, value):
+        setattr(self._driver, name, value)
+
+    def get(self, url):
+        self._call("get", url)
+        self.__dict__["_last_url"] = url
+        try:
+            self.__dict__["_cookies"] = self._driver.get_cookies()
+        except Exception:
+            pass
+
+    def quit(self):
+        if self._own_manager:
+            self._quit_own_manager()
+        else:
+            self._driver.quit()
+
+    def _quit_own_manager(self):
+        if self._own_manager:
+            self._own_manager._quit_driver()
+            self.__dict__["_own_manager"] = None
+
+    def _call(self, name, *args, **kwargs):
+        try:
+            result = getattr(self._driver, name)(*args, **kwargs)
+        except Exception as e:
+            if not self._is_dead_session(e):
+                raise
+
+            self.logger.warning(f"세션 종료 감지 ({name}) - 재실행 후 재시도: {e}")
+            self._relaunch()
+            result = getattr(self._driver, name)(*args, **kwargs)
+
+        self.__dict__["_restarts"] = 0
+        return result
+
+    def _is_dead_session(self, exception):
+        if isinstance(exception, InvalidSessionIdException):
+            return True
+
+        # 세션은 살아있는 상태에서 나는 예외 (WebDriverWait 폴링 중 자주 발생)
+        if isinstance(
+            exception,
+            (
+                NoSuchElementException,
+                StaleElementReferenceException,
+                TimeoutException,
+                JavascriptException,
+            ),
+        ):
+            return False
+
+        message = str(exception).lower()
+        if any(marker in message for marker in self._DEAD_SESSION_MESSAGES):
+            return True
+
+        if isinstance(exception, (WebDriverException, ConnectionError, OSError)):
+            try:
+                return not self._driver.service.is_connectable()
+            except Exception:
+                return True
+
+        return False
+
+    def _relaunch(self):
+        with self._restart_lock:
+            if self._restarts >= SupervisedDriver.MAX_RESTARTS:
+                raise RuntimeError(
+                    f"드라이버 재실행 {self._restarts}회 연속 실패 - 중단"
+                )
+            self.__dict__["_restarts"] = self._restarts + 1
+
+            dead_driver = self._driver
+            owner = SeniumDravierManager.owner_of(dead_driver)
+
+            if owner and owner.driver not in (None, dead_driver):
+                # 같은 매니저를 쓰는 다른 쪽에서 이미 교체함
+                new_driver = owner.driver
+            elif owner:
+                # 원래 매니저가 있으면 매니저 안에서 교체해서 정리 책임을 유지
+                new_driver = owner.recycle()
+            else:
+                try:
+                    dead_driver.quit()
+                except Exception:
+                    pass
+                if self._own_manager:
+                    self._own_manager._quit_driver()
+
+                manager = SeniumDravierManager(headless=self._headless)
+                manager.__enter__()
+                manager._supervised = self  # 새 드라이버로 wrap해도 이 래퍼를 쓰도록
+                self.__dict__["_own_manager"] = manager
+                # 재실행마다 등록하지 않고, 종료 시 그때의 매니저만 정리
+                if not self._atexit_registered:
+                    atexit.register(self._quit_own_manager)
+                    self.__dict__["_atexit_registered"] = True
+                new_driver = manager.driver
+
+            self.__dict__["_driver"] = new_driver
+            self._restore_state()
+
+    def _restore_state(self):
+        if not self._last_url:
+            return
+
+        try:
+            parsed = urlparse(self._last_url)
+            # 쿠키는 같은 도메인 페이지에서만 추가할 수 있어 먼저 origin으로 이동
+            self._driver.get(f"{parsed.scheme}://{parsed.netloc}/")
+            for cookie in self._cookies:
+                cookie.pop("sameSite", None)
+                try:
+                    self._driver.add_cookie(cookie)
+                except Exception:
+                    continue
+
+            self._driver.get(self._last_url)
+            SeniumDravierManager.count_request(self._driver, self._last_url)
+            self.logger.info(f"드라이버 재실행 후 상태 복원: {self._last_url}")
+        except Exception as e:
+            self.logger.error(f"드라이버 재실행 후 상태 복원 실패: {e}")
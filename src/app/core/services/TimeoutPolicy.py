@@ -0,0 +1,77 @@
+import math
+import threading
+
+
+class TimeoutPolicy:
+    """TimeoutPolicy 클래스
+    - (도메인, 셀렉터)별로 요소가 나타나기까지 걸린 시간을 EWMA(평균/분산)로 학습
+    - 대기시간 = EWMA 평균 + P99_K * 표준편차 + MARGIN (p99 근사)
+    - 학습 샘플이 MIN_SAMPLES 미만이면 호출자가 준 timeout을 그대로 사용하고,
+      학습된 값도 호출자의 timeout을 넘지 않음
+    - 시간초과는 실제로 걸린 시간이 대기시간 이상이라는 뜻이므로
+      대기시간 * MISS_BACKOFF를 샘플로 넣어 평균/분산을 키움
+    """
+
+    ALPHA = 0.2  # EWMA 가중치
+    P99_K = 3.0  # 표준편차 배수 (정규분포 p99 ≈ 2.33σ, 여유를 둬서 3σ)
+    MARGIN = 0.5  # 추가 여유 (초)
+    MIN_TIMEOUT = 1.0
+    MIN_SAMPLES = 5
+    MISS_BACKOFF = 2.0  # 시간초과 시 기다린 시간의 몇 배를 샘플로 넣을지
+
+    def __init__(self):
+        self._stats = {}  # (domain, selector) -> {"mean", "var", "samples", "misses"}
+        self._lock = threading.Lock()
+
+    def timeout_for(self, domain, selector, default):
+        with self._lock:
+            stat = self._stats.get((domain, selector))
+
+        if stat is None or stat["samples"] < TimeoutPolicy.MIN_SAMPLES:
+            return default
+
+        spread = TimeoutPolicy.P99_K * math.sqrt(stat["var"])
+        learned = stat["mean"] + spread + TimeoutPolicy.MARGIN
+        return min(default, max(TimeoutPolicy.MIN_TIMEOUT, learned))
+
+    def record(self, domain, selector, elapsed):
+        """요소를 찾는데 걸린 시간(초) 기록"""
+        with self._lock:
+            self._update(domain, selector, elapsed)
+
+    def record_miss(self, domain, selector, waited=None):
+        """
+        대기시간 안에 요소가 나타나지 않은 횟수 기록
+        :param waited: 시간초과까지 기다린 시간(초), 있으면 다음 대기시간을 늘림
+        """
+        with self._lock:
+            if waited != None:
+                self._update(domain, selector, waited * TimeoutPolicy.MISS_BACKOFF)
+
+            stat = self._stats.setdefault(
+                (domain, selector),
+                {"mean": 0.0, "var": 0.0, "samples": 0, "misses": 0},
+            )
+            stat["misses"] += 1
+
+    def _update(self, domain, selector, elapsed):
+        stat = self._stats.get((domain, selector))
+        if stat is None or stat["samples"] == 0:
+            misses = 0 if stat is None else stat["misses"]
+            self._stats[(domain, selector)] = {
+                "mean": elapsed,
+                "var": 0.0,
+                "samples": 1,
+                "misses": misses,
+            }
+            return
+
+        diff = elapsed - stat["mean"]
+        incr = TimeoutPolicy.ALPHA * diff
+        stat["mean"] += incr
+        stat["var"] = (1 - TimeoutPolicy.ALPHA) * (stat["var"] + diff * incr)
+        stat["samples"] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {key: dict(stat) for key, stat in self._stats.items()}
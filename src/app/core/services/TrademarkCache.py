@@ -0,0 +1,243 @@
+import os
+import re
+import sys
+import json
+import time
+import sqlite3
+import argparse
+import threading
+import unicodedata
+from app.core.utils.Logger import Logger
+
+logger = Logger(name="TrademarkCache", log_file="TrademarkCache.log").get_logger()
+
+
+class TrademarkCache:
+    """TrademarkCache 클래스
+    - 키프리스 검색어(정규화한 브랜드명)별로 파싱한 상표권 결과 행을 SQLite에 저장
+    - 결과가 있는 검색은 ttl, 결과없음(상표권출원없음)은 negative_ttl 동안 재사용
+    - 통신오류(None)는 저장하지 않음
+    - 여러 스레드/프로세스가 같은 파일을 쓰므로 WAL 모드 + 스레드 락 사용
+
+    명령행:
+        python -m app.core.services.TrademarkCache warm brands.txt
+        python -m app.core.services.TrademarkCache invalidate 나이키 NIKE
+        python -m app.core.services.TrademarkCache invalidate --expired
+        python -m app.core.services.TrademarkCache stats
+    """
+
+    DB_PATH = ".data/trademark_cache.sqlite3"
+    TTL = 60 * 60 * 24 * 30  # 결과가 있는 검색 (30일)
+    NEGATIVE_TTL = 60 * 60 * 24 * 7  # 결과없음 (7일)
+
+    def __init__(self, db_path=None, ttl=None, negative_ttl=None):
+        self.db_path = db_path or TrademarkCache.DB_PATH
+        self.ttl = TrademarkCache.TTL if ttl is None else ttl
+        self.negative_ttl = (
+            TrademarkCache.NEGATIVE_TTL if negative_ttl is None else negative_ttl
+        )
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+
+    @staticmethod
+    def normalize(brand_name):
+        """전각/반각, 대소문자, 공백 차이를 없앤 캐시 키"""
+        if brand_name is None:
+            return ""
+        text = unicodedata.normalize("NFKC", str(brand_name))
+        return re.sub(r"\s+", " ", text).strip().casefold()
+
+    def get(self, brand_name):
+        """
+        :return: 캐시된 결과 행 리스트 (결과없음이면 []), 없거나 만료되면 None
+        """
+        query = TrademarkCache.normalize(brand_name)
+        if not query:
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT rows, expires_at FROM tm_cache WHERE query = ?", (query,)
+            ).fetchone()
+
+        if row is None or row[1] < time.time():
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, brand_name, tm_rows):
+        """tm_rows가 None(통신오류)이면 저장하지 않는다"""
+        query = TrademarkCache.normalize(brand_name)
+        if not query or tm_rows is None:
+            return
+
+        ttl = self.ttl if tm_rows else self.negative_ttl
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tm_cache "
+                "(query, rows, fetched_at, expires_at) VALUES (?, ?, ?, ?)",
+                (query, json.dumps(tm_rows, ensure_ascii=False), now, now + ttl),
+            )
+            self._conn.commit()
+
+    def invalidate(self, brand_names=None):
+        """brand_names가 없으면 전체 삭제, :return: 삭제한 개수"""
+        with self._lock:
+            if brand_names is None:
+                cursor = self._conn.execute("DELETE FROM tm_cache")
+            else:
+                queries = [TrademarkCache.normalize(name) for name in brand_names]
+                cursor = self._conn.executemany(
+                    "DELETE FROM tm_cache WHERE query = ?",
+                    [(query,) for query in queries],
+                )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def purge_expired(self):
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM tm_cache WHERE expires_at < ?", (time.time(),)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def warm_up(self, brand_names, search, refresh=False):
+        """
+        브랜드명 목록을 미리 조회해서 캐시에 저장
+        :param search: brand_name -> 결과 행 리스트 / [] / None
+        :return: {"cached", "fetched", "failed"}
+        """
+        summary = {"cached": 0, "fetched": 0, "failed": 0}
+        seen = set()
+
+        for brand_name in brand_names:
+            query = TrademarkCache.normalize(brand_name)
+            if not query or query in seen:
+                continue
+            seen.add(query)
+
+            if not refresh and self.get(brand_name) is not None:
+                summary["cached"] += 1
+                continue
+
+            tm_rows = search(brand_name)
+            if tm_rows is None:
+                summary["failed"] += 1
+                logger.warning(f"캐시 예열 실패 // 브랜드-{brand_name}")
+                continue
+
+            self.put(brand_name, tm_rows)
+            summary["fetched"] += 1
+
+        return summary
+
+    def stats(self):
+        now = time.time()
+        with self._lock:
+            total, negative, expired = self._conn.execute(
+                "SELECT COUNT(*), "
+                "COALESCE(SUM(rows = '[]'), 0), "
+                "COALESCE(SUM(expires_at < ?), 0) FROM tm_cache",
+                (now,),
+            ).fetchone()
+
+        return {
+            "entries": total,
+            "negative": negative,
+            "expired": expired,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _connect(self):
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS tm_cache ("
+            "query TEXT PRIMARY KEY, "
+            "rows TEXT NOT NULL, "
+            "fetched_at REAL NOT NULL, "
+            "expires_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS tm_cache_expires ON tm_cache (expires_at)"
+        )
+        conn.commit()
+        return conn
+
+
+def _read_brand_names(path):
+    with open(path, "r", encoding="utf-8-sig") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="키프리스 상표권 캐시 관리")
+    parser.add_argument("--db", default=TrademarkCache.DB_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    warm = commands.add_parser("warm", help="브랜드명 파일(한 줄에 하나)로 캐시 예열")
+    warm.add_argument("brand_file")
+    warm.add_argument("--refresh", action="store_true", help="캐시가 있어도 재조회")
+
+    invalidate = commands.add_parser("invalidate", help="캐시 삭제")
+    invalidate.add_argument("brand_names", nargs="*")
+    invalidate.add_argument("--file", help="삭제할 브랜드명 파일")
+    invalidate.add_argument("--expired", action="store_true", help="만료된 항목만")
+    invalidate.add_argument("--all", action="store_true", help="전체 삭제")
+
+    commands.add_parser("stats", help="캐시 현황")
+
+    args = parser.parse_args(argv)
+    cache = TrademarkCache(db_path=args.db)
+
+    try:
+        if args.command == "warm":
+            from app.core.services.KiprisHttpClient import KiprisHttpClient
+
+            client = KiprisHttpClient()
+            summary = cache.warm_up(
+                _read_brand_names(args.brand_file),
+                search=client.search_tm_rows,
+                refresh=args.refresh,
+            )
+            print(summary)
+
+        elif args.command == "invalidate":
+            if args.expired:
+                print(f"만료 항목 삭제: {cache.purge_expired()}")
+            elif args.all:
+                print(f"전체 삭제: {cache.invalidate()}")
+            else:
+                brand_names = list(args.brand_names)
+                if args.file:
+                    brand_names += _read_brand_names(args.file)
+                if not brand_names:
+                    parser.error("삭제할 브랜드명, --file, --expired, --all 중 하나 필요")
+                print(f"삭제: {cache.invalidate(brand_names)}")
+
+        else:
+            print(cache.stats())
+    finally:
+        cache.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,326 @@
+import os
+import re
+import sys
+import csv
+import codecs
+import time
+import sqlite3
+import hashlib
+import argparse
+import threading
+import xml.etree.ElementTree as ET
+from app.core.services.BrandMatcher import BrandMatcher, fold
+from app.core.utils.Logger import Logger
+
+logger = Logger(name="TrademarkIndex", log_file="TrademarkIndex.log").get_logger()
+
+
+class TrademarkIndex:
+    """TrademarkIndex 클래스
+    - 키프리스 대량 데이터(CSV/XML)를 SQLite에 넣어두고 스크래핑 없이 상표권을 조회
+    - 상표명은 BrandMatcher와 같은 fold() 값으로 인덱스해서
+      브랜드의 이름 조합(variants)으로 바로 찾는다
+    - resolve()는 스크래핑 결과와 같은 {"name", "state", "prod_codes"} 행을 돌려주고,
+      없거나 MAX_AGE보다 오래된 데이터면 None (호출자가 실제 검색으로 넘어감)
+
+    명령행:
+        python -m app.core.services.TrademarkIndex import trademarks.csv
+        python -m app.core.services.TrademarkIndex import trademarks.xml
+        python -m app.core.services.TrademarkIndex lookup 나이키 NIKE
+        python -m app.core.services.TrademarkIndex stats
+    """
+
+    DB_PATH = ".data/trademark_index.sqlite3"
+    MAX_AGE = 60 * 60 * 24 * 90  # 가져온 지 90일이 지난 행은 사용하지 않음
+    BATCH_SIZE = 5000
+
+    # 내보내기 파일마다 다른 칼럼/태그 이름
+    NAME_FIELDS = (
+        "상표명",
+        "상표명칭",
+        "명칭",
+        "tradeMarkName",
+        "trademarkName",
+        "title",
+    )
+    STATE_FIELDS = ("법적상태", "등록상태", "상태", "registerStatus", "legalStatus")
+    CLASS_FIELDS = ("상품분류", "상품류", "류", "classificationCode", "niceClass")
+    APPLICATION_FIELDS = ("출원번호", "applicationNumber")
+
+    _REGISTERED_STATES = ("registered", "registration", "등록")
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, db_path=None, max_age=None):
+        self.db_path = db_path or TrademarkIndex.DB_PATH
+        self.max_age = TrademarkIndex.MAX_AGE if max_age is None else max_age
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = None
+
+    @classmethod
+    def shared(cls):
+        with cls._shared_lock:
+            if cls._shared == None:
+                cls._shared = cls()
+            return cls._shared
+
+    def resolve(self, brand_name, another_lang_brand_name=None):
+        """
+        :return: 결과 행 리스트, 인덱스에 없거나 오래된 데이터면 None
+        """
+        if not self._open(create=False):
+            return None
+
+        variants = sorted(
+            BrandMatcher(brand_name, another_lang_brand_name).variants
+        )
+        if not variants:
+            return None
+
+        placeholders = ", ".join("?" for _ in variants)
+        with self._lock:
+            found = self._conn.execute(
+                "SELECT application_number, name, state, nice_classes, imported_at "
+                "FROM trademarks "
+                f"WHERE folded IN ({placeholders})",
+                variants,
+            ).fetchall()
+
+        oldest_allowed = time.time() - self.max_age
+        if not found or any(row[4] < oldest_allowed for row in found):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return [
+            {
+                "name": name,
+                "state": state,
+                "prod_codes": nice_classes,
+                "application_number": application_number,
+            }
+            for application_number, name, state, nice_classes, _ in found
+        ]
+
+    def import_file(self, path, file_format=None):
+        """
+        CSV(utf-8 / cp949) 또는 XML 내보내기 파일을 가져온다
+        :return: 가져온 행 수
+        """
+        file_format = file_format or os.path.splitext(path)[1].lstrip(".").lower()
+        if file_format == "xml":
+            records = TrademarkIndex._iter_xml(path)
+        elif file_format == "csv":
+            records = TrademarkIndex._iter_csv(path)
+        else:
+            raise ValueError(f"지원하지 않는 파일 형식: {path}")
+
+        self._open(create=True)
+        imported_at = time.time()
+        imported = 0
+        batch = []
+
+        for record in records:
+            row = TrademarkIndex._to_row(record, imported_at)
+            if row == None:
+                continue
+            batch.append(row)
+
+            if len(batch) >= TrademarkIndex.BATCH_SIZE:
+                imported += self._write(batch)
+                batch = []
+
+        imported += self._write(batch)
+        logger.info(f"상표권 대량 데이터 가져오기 완료: {path} - {imported}건")
+        return imported
+
+    def stats(self):
+        if not self._open(create=False):
+            return {
+                "entries": 0,
+                "registered": 0,
+                "imported_at": None,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+        with self._lock:
+            total, registered, imported_at = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(state = '등록'), 0), MAX(imported_at) "
+                "FROM trademarks"
+            ).fetchone()
+
+        return {
+            "entries": total,
+            "registered": registered,
+            "imported_at": imported_at,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def close(self):
+        with self._lock:
+            if self._conn != None:
+                self._conn.close()
+                self._conn = None
+
+    def _open(self, create):
+        if self._conn != None:
+            return True
+        if not create and not os.path.exists(self.db_path):
+            return False
+
+        with self._lock:
+            if self._conn != None:
+                return True
+
+            db_dir = os.path.dirname(self.db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS trademarks ("
+                "application_number TEXT PRIMARY KEY, "
+                "name TEXT NOT NULL, "
+                "folded TEXT NOT NULL, "
+                "state TEXT, "
+                "nice_classes TEXT, "
+                "imported_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS trademarks_folded ON trademarks (folded)"
+            )
+            conn.commit()
+            self._conn = conn
+            return True
+
+    def _write(self, rows):
+        if not rows:
+            return 0
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO trademarks "
+                "(application_number, name, folded, state, nice_classes, imported_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+        return len(rows)
+
+    @classmethod
+    def _to_row(cls, record, imported_at):
+        name = cls._pick(record, cls.NAME_FIELDS)
+        folded = fold(name)
+        if not folded:
+            return None
+
+        state = cls._pick(record, cls.STATE_FIELDS) or ""
+        if state.casefold() in cls._REGISTERED_STATES:
+            state = "등록"
+
+        nice_classes = cls.normalize_nice_classes(cls._pick(record, cls.CLASS_FIELDS))
+
+        application_number = cls._pick(record, cls.APPLICATION_FIELDS)
+        if not application_number:
+            # 출원번호가 없는 파일은 내용으로 키를 만든다
+            key = f"{name}|{state}|{nice_classes}".encode("utf-8")
+            application_number = hashlib.sha1(key).hexdigest()
+
+        return (application_number, name, folded, state, nice_classes, imported_at)
+
+    @staticmethod
+    def normalize_nice_classes(text):
+        """예: "25,3 / 제18류" -> "03, 18, 25" (두 자리 류 번호)"""
+        if not text:
+            return ""
+        classes = sorted({int(code) for code in re.findall(r"\d+", str(text))})
+        return ", ".join(f"{code:02d}" for code in classes)
+
+    @staticmethod
+    def _pick(record, fields):
+        for field in fields:
+            value = record.get(field)
+            if value:
+                return str(value).strip()
+        return None
+
+    @staticmethod
+    def _iter_csv(path):
+        encoding = TrademarkIndex._detect_encoding(path)
+        with open(path, "r", encoding=encoding, newline="") as f:
+            yield from csv.DictReader(f)
+
+    @staticmethod
+    def _detect_encoding(path):
+        """utf-8로 끝까지 읽히면 utf-8-sig, 아니면 cp949 (공공데이터 CSV 기본)"""
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    decoder.decode(chunk)
+                decoder.decode(b"", final=True)
+            return "utf-8-sig"
+        except UnicodeDecodeError:
+            return "cp949"
+
+    @classmethod
+    def _iter_xml(cls, path):
+        """
+        상표명 태그를 자식으로 가진 요소를 한 건으로 보고 순서대로 읽는다
+        - 읽은 요소는 부모에서 떼어내서 큰 파일도 메모리가 늘지 않게 함
+          (clear()만 하면 빈 요소가 부모 밑에 계속 쌓임)
+        """
+        parents = []  # 지금 열려 있는 요소들 (start 이벤트 순서)
+        for event, element in ET.iterparse(path, events=("start", "end")):
+            if event == "start":
+                parents.append(element)
+                continue
+
+            parents.pop()
+            children = {child.tag: (child.text or "") for child in element}
+            if any(field in children for field in cls.NAME_FIELDS):
+                yield children
+                element.clear()
+                if parents:
+                    parents[-1].remove(element)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="키프리스 상표권 대량 데이터 인덱스")
+    parser.add_argument("--db", default=TrademarkIndex.DB_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    importing = commands.add_parser("import", help="CSV/XML 내보내기 파일 가져오기")
+    importing.add_argument("path")
+    importing.add_argument("--format", choices=("csv", "xml"))
+
+    lookup = commands.add_parser("lookup", help="브랜드명으로 조회")
+    lookup.add_argument("brand_name")
+    lookup.add_argument("another_lang_brand_name", nargs="?")
+
+    commands.add_parser("stats", help="인덱스 현황")
+
+    args = parser.parse_args(argv)
+    index = TrademarkIndex(db_path=args.db)
+
+    try:
+        if args.command == "import":
+            print(f"가져온 행: {index.import_file(args.path, file_format=args.format)}")
+        elif args.command == "lookup":
+            print(index.resolve(args.brand_name, args.another_lang_brand_name))
+        else:
+            print(index.stats())
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
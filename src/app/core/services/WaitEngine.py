@@ -0,0 +1,245 @@
+import time
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from app.core.services.CdpEventLog import CdpEventLog
+from app.core.utils.Logger import Logger
+
+# 요소 상태(present / visible / gone)가 될 때까지 MutationObserver로 기다리는 스크립트
+_ELEMENT_STATE_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const [selector, state, timeoutMs] = arguments;
+
+const isVisible = el => !!el
+    && !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+    && getComputedStyle(el).visibility !== 'hidden';
+const satisfied = () => {
+    const el = document.querySelector(selector);
+    if (state === 'present') return !!el;
+    if (state === 'visible') return isVisible(el);
+    return !isVisible(el);
+};
+
+if (satisfied()) return done(true);
+
+let timer = null;
+const observer = new MutationObserver(() => {
+    if (!satisfied()) return;
+    observer.disconnect();
+    clearTimeout(timer);
+    done(true);
+});
+observer.observe(document.documentElement, {
+    childList: true,
+    subtree: true,
+    attributes: true,
+    attributeFilter: ['style', 'class', 'hidden'],
+});
+timer = setTimeout(() => { observer.disconnect(); done(false); }, timeoutMs);
+"""
+
+# document.readyState가 complete가 되는 순간 반환하는 스크립트
+_DOCUMENT_READY_SCRIPT = """
+const done = arguments[arguments.length - 1];
+if (document.readyState === 'complete') return done(true);
+window.addEventListener('load', () => done(true), {once: true});
+"""
+
+
+class WaitEngine:
+    """WaitEngine 클래스
+    - WebDriverWait의 0.5초 폴링 대신 이벤트가 오는 즉시 대기를 끝낸다
+    - 네트워크/URL: CDP Network.*, Page.lifecycleEvent, Page.frameNavigated 이벤트
+      (CdpEventLog 공유 버퍼)
+    - 요소: 브라우저 안의 MutationObserver
+    - 시간초과 시 WebDriverWait과 같이 TimeoutException 발생
+    """
+
+    logger = Logger(name="WaitEngine", log_file="WaitEngine.log").get_logger()
+
+    POLL_INTERVAL = 0.05  # CDP 이벤트 버퍼 확인 간격 (초)
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._lifecycle_enabled_for = None
+
+    def wait_network_idle(self, idle=0.5, timeout=30):
+        """
+        진행중인 요청이 없는 상태가 idle초 유지되거나
+        Page.lifecycleEvent(networkIdle)가 오면 반환
+        - 호출 전에 이미 시작된 요청도 세도록 버퍼에 남은 현재 페이지 이벤트로
+          진행중인 요청을 먼저 채운다
+        """
+        self._enable_lifecycle_events()
+        event_log = CdpEventLog.of(self.driver)
+        events, cursor = event_log.read(0)
+
+        inflight = WaitEngine._inflight_requests(events)
+        last_activity = time.monotonic()
+        deadline = last_activity + timeout
+
+        while time.monotonic() < deadline:
+            events, cursor = event_log.read(cursor)
+
+            for event in events:
+                method = event.get("method")
+                params = event.get("params", {})
+
+                if method == "Network.requestWillBeSent":
+                    inflight.add(params.get("requestId"))
+                    last_activity = time.monotonic()
+                elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+                    inflight.discard(params.get("requestId"))
+                    last_activity = time.monotonic()
+                elif (
+                    method == "Page.lifecycleEvent"
+                    and params.get("name") == "networkIdle"
+                ):
+                    return True
+
+            if not inflight and time.monotonic() - last_activity >= idle:
+                return True
+
+            time.sleep(WaitEngine.POLL_INTERVAL)
+
+        raise TimeoutException(f"네트워크 유휴 대기 {timeout}초 초과")
+
+    def wait_url_contains(self, text, timeout=30):
+        """현재 URL(전체 이동, SPA 이동 모두)에 text가 포함되면 반환"""
+        event_log = CdpEventLog.of(self.driver)
+        cursor = event_log.cursor()
+
+        try:
+            if text in self.driver.current_url:
+                return self.driver.current_url
+        except WebDriverException:
+            pass
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            events, cursor = event_log.read(cursor)
+
+            for event in events:
+                url = WaitEngine._navigated_url(event)
+                if url and text in url:
+                    return url
+
+            time.sleep(WaitEngine.POLL_INTERVAL)
+
+        # 이벤트를 놓쳤을 경우를 대비해 마지막으로 한 번 확인
+        if text in self.driver.current_url:
+            return self.driver.current_url
+
+        raise TimeoutException(f"URL에 '{text}' 포함 대기 {timeout}초 초과")
+
+    def wait_present(self, selector, timeout=30):
+        return self._wait_element_state(selector, "present", timeout)
+
+    def wait_visible(self, selector, timeout=30):
+        return self._wait_element_state(selector, "visible", timeout)
+
+    def wait_gone(self, selector, timeout=30):
+        """selector 요소가 없어지거나 보이지 않게 되면 반환"""
+        return self._wait_element_state(selector, "gone", timeout)
+
+    def wait_document_ready(self, timeout=30):
+        deadline = time.monotonic() + timeout
+        if not self._run_async(_DOCUMENT_READY_SCRIPT, [], deadline):
+            raise TimeoutException(f"페이지 로딩 완료 대기 {timeout}초 초과")
+        return True
+
+    def _wait_element_state(self, selector, state, timeout):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if self._run_async(
+                _ELEMENT_STATE_SCRIPT, [selector, state, remaining_ms], deadline
+            ):
+                return True
+
+        raise TimeoutException(f"'{selector}' {state} 대기 {timeout}초 초과")
+
+    def _run_async(self, script, args, deadline):
+        """
+        execute_async_script 실행
+        대기 중에 페이지가 이동해서 스크립트가 중단되면 새 페이지에서 다시 실행
+        """
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            previous_timeout = self._script_timeout()
+            try:
+                self.driver.set_script_timeout(remaining + 1)
+                return self.driver.execute_async_script(script, *args)
+            except TimeoutException:
+                return False
+            except WebDriverException as e:
+                message = str(e).lower()
+                if "unload" not in message and "navigat" not in message:
+                    raise
+                time.sleep(WaitEngine.POLL_INTERVAL)
+            finally:
+                # 다른 execute_async_script 호출이 바뀐 값을 쓰지 않도록 되돌림
+                if previous_timeout != None:
+                    self._restore_script_timeout(previous_timeout)
+
+    def _script_timeout(self):
+        try:
+            return self.driver.timeouts.script
+        except Exception:
+            return None
+
+    def _restore_script_timeout(self, seconds):
+        try:
+            self.driver.set_script_timeout(seconds)
+        except WebDriverException as e:
+            self.logger.debug(f"스크립트 시간제한 복구 실패: {e}")
+
+    def _enable_lifecycle_events(self):
+        driver = getattr(self.driver, "wrapped_driver", self.driver)
+        if self._lifecycle_enabled_for is driver:
+            return
+
+        try:
+            self.driver.execute_cdp_cmd("Page.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Page.setLifecycleEventsEnabled", {"enabled": True}
+            )
+            self._lifecycle_enabled_for = driver
+        except Exception as e:
+            self.logger.debug(f"Page.lifecycleEvent 활성화 실패: {e}")
+
+    @staticmethod
+    def _inflight_requests(events):
+        """마지막 메인 프레임 이동 이후 시작되고 아직 끝나지 않은 요청 ID"""
+        inflight = set()
+        for event in events:
+            method = event.get("method")
+            params = event.get("params", {})
+
+            if method == "Page.frameNavigated" and not params.get("frame", {}).get(
+                "parentId"
+            ):
+                inflight.clear()  # 이전 페이지 요청은 무시
+            elif method == "Network.requestWillBeSent":
+                inflight.add(params.get("requestId"))
+            elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+                inflight.discard(params.get("requestId"))
+
+        return inflight
+
+    @staticmethod
+    def _navigated_url(event):
+        method = event.get("method")
+        params = event.get("params", {})
+
+        if method == "Page.frameNavigated":
+            frame = params.get("frame", {})
+            if frame.get("parentId"):  # iframe 이동은 무시
+                return None
+            return frame.get("url", "") + frame.get("urlFragment", "")
+
+        if method == "Page.navigatedWithinDocument":
+            return params.get("url")
+
+        return None
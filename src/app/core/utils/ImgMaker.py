@@ -1,8 +1,216 @@
 import os
+import re
+import time
+import shutil
+import hashlib
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from app.core.utils.Logger import Logger
 
+logger = Logger(name="ImgMaker", log_file="ImgMaker.log").get_logger()
 
-def save_imgs(image_dict: dict):
+
+class ImgDownloader:
+    """ImgDownloader 클래스
+    - keep-alive 세션 하나를 max_workers개의 스레드가 같이 쓰며 이미지를 동시에 저장
+    - 이미 있는 파일은 건너뛰고, 같은 URL/같은 내용(sha256)은 한 번만 받아 복사
+    - 중단된 다운로드는 .part 파일에서 Range 요청으로 이어받기
+    - close() 시 처리량(파일 수, MB/s) 로그
+
+    사용 예:
+        with ImgDownloader() as downloader:
+            downloader.submit("컴포트", "3237434", "https://.../3237434.jpg")
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    _UNSAFE_NAME_CHARS = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+    TIMEOUT = (5, 30)  # (연결, 읽기) 초
+
+    def __init__(self, base_dir="상표권출원등록사진", max_workers=8):
+        self.base_dir = base_dir
+
+        self.session = requests.Session()
+        retry = Retry(
+            total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="img-download"
+        )
+        self._lock = threading.Lock()
+        self._by_url = {}  # URL -> 처음 요청한 작업의 Future
+        self._by_hash = {}  # sha256 -> 저장된 파일 경로
+
+        self._started = time.monotonic()
+        self.stats = {
+            "saved": 0,
+            "skipped": 0,
+            "duplicated": 0,
+            "failed": 0,
+            "bytes": 0,
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def submit(self, category, application_number, image_url):
+        """:return: Future -> 저장한 파일 경로, 실패 시 None"""
+        # 카테고리는 키프리스 상표권 이름 그대로라 경로에 쓸 수 없는 문자가 섞일 수 있음
+        category_dir = os.path.join(self.base_dir, ImgDownloader.safe_name(category))
+        file_path = os.path.join(
+            category_dir, f"{ImgDownloader.safe_name(application_number)}.jpg"
+        )
+
+        with self._lock:
+            first = self._by_url.get(image_url)
+            if first == None:
+                future = self._executor.submit(self._download, image_url, file_path)
+                self._by_url[image_url] = future
+                return future
+
+        # 같은 URL은 처음 받은 파일을 복사
+        return self._executor.submit(self._copy_when_done, first, file_path)
+
+    def submit_all(self, image_dict: dict):
+        """{'카테고리': {'출원번호': '이미지 URL'}} 전체를 작업으로 넣는다"""
+        return [
+            self.submit(category, application_number, image_url)
+            for category, application_data in image_dict.items()
+            for application_number, image_url in application_data.items()
+        ]
+
+    def wait(self, futures):
+        """
+        작업이 모두 끝날 때까지 기다리고 작업 안에서 난 예외를 로그로 남긴다
+        :return: 실패 개수 (예외로 끝난 작업 포함)
+        """
+        for future in futures:
+            error = future.exception()
+            if error != None:
+                logger.error(f"이미지 저장 작업 예외: {error!r}")
+                self._count("failed")
+
+        with self._lock:
+            return self.stats["failed"]
+
+    @staticmethod
+    def safe_name(name):
+        """파일/디렉터리 이름으로 쓸 수 없는 문자를 _로 바꾼다"""
+        safe = ImgDownloader._UNSAFE_NAME_CHARS.sub("_", str(name)).strip().rstrip(".")
+        return safe if safe not in ("", ".", "..") else "_"
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self.session.close()
+        self.report()
+
+    def report(self):
+        elapsed = max(time.monotonic() - self._started, 1e-6)
+        with self._lock:
+            stats = dict(self.stats)
+
+        megabytes = stats["bytes"] / (1024 * 1024)
+        logger.info(
+            f"이미지 저장 {stats['saved']}개, 건너뜀 {stats['skipped']}개, "
+            f"중복 {stats['duplicated']}개, 실패 {stats['failed']}개 - "
+            f"{megabytes:.1f}MB / {elapsed:.1f}초 "
+            f"({megabytes / elapsed:.2f}MB/s, {stats['saved'] / elapsed:.1f}개/s)"
+        )
+        return stats
+
+    def _download(self, image_url, file_path):
+        if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
+            self._count("skipped")
+            return file_path
+
+        part_path = f"{file_path}.part"
+
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            headers = {"Range": f"bytes={offset}-"} if offset else {}
+
+            with self.session.get(
+                image_url, headers=headers, stream=True, timeout=ImgDownloader.TIMEOUT
+            ) as response:
+                if response.status_code == 416:  # 이미 다 받은 .part
+                    response.close()
+                elif response.status_code not in (200, 206):
+                    logger.warning(
+                        f"이미지 다운로드 실패: {image_url} "
+                        f"(상태 코드: {response.status_code})"
+                    )
+                    self._count("failed")
+                    return None
+                else:
+                    # 서버가 Range를 무시하면(200) 처음부터 다시 쓴다
+                    mode = "ab" if response.status_code == 206 else "wb"
+                    with open(part_path, mode) as file:
+                        for chunk in response.iter_content(ImgDownloader.CHUNK_SIZE):
+                            file.write(chunk)
+                            self._count("bytes", len(chunk))
+
+            return self._finish(part_path, file_path)
+
+        except Exception as e:
+            logger.error(f"이미지 다운로드 오류: {e}, URL: {image_url}")
+            self._count("failed")
+            return None
+
+    def _finish(self, part_path, file_path):
+        """내용이 같은 파일이 이미 있으면 그 파일을 복사, 아니면 .part를 최종 파일로"""
+        content_hash = ImgDownloader._sha256(part_path)
+
+        with self._lock:
+            same_file = self._by_hash.get(content_hash)
+            if same_file == None:
+                self._by_hash[content_hash] = file_path
+
+        if same_file != None and same_file != file_path:
+            shutil.copyfile(same_file, file_path)
+            os.remove(part_path)
+            self._count("duplicated")
+            return file_path
+
+        os.replace(part_path, file_path)
+        self._count("saved")
+        return file_path
+
+    def _copy_when_done(self, first, file_path):
+        source_path = first.result()
+        if source_path == None:
+            self._count("failed")
+            return None
+
+        if source_path != file_path and not os.path.exists(file_path):
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            shutil.copyfile(source_path, file_path)
+        self._count("duplicated")
+        return file_path
+
+    def _count(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+
+    @staticmethod
+    def _sha256(path):
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(ImgDownloader.CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+
+def save_imgs(image_dict: dict, base_dir="상표권출원등록사진", max_workers=8):
     """
     이미지 딕셔너리 데이터를 받아 각 카테고리별로 디렉토리를 생성하고 이미지를 저장합니다.
 
@@ -16,37 +224,16 @@ def save_imgs(image_dict: dict):
             │   ├── 32343233.jpg
             ├── 무신사/
             │   ├── 50940345.jpg
+
+    Returns:
+        dict: 저장/건너뜀/중복/실패 개수와 받은 바이트 수
     """
-    # 최상위 디렉토리 생성
-    base_dir = "상표권출원등록사진"
     os.makedirs(base_dir, exist_ok=True)
 
-    # 카테고리별 처리
-    for category, application_data in image_dict.items():
-        # 카테고리별 디렉토리 생성
-        category_dir = os.path.join(base_dir, category)
-        os.makedirs(category_dir, exist_ok=True)
-
-        for application_number, image_url in application_data.items():
-            try:
-                # 이미지 다운로드
-                response = requests.get(image_url, stream=True)
-                if response.status_code == 200:
-                    # 파일 저장 경로 설정
-                    file_name = f"{application_number}.jpg"
-                    file_path = os.path.join(category_dir, file_name)
-
-                    # 이미지 저장
-                    with open(file_path, "wb") as file:
-                        for chunk in response.iter_content(1024):
-                            file.write(chunk)
-
-                    print(f"저장 완료: {file_path}")
-                else:
-                    print(
-                        f"이미지 다운로드 실패: {image_url} (상태 코드: {response.status_code})"
-                    )
-            except Exception as e:
-                print(f"오류 발생: {e}, URL: {image_url}")
+    with ImgDownloader(base_dir=base_dir, max_workers=max_workers) as downloader:
+        failed = downloader.wait(downloader.submit_all(image_dict))
 
+    if failed:
+        logger.warning(f"이미지 {failed}개 저장 실패")
     print("모든 이미지 저장이 완료되었습니다.")
+    return downloader.stats
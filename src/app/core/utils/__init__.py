@@ -1,5 +1,5 @@
 from .Logger import Logger
 from .FileMaker import FileMaker
-from .ImgMaker import save_imgs
+from .ImgMaker import save_imgs, ImgDownloader
 
-__all__ = ["Logger", "FileMaker", "save_imgs"]
+__all__ = ["Logger", "FileMaker", "save_imgs", "ImgDownloader"]
@@ -0,0 +1,60 @@
+import unittest
+from app.core.services.AblyScraper import AblyScraper
+
+
+class _FeedItem:
+    def __init__(self, feed, number):
+        self.feed = feed
+        self.number = number
+
+    def click(self):
+        self.feed.clicked.append(self.number)
+        self.feed.current_url = f"https://m.a-bly.com/goods/{self.number}"
+
+
+class _FakeFeed:
+    """처음엔 아이템 2개, 스크롤할 때마다 2개씩 더 보이고 뒤로가기하면 처음 상태"""
+
+    def __init__(self, total):
+        self.total = total
+        self.visible = 2
+        self.clicked = []
+        self.current_url = "https://m.a-bly.com/feed"
+
+    def items(self):
+        return [_FeedItem(self, i) for i in range(min(self.visible, self.total))]
+
+    def back(self):
+        self.visible = 2
+        self.current_url = "https://m.a-bly.com/feed"
+
+
+class AblyClickHarvestTest(unittest.TestCase):
+    def _scraper(self, feed):
+        scraper = AblyScraper.__new__(AblyScraper)
+        scraper._driver = feed
+        scraper._find_feed_items = feed.items
+        scraper.scroll_element_into_view_center = lambda target: None
+        scraper.wait_url_contains = lambda text, timeout=30: feed.current_url
+
+        def scroll(**kwargs):
+            feed.visible += 2
+
+        scraper.scroll_until_settled = scroll
+        return scraper
+
+    def test_click_harvest_continues_past_loaded_items(self):
+        feed = _FakeFeed(total=5)
+        scraper = self._scraper(feed)
+        item_links = []
+
+        scraper._harvest_item_links_by_click(
+            max_items=10, add=item_links.append, item_links=item_links
+        )
+
+        self.assertEqual(feed.clicked, [0, 1, 2, 3, 4])
+        self.assertEqual(len(set(item_links)), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from app.core.services.BrandMatcher import (
+    BrandIndex,
+    BrandMatcher,
+    bounded_distance,
+    fold,
+)
+
+
+class BrandMatcherTest(unittest.TestCase):
+    def test_fold(self):
+        self.assertEqual(fold("Nike Korea!"), "nikekorea")
+        self.assertEqual(fold("ＮＩＫＥ"), "nike")
+        self.assertEqual(fold(None), "")
+
+    def test_matches_names_and_combinations(self):
+        matcher = BrandMatcher("나이키", "NIKE")
+
+        self.assertTrue(matcher.matches("나이키"))
+        self.assertTrue(matcher.matches("nike"))
+        self.assertTrue(matcher.matches("나이키 NIKE"))
+        self.assertTrue(matcher.matches("NIKE나이키"))
+        self.assertFalse(matcher.matches("나이키키즈"))
+
+    def test_empty_name_does_not_match_none(self):
+        matcher = BrandMatcher("나이키", None)
+
+        self.assertFalse(matcher.matches("None"))
+        self.assertFalse(matcher.matches(""))
+        self.assertEqual(matcher.variants, {"나이키"})
+
+    def test_max_distance(self):
+        matcher = BrandMatcher("adidas", max_distance=1)
+
+        self.assertTrue(matcher.matches("adidaz"))
+        self.assertFalse(matcher.matches("adi"))
+
+    def test_filter_rows(self):
+        matcher = BrandMatcher("나이키", "NIKE")
+        rows = [{"name": "NIKE"}, {"name": "아디다스"}, {"name": None}]
+
+        self.assertEqual(matcher.filter_rows(rows), [{"name": "NIKE"}])
+
+    def test_bounded_distance(self):
+        self.assertEqual(bounded_distance("kitten", "sitting", 3), 3)
+        self.assertEqual(bounded_distance("kitten", "sitting", 1), 2)
+
+
+class BrandIndexTest(unittest.TestCase):
+    def test_dedupe(self):
+        index = BrandIndex()
+        ids = index.dedupe(
+            [("나이키", "NIKE"), ("Nike", None), ("아디다스", "adidas"), ("", None)]
+        )
+
+        self.assertEqual(ids[0], ids[1])
+        self.assertNotEqual(ids[0], ids[2])
+        self.assertIsNone(ids[3])
+
+
+if __name__ == "__main__":
+    unittest.main()
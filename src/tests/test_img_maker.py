@@ -0,0 +1,91 @@
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from app.core.utils.ImgMaker import ImgDownloader, save_imgs
+
+
+class _ImageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != "/img/1.jpg":
+            self.send_error(404)
+            return
+
+        body = b"\xff\xd8fake-jpeg"
+        self.send_response(200)
+        self.send_header("Content-Type", "image/jpeg")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ImgMakerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _ImageHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_category_with_path_characters_stays_in_one_dir(self):
+        base_dir = os.path.join(self.tmp_dir.name, "imgs")
+        stats = save_imgs(
+            {"A/B: 나이키?": {"4020100001": f"{self.base_url}/img/1.jpg"}},
+            base_dir=base_dir,
+        )
+
+        self.assertEqual(stats["saved"], 1)
+        self.assertEqual(os.listdir(base_dir), ["A_B_ 나이키_"])
+
+    def test_failures_are_counted(self):
+        base_dir = os.path.join(self.tmp_dir.name, "imgs")
+        stats = save_imgs(
+            {
+                "나이키": {
+                    "1": f"{self.base_url}/img/1.jpg",
+                    "2": f"{self.base_url}/missing.jpg",
+                }
+            },
+            base_dir=base_dir,
+        )
+
+        self.assertEqual(stats["saved"], 1)
+        self.assertEqual(stats["failed"], 1)
+
+    def test_directory_error_is_counted_not_lost(self):
+        # 같은 이름의 파일이 있어서 카테고리 디렉터리를 만들 수 없는 경우
+        base_dir = os.path.join(self.tmp_dir.name, "imgs")
+        os.makedirs(base_dir)
+        open(os.path.join(base_dir, "나이키"), "w").close()
+
+        with ImgDownloader(base_dir=base_dir) as downloader:
+            futures = downloader.submit_all(
+                {"나이키": {"1": f"{self.base_url}/img/1.jpg"}}
+            )
+            failed = downloader.wait(futures)
+
+        self.assertEqual(failed, 1)
+        self.assertIsNone(futures[0].result())
+
+    def test_safe_name(self):
+        self.assertEqual(ImgDownloader.safe_name('a\\b*"<>|'), "a_b_____")
+        self.assertEqual(ImgDownloader.safe_name(".."), "_")
+        self.assertEqual(ImgDownloader.safe_name(" nike. "), "nike")
+
+
+if __name__ == "__main__":
+    unittest.main()
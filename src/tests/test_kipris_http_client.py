@@ -0,0 +1,154 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from app.core.services.KiprisHttpClient import KiprisHttpClient
+
+_INDEX_HTML = """
+<html><body>
+<form action="/mobile/search.do" method="get">
+  <input type="hidden" name="collection" value="trademark">
+  <input type="text" name="searchQuery" value="">
+</form>
+</body></html>
+"""
+
+
+def _row(name, state, number, prod_codes, img_src):
+    return f"""
+    <div class="row"><div class="content-data-text">
+      <a>{name}</a><span class="state">{state}</span>
+      <img src="{img_src}">
+      <ul><li><span>{number}</span></li><li><span>{prod_codes}</span></li></ul>
+    </div></div>
+    """
+
+
+def _result_html(tm_count, rows, tm_tab_url=None):
+    data_url = f' data-url="{tm_tab_url}"' if tm_tab_url else ""
+    return f"""
+    <html><body>
+    <button id="TM"{data_url}>상표 <span>({tm_count})</span></button>
+    <div id="tmResult">{"".join(rows)}</div>
+    </body></html>
+    """
+
+
+_NIKE_ROWS = [
+    _row("나이키", "등록", "4020100001", "25", "/img/1.jpg"),
+    _row("NIKE", "출원", "4020100002", "18, 25", "/img/2.jpg"),
+]
+
+_PAGES = {
+    "나이키": _result_html(2, _NIKE_ROWS),
+    # 탭 개수는 5개인데 첫 페이지에 2개만 있는 경우 (스크롤로 더 불러오는 결과)
+    "부분": _result_html(5, _NIKE_ROWS),
+    "없음": "<html><body><p>검색결과가 없습니다</p></body></html>",
+    # 결과 페이지에 목록이 없고 상표 탭 주소로 다시 요청해야 하는 경우
+    "탭": _result_html(2, [], tm_tab_url="/mobile/tm.do"),
+}
+
+
+class _KiprisHandler(BaseHTTPRequestHandler):
+    requests = []
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query).get("searchQuery", [""])[0]
+        _KiprisHandler.requests.append((url.path, query))
+
+        if url.path == KiprisHttpClient.INDEX_PATH:
+            body = _INDEX_HTML
+        elif url.path == "/mobile/search.do" and query in _PAGES:
+            body = _PAGES[query]
+        elif url.path == "/mobile/tm.do":
+            body = _result_html(2, _NIKE_ROWS)
+        else:
+            self.send_error(404)
+            return
+
+        encoded = body.encode("utf-8")
+        self.send_response(200)
+        # charset 없이 보내서 인코딩 보정도 같이 확인
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class KiprisHttpClientTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _KiprisHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _KiprisHandler.requests = []
+        self.client = KiprisHttpClient(base_url=self.base_url, timeout=5)
+
+    def test_search_parses_rows(self):
+        tm_rows = self.client.search_tm_rows("나이키")
+
+        self.assertEqual(len(tm_rows), 2)
+        self.assertEqual(tm_rows[0]["name"], "나이키")
+        self.assertEqual(tm_rows[0]["state"], "등록")
+        self.assertEqual(tm_rows[0]["prod_codes"], "25")
+        self.assertEqual(tm_rows[0]["application_number"], "4020100001")
+        self.assertEqual(tm_rows[0]["img_src"], f"{self.base_url}/img/1.jpg")
+
+    def test_incomplete_result_returns_none(self):
+        self.assertIsNone(self.client.search_tm_rows("부분"))
+
+    def test_no_result_returns_empty_list(self):
+        self.assertEqual(self.client.search_tm_rows("없음"), [])
+
+    def test_follows_tm_tab_url(self):
+        tm_rows = self.client.search_tm_rows("탭")
+
+        self.assertEqual([row["name"] for row in tm_rows], ["나이키", "NIKE"])
+        self.assertIn(("/mobile/tm.do", "탭"), _KiprisHandler.requests)
+
+    def test_search_form_is_read_once(self):
+        self.client.search_tm_rows("나이키")
+        self.client.search_tm_rows("없음")
+
+        index_requests = [
+            path for path, _ in _KiprisHandler.requests
+            if path == KiprisHttpClient.INDEX_PATH
+        ]
+        self.assertEqual(len(index_requests), 1)
+
+    def test_unknown_response_returns_none(self):
+        self.assertIsNone(self.client.search_tm_rows("모름"))
+
+    def test_rate_limiter_is_called_per_request(self):
+        calls = []
+
+        class _Limiter:
+            def acquire(self):
+                calls.append(1)
+
+        client = KiprisHttpClient(
+            base_url=self.base_url, timeout=5, rate_limiter=_Limiter()
+        )
+        client.search_tm_rows("나이키")
+
+        self.assertEqual(len(calls), 2)  # index + 검색
+
+    def test_parse_tm_count(self):
+        self.assertEqual(KiprisHttpClient.parse_tm_count(_PAGES["부분"]), 5)
+        self.assertIsNone(KiprisHttpClient.parse_tm_count("<html></html>"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from app.core.services.KiprisLookupService import KiprisLookupService, TokenBucket
+from app.core.services.TrademarkCache import TrademarkCache
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=20.0, burst=3)
+
+        started = time.monotonic()
+        for _ in range(3):
+            bucket.acquire()
+        self.assertLess(time.monotonic() - started, 0.05)
+
+        bucket.acquire()
+        # 버스트를 다 쓰면 1/rate초(0.05초)를 기다린다
+        self.assertGreaterEqual(time.monotonic() - started, 0.04)
+
+
+class KiprisLookupServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.tm_cache = TrademarkCache(
+            db_path=os.path.join(self.tmp_dir.name, "tm_cache.sqlite3")
+        )
+        self.service = KiprisLookupService(pool_size=2, tm_cache=self.tm_cache)
+
+        self.release = threading.Event()
+        self.lookups = []
+
+        def fake_lookup(brand_name):
+            self.lookups.append(brand_name)
+            self.release.wait(timeout=5)
+            return [{"name": brand_name, "state": "등록", "prod_codes": "25"}]
+
+        self.service._lookup = fake_lookup
+
+    def tearDown(self):
+        self.release.set()
+        self.service.close()
+        self.tm_cache.close()
+        self.tmp_dir.cleanup()
+
+    def test_same_query_is_coalesced(self):
+        first = self.service.submit("나이키")
+        second = self.service.submit(" 나이키 ")
+        third = self.service.submit("ＮＩＫＥ")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, third)
+        self.assertEqual(self.service.stats()["coalesced"], 1)
+
+        self.release.set()
+        self.assertEqual(first.result(timeout=5)[0]["name"], "나이키")
+        third.result(timeout=5)
+        self.assertEqual(sorted(self.lookups), sorted(["나이키", "ＮＩＫＥ"]))
+
+    def test_result_is_cached_after_done(self):
+        self.release.set()
+        self.service.lookup("나이키", timeout=5)
+
+        future = self.service.submit("나이키")
+
+        self.assertTrue(future.done())
+        self.assertEqual(len(self.lookups), 1)
+        self.assertEqual(self.service.stats()["inflight"], 0)
+
+    def test_failed_lookup_is_not_cached(self):
+        self.service._lookup = lambda brand_name: None
+
+        self.assertIsNone(self.service.lookup("아디다스", timeout=5))
+        self.assertIsNone(self.tm_cache.get("아디다스"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import Future
+from app.core.services.KiprisScrapper import KiprisScrapper
+from app.core.services.TrademarkCache import TrademarkCache
+
+_TM_ROWS = [{"name": "나이키", "state": "등록", "prod_codes": "25"}]
+
+
+class _FailingLookupService:
+    """HTTP 조회가 모두 실패(None)하는 조회 서비스"""
+
+    def submit(self, brand_name):
+        future = Future()
+        future.set_result(None)
+        return future
+
+
+class _FakeDriver:
+    pass
+
+
+class KiprisScrapperCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.tm_cache = TrademarkCache(
+            db_path=os.path.join(self.tmp_dir.name, "tm_cache.sqlite3")
+        )
+        self.scrapper = KiprisScrapper(
+            driver=_FakeDriver(),
+            lookup_service=_FailingLookupService(),
+            tm_cache=self.tm_cache,
+        )
+
+    def tearDown(self):
+        self.tm_cache.close()
+        self.tmp_dir.cleanup()
+
+    def _stub_browser(self, complete):
+        def search_in_browser(brand_name):
+            if not complete:
+                self.scrapper._tm_rows_complete = False
+            return list(_TM_ROWS)
+
+        self.scrapper._search_tm_rows_in_browser = search_in_browser
+
+    def test_partial_browser_result_is_not_cached(self):
+        self._stub_browser(complete=False)
+
+        self.scrapper.scrap_both_langs("나이키", "NIKE")
+
+        self.assertIsNone(self.tm_cache.get("나이키"))
+        self.assertIsNone(self.tm_cache.get("NIKE"))
+
+    def test_complete_browser_result_is_cached(self):
+        self._stub_browser(complete=True)
+
+        self.scrapper.scrap_both_langs("나이키", "NIKE")
+
+        self.assertEqual(self.tm_cache.get("나이키"), _TM_ROWS)
+        self.assertEqual(self.tm_cache.get("NIKE"), _TM_ROWS)
+
+
+class _FakeElement:
+    def __init__(self, text="", attrs=None, children=None):
+        self.text = text
+        self.attrs = attrs or {}
+        self.children = children or {}
+
+    def get_attribute(self, name):
+        return self.attrs.get(name)
+
+
+class _ProbeDriver:
+    """extract 스크립트는 실패하고, 행 찾기/probe 스크립트만 되는 드라이버"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def find_elements(self, by, selector):
+        return self.rows
+
+    def execute_script(self, script, *args):
+        if "querySelector(arguments[0])" not in script:
+            raise RuntimeError("extract 실패")
+        selector, within = args
+        return within.children.get(selector)
+
+
+class KiprisScrapperProbeTest(unittest.TestCase):
+    def test_probe_rows_without_optional_state(self):
+        rows = [
+            _FakeElement(
+                children={
+                    "a": _FakeElement(" 나이키 "),
+                    "span.state": _FakeElement("등록"),
+                    "ul > li:nth-child(2) > span": _FakeElement("25"),
+                    "img": _FakeElement(attrs={"src": "/img/1.jpg"}),
+                }
+            ),
+            _FakeElement(children={"a": _FakeElement("NIKE")}),
+        ]
+        scrapper = KiprisScrapper(driver=_ProbeDriver(rows))
+
+        self.assertIsNone(scrapper.extract(KiprisScrapper._TM_ROW_SCHEMA))
+        tm_rows = scrapper._probe_tm_rows()
+
+        self.assertEqual(tm_rows[0]["name"], "나이키")
+        self.assertEqual(tm_rows[0]["state"], "등록")
+        self.assertEqual(tm_rows[0]["img_src"], "/img/1.jpg")
+        self.assertEqual(tm_rows[1]["name"], "NIKE")
+        self.assertIsNone(tm_rows[1]["state"])
+
+
+if __name__ == "__main__":
+    unittest.main()
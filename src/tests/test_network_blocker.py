@@ -0,0 +1,81 @@
+import json
+import unittest
+from app.core.services.NetworkBlocker import NetworkBlocker
+
+
+class _FakeDriver:
+    def __init__(self, metrics=None, events=None):
+        self.metrics = metrics or {}
+        self.events = events or []
+        self.current_window_handle = "main"
+        self.cdp_calls = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_calls.append(command)
+
+    def execute_script(self, script, *args):
+        return dict(self.metrics)
+
+    def get_log(self, log_type):
+        events, self.events = self.events, []
+        return events
+
+
+def _entry(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+class NetworkBlockerTest(unittest.TestCase):
+    def setUp(self):
+        NetworkBlocker._stats = {}
+        NetworkBlocker._applied = {}
+
+    def tearDown(self):
+        NetworkBlocker._stats = {}
+        NetworkBlocker._applied = {}
+
+    def test_apply_is_sent_to_each_tab(self):
+        driver = _FakeDriver()
+
+        NetworkBlocker.apply(driver, "musinsa")
+        NetworkBlocker.apply(driver, "musinsa")  # 같은 탭은 생략
+        driver.current_window_handle = "new-tab"
+        NetworkBlocker.apply(driver, "musinsa")
+
+        self.assertEqual(driver.cdp_calls.count("Network.setBlockedURLs"), 2)
+
+        NetworkBlocker.forget(driver)
+        self.assertEqual(NetworkBlocker._applied, {})
+
+    def test_counts_blocked_requests_and_cdp_bytes(self):
+        driver = _FakeDriver(
+            {"loadMs": 800, "bytes": 1024, "requests": 3},
+            [
+                _entry("Network.loadingFinished", encodedDataLength=4096),
+                _entry("Network.loadingFinished", encodedDataLength=1024),
+                _entry("Network.loadingFailed", blockedReason="inspector"),
+                _entry("Network.loadingFailed", errorText="net::ERR_ABORTED"),
+            ],
+        )
+
+        metrics = NetworkBlocker.measure(driver, "musinsa", cursor=0)
+
+        self.assertEqual(metrics["blocked"], 1)
+        self.assertEqual(metrics["bytes"], 5120)
+
+    def test_report_without_baseline(self):
+        driver = _FakeDriver({"loadMs": 1000, "bytes": 2048, "requests": 3}, [])
+        NetworkBlocker.measure(driver, "kipris")
+        NetworkBlocker.measure(driver, "kipris")
+
+        row = NetworkBlocker.report()["kipris"]
+
+        self.assertEqual(row["pages"], 2)
+        self.assertEqual(row["total_kb"], 4.0)
+        self.assertEqual(row["total_load_s"], 2.0)
+        self.assertEqual(row["blocked_requests"], 0)
+        self.assertNotIn("saved_kb_per_page", row)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+from app.core.services.SellerInfoExtractor import SellerInfoExtractor
+
+
+def _extractor(site):
+    return SellerInfoExtractor(site, SellerInfoExtractor.SITE_RULES[site])
+
+
+class SellerInfoExtractorTest(unittest.TestCase):
+    def test_ably_texts(self):
+        extractor = _extractor("ably")
+        infos = extractor.extract(
+            [
+                "무신사 마켓 정보",
+                "상호: (주)무신사",
+                "대표자: 홍길동",
+                "사업자등록번호: 123-45-67890",
+                "통신판매업신고번호: 2020-서울강남-0001",
+                "전화번호: 02-123-4567",
+                "이메일: seller@example.com",
+                "주소: 서울시 강남구",
+            ]
+        )
+
+        self.assertEqual(infos["상호"], "(주)무신사")
+        self.assertEqual(infos["대표자"], "홍길동")
+        self.assertEqual(infos["브랜드"], "무신사")
+        self.assertEqual(infos["사업자번호"], "123-45-67890")
+        self.assertEqual(infos["영업소재지"], "서울시 강남구")
+        self.assertEqual(extractor.stats()["상호"], {"hit": 1, "miss": 0})
+
+    def test_missing_fields_are_none_and_counted(self):
+        extractor = _extractor("ably")
+        infos = extractor.extract(["상호: 가게", "", None])
+
+        self.assertEqual(infos["상호"], "가게")
+        self.assertIsNone(infos["사업자번호"])
+        self.assertEqual(extractor.stats()["사업자번호"], {"hit": 0, "miss": 1})
+
+    def test_count_false_skips_stats(self):
+        extractor = _extractor("ably")
+        extractor.extract(["상호: 가게"], count=False)
+
+        self.assertEqual(extractor.stats()["상호"], {"hit": 0, "miss": 0})
+
+    def test_musinsa_pairs_keep_alignment_and_unknown_titles(self):
+        extractor = _extractor("musinsa")
+        infos = extractor.extract(
+            [
+                "상호 / 대표자",
+                "무신사 / 홍길동",
+                "E-mail",
+                "",
+                "기타",
+                "값",
+                "사업자등록번호",
+                "1234567890",
+            ]
+        )
+
+        self.assertEqual(infos["상호 / 대표자"], "무신사 / 홍길동")
+        self.assertEqual(infos["E-mail"], "")
+        self.assertEqual(infos["기타"], "값")
+        self.assertEqual(infos["사업자번호"], "1234567890")
+        self.assertIsNone(infos["연락처"])
+
+    def test_data_picks_seller_object(self):
+        extractor = _extractor("musinsa_data")
+        infos = extractor.extract_data(
+            [
+                {
+                    "goods": {"name": "티셔츠", "phone": "1588-0000"},
+                    "brandInfo": {"brandName": "나이키"},
+                    "company": {
+                        "companyName": "나이키코리아",
+                        "ceoName": "홍길동",
+                        "businessNumber": 1234567890,
+                        "email": "a@example.com",
+                    },
+                }
+            ]
+        )
+
+        self.assertEqual(infos["상호"], "나이키코리아")
+        self.assertEqual(infos["사업자번호"], "1234567890")
+        self.assertEqual(infos["브랜드"], "나이키")
+        # 판매자 객체에 없는 연락처는 다른 객체에서 가져오지 않음
+        self.assertIsNone(infos["연락처"])
+
+
+if __name__ == "__main__":
+    unittest.main()
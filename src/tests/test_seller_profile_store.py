@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+from app.core.services.SellerProfileStore import SellerProfileStore
+
+_PROFILE = {"브랜드": "무신사", "사업자번호": "123-45-67890"}
+
+
+class SellerProfileStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "seller_profiles.sqlite3")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _store(self, **kwargs):
+        store = SellerProfileStore(db_path=self.db_path, **kwargs)
+        self.addCleanup(store.close)
+        return store
+
+    def test_profile_is_found_by_every_key(self):
+        store = self._store()
+        store.put(
+            _PROFILE,
+            ably_market=123,
+            business_number=SellerProfileStore.business_number_key("123-45-67890"),
+            unknown_kind="무시",
+        )
+
+        self.assertEqual(store.get("ably_market", "123"), _PROFILE)
+        self.assertEqual(store.get("business_number", "1234567890"), _PROFILE)
+        self.assertIsNone(store.get("unknown_kind", "무시"))
+        self.assertIsNone(store.get("ably_market", None))
+
+    def test_returned_profile_is_a_copy(self):
+        store = self._store()
+        store.put(_PROFILE, musinsa_brand="musinsa")
+
+        store.get("musinsa_brand", "musinsa")["브랜드"] = "변경"
+
+        self.assertEqual(store.get("musinsa_brand", "musinsa")["브랜드"], "무신사")
+
+    def test_persists_across_instances(self):
+        self._store().put(_PROFILE, musinsa_brand="musinsa")
+
+        self.assertEqual(self._store().get("musinsa_brand", "musinsa"), _PROFILE)
+
+    def test_expired_profile(self):
+        store = self._store(ttl=-1)
+        store.put(_PROFILE, musinsa_brand="musinsa")
+
+        self.assertIsNone(store.get("musinsa_brand", "musinsa"))
+        self.assertEqual(store.purge_expired(), 1)
+
+    def test_key_helpers(self):
+        self.assertEqual(
+            SellerProfileStore.business_number_key("123-45-67890"), "1234567890"
+        )
+        self.assertIsNone(SellerProfileStore.business_number_key("스크랩실패"))
+        self.assertEqual(
+            SellerProfileStore.ably_market_id("https://a-bly.com/app/markets/5555"),
+            "5555",
+        )
+        self.assertEqual(
+            SellerProfileStore.ably_market_id("https://m.a-bly.com/market/77/info"),
+            "77",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import threading
+import time
+import unittest
+from unittest import mock
+from app.core.services.SeniumDravierManager import SeniumDravierManager
+from app.core.services.SeniumDriverPool import SeniumDriverPool
+
+
+class _FakeSwitchTo:
+    def __init__(self, driver):
+        self._driver = driver
+
+    def window(self, handle):
+        self._driver.current = handle
+
+
+class _FakeDriver:
+    def __init__(self, pages):
+        self.pages = dict(pages)  # 핸들 -> URL
+        self.window_handles = list(pages)
+        self.current = self.window_handles[0]
+        self.switch_to = _FakeSwitchTo(self)
+        self.cdp_calls = []
+
+    @property
+    def current_url(self):
+        return self.pages[self.current]
+
+    def close(self):
+        self.window_handles.remove(self.current)
+
+    def get(self, url):
+        self.pages[self.current] = url
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_calls.append((command, params))
+
+
+class SeniumDriverPoolResetTest(unittest.TestCase):
+    def test_reset_clears_cookies_and_visited_origins(self):
+        pool = SeniumDriverPool(size=1)
+        driver = _FakeDriver(
+            {"main": "https://m.a-bly.com/goods/1", "tab": "http://m.kipris.or.kr/x"}
+        )
+        manager = SeniumDravierManager()
+        manager.visited_origins = {"https://www.musinsa.com"}
+        pool._managers[id(driver)] = manager
+
+        self.assertTrue(pool._reset_state(driver))
+
+        self.assertEqual(driver.window_handles, ["main"])
+        self.assertEqual(driver.current_url, "about:blank")
+        self.assertIn(("Network.clearBrowserCookies", {}), driver.cdp_calls)
+        cleared = {
+            params["origin"]
+            for command, params in driver.cdp_calls
+            if command == "Storage.clearDataForOrigin"
+        }
+        self.assertEqual(
+            cleared,
+            {
+                "https://m.a-bly.com",
+                "http://m.kipris.or.kr",
+                "https://www.musinsa.com",
+            },
+        )
+        self.assertEqual(manager.visited_origins, set())
+
+    def test_origin_of(self):
+        self.assertEqual(
+            SeniumDravierManager.origin_of("https://a-bly.com/app/markets/1"),
+            "https://a-bly.com",
+        )
+        self.assertIsNone(SeniumDravierManager.origin_of("about:blank"))
+        self.assertIsNone(SeniumDravierManager.origin_of(None))
+
+
+class SeniumDriverPoolRecycleTest(unittest.TestCase):
+    def test_recycled_driver_is_rekeyed(self):
+        pool = SeniumDriverPool(size=1)
+        old_driver = _FakeDriver({"main": "about:blank"})
+        new_driver = _FakeDriver({"main": "about:blank"})
+
+        manager = SeniumDravierManager()
+        manager.driver = old_driver
+        manager._quit_driver = lambda retiring=False: None
+        manager._init_driver = lambda: new_driver
+        manager.on_recycle = pool._rekey
+        pool._managers[id(old_driver)] = manager
+
+        self.assertIs(manager.recycle(), new_driver)
+
+        self.assertEqual(list(pool._managers), [id(new_driver)])
+        # 대여자가 이전 드라이버로 반납해도 새 드라이버로 찾는다
+        self.assertIs(pool._current(old_driver), new_driver)
+        self.assertEqual(pool._replaced, {})
+
+
+class SeniumDriverPoolLaunchTest(unittest.TestCase):
+    def test_concurrent_checkouts_do_not_exceed_size(self):
+        pool = SeniumDriverPool(size=2, checkout_timeout=0.5)
+        launched = []
+
+        def slow_launch():
+            time.sleep(0.05)  # 락 밖에서 생성하는 동안 다른 스레드가 끼어들 틈
+            driver = _FakeDriver({"main": "about:blank"})
+            with pool._lock:
+                pool._managers[id(driver)] = None
+            launched.append(driver)
+            return driver
+
+        pool._launch = slow_launch
+        pool._is_healthy = lambda driver: True
+        errors = []
+
+        def checkout():
+            try:
+                pool.checkout()
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=checkout) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(launched), 2)
+        self.assertEqual(len(errors), 3)  # 반납이 없으니 나머지는 대기 시간 초과
+        self.assertEqual(pool._pending, 0)
+
+    def test_failed_launch_raises_and_releases_slot(self):
+        pool = SeniumDriverPool(size=1)
+        cause = ValueError("chrome 실행 실패")
+
+        with mock.patch.object(
+            SeniumDravierManager, "_init_driver", side_effect=cause
+        ), mock.patch.object(SeniumDravierManager, "_quit_driver"):
+            with self.assertRaises(RuntimeError) as ctx:
+                pool.checkout(timeout=0)
+
+        self.assertIs(ctx.exception.__cause__, cause)
+        self.assertEqual(pool._pending, 0)
+        self.assertEqual(pool._managers, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+from app.core.services.SeniumDravierManager import SeniumDravierManager
+from app.core.services.SupervisedDriver import SupervisedDriver
+
+
+class _FakeDriver:
+    def quit(self):
+        pass
+
+
+class SupervisedDriverWrapTest(unittest.TestCase):
+    def setUp(self):
+        self.old_driver = _FakeDriver()
+        self.new_driver = _FakeDriver()
+
+        self.manager = SeniumDravierManager(headless=False)
+        self.manager.driver = self.old_driver
+        self.manager._init_driver = lambda: self.new_driver
+        with SeniumDravierManager._live_lock:
+            SeniumDravierManager._live_managers[id(self.old_driver)] = self.manager
+
+    def tearDown(self):
+        with SeniumDravierManager._live_lock:
+            SeniumDravierManager._live_managers.pop(id(self.old_driver), None)
+            SeniumDravierManager._live_managers.pop(id(self.new_driver), None)
+        self.manager.driver = None
+        self.manager._quit_driver()
+
+    def test_managed_driver_shares_one_wrapper(self):
+        first = SupervisedDriver.wrap(self.old_driver)
+        second = SupervisedDriver.wrap(self.old_driver)
+
+        self.assertIs(first, second)
+        self.assertFalse(first._headless)  # 매니저 설정을 따름
+
+    def test_wrapping_recycled_driver_returns_current_wrapper(self):
+        supervised = SupervisedDriver.wrap(self.old_driver)
+
+        self.manager.recycle()
+
+        self.assertIs(supervised.wrapped_driver, self.new_driver)
+        # 교체 전 드라이버를 들고 있던 쪽도 같은 래퍼(새 드라이버)를 받는다
+        self.assertIs(SupervisedDriver.wrap(self.old_driver), supervised)
+
+    def test_unmanaged_driver_gets_own_wrapper(self):
+        driver = _FakeDriver()
+
+        self.assertIsNot(SupervisedDriver.wrap(driver), SupervisedDriver.wrap(driver))
+        self.assertIsNone(SupervisedDriver.wrap(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
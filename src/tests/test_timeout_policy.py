@@ -0,0 +1,54 @@
+import unittest
+from app.core.services.TimeoutPolicy import TimeoutPolicy
+
+
+class TimeoutPolicyTest(unittest.TestCase):
+    def test_default_until_enough_samples(self):
+        policy = TimeoutPolicy()
+        for _ in range(TimeoutPolicy.MIN_SAMPLES - 1):
+            policy.record("a-bly.com", "p", 0.2)
+
+        self.assertEqual(policy.timeout_for("a-bly.com", "p", 10), 10)
+        self.assertEqual(policy.timeout_for("a-bly.com", "img", 10), 10)
+
+    def test_learned_timeout(self):
+        policy = TimeoutPolicy()
+        for _ in range(TimeoutPolicy.MIN_SAMPLES):
+            policy.record("a-bly.com", "p", 2.0)
+
+        # 분산 0 -> 평균 + MARGIN
+        self.assertAlmostEqual(policy.timeout_for("a-bly.com", "p", 10), 2.5)
+
+    def test_learned_timeout_is_bounded(self):
+        policy = TimeoutPolicy()
+        for _ in range(TimeoutPolicy.MIN_SAMPLES):
+            policy.record("fast", "p", 0.01)
+            policy.record("slow", "p", 20.0)
+
+        self.assertEqual(policy.timeout_for("fast", "p", 10), TimeoutPolicy.MIN_TIMEOUT)
+        self.assertEqual(policy.timeout_for("slow", "p", 10), 10)
+
+    def test_miss_widens_timeout(self):
+        policy = TimeoutPolicy()
+        for _ in range(TimeoutPolicy.MIN_SAMPLES):
+            policy.record("a-bly.com", "p", 2.0)
+        learned = policy.timeout_for("a-bly.com", "p", 10)
+
+        policy.record_miss("a-bly.com", "p", learned)
+
+        self.assertGreater(policy.timeout_for("a-bly.com", "p", 10), learned)
+        self.assertEqual(policy.snapshot()[("a-bly.com", "p")]["misses"], 1)
+
+    def test_miss_before_any_sample_keeps_count(self):
+        policy = TimeoutPolicy()
+        policy.record_miss("a-bly.com", "p")
+        policy.record("a-bly.com", "p", 2.0)
+
+        stat = policy.snapshot()[("a-bly.com", "p")]
+        self.assertEqual(stat["misses"], 1)
+        self.assertEqual(stat["samples"], 1)
+        self.assertEqual(stat["mean"], 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+from app.core.services.TrademarkCache import TrademarkCache
+
+_TM_ROWS = [{"name": "나이키", "state": "등록", "prod_codes": "25"}]
+
+
+class TrademarkCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "tm_cache.sqlite3")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _cache(self, **kwargs):
+        cache = TrademarkCache(db_path=self.db_path, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_put_and_get_with_normalized_key(self):
+        cache = self._cache()
+        cache.put("ＮＩＫＥ  Korea", _TM_ROWS)
+
+        self.assertEqual(cache.get("nike korea"), _TM_ROWS)
+
+    def test_no_result_is_cached_but_failure_is_not(self):
+        cache = self._cache()
+        cache.put("없음", [])
+        cache.put("통신오류", None)
+
+        self.assertEqual(cache.get("없음"), [])
+        self.assertIsNone(cache.get("통신오류"))
+
+    def test_expired_entries(self):
+        cache = self._cache(ttl=-1, negative_ttl=60)
+        cache.put("나이키", _TM_ROWS)
+        cache.put("없음", [])
+
+        self.assertIsNone(cache.get("나이키"))
+        self.assertEqual(cache.get("없음"), [])
+        self.assertEqual(cache.purge_expired(), 1)
+
+    def test_persists_across_instances(self):
+        self._cache().put("나이키", _TM_ROWS)
+
+        self.assertEqual(self._cache().get("나이키"), _TM_ROWS)
+
+    def test_invalidate(self):
+        cache = self._cache()
+        cache.put("나이키", _TM_ROWS)
+        cache.put("아디다스", _TM_ROWS)
+
+        self.assertEqual(cache.invalidate(["나이키"]), 1)
+        self.assertIsNone(cache.get("나이키"))
+        self.assertEqual(cache.invalidate(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import os
+import tempfile
+import unittest
+from app.core.services.TrademarkIndex import TrademarkIndex
+
+_XML = """<?xml version="1.0" encoding="utf-8"?>
+<response>
+  <header><resultCode>00</resultCode></header>
+  <items>
+    <item><상표명>나이키</상표명><법적상태>등록</법적상태></item>
+    <item><상표명>NIKE</상표명><법적상태>출원</법적상태></item>
+    <item><상표명>아디다스</상표명><법적상태>등록</법적상태></item>
+  </items>
+</response>
+"""
+
+
+class TrademarkIndexXmlTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "export.xml")
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(_XML)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_iter_xml_reads_nested_records(self):
+        records = list(TrademarkIndex._iter_xml(self.path))
+
+        self.assertEqual(
+            [record["상표명"] for record in records], ["나이키", "NIKE", "아디다스"]
+        )
+        self.assertEqual(records[1]["법적상태"], "출원")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import json
+import unittest
+from types import SimpleNamespace
+from selenium.common.exceptions import TimeoutException
+from app.core.services.WaitEngine import WaitEngine
+
+
+def _entry(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+class _FakeDriver:
+    def __init__(self, entries=None):
+        self.timeouts = SimpleNamespace(script=30)
+        self.entries = list(entries or [])
+        self.script_timeouts = []
+
+    def set_script_timeout(self, seconds):
+        self.timeouts.script = seconds
+        self.script_timeouts.append(seconds)
+
+    def execute_async_script(self, script, *args):
+        return True
+
+    def execute_cdp_cmd(self, cmd, params):
+        return {}
+
+    def get_log(self, log_type):
+        entries, self.entries = self.entries, []
+        return entries
+
+
+class WaitEngineTest(unittest.TestCase):
+    def test_script_timeout_is_restored(self):
+        driver = _FakeDriver()
+
+        WaitEngine(driver).wait_document_ready(timeout=5)
+
+        self.assertEqual(len(driver.script_timeouts), 2)
+        self.assertEqual(driver.timeouts.script, 30)
+
+    def test_network_idle_counts_requests_started_before_call(self):
+        driver = _FakeDriver(
+            [
+                _entry("Network.requestWillBeSent", requestId="old"),
+                _entry("Page.frameNavigated", frame={"url": "https://a-bly.com/"}),
+                _entry("Network.requestWillBeSent", requestId="1"),
+                _entry("Network.requestWillBeSent", requestId="2"),
+                _entry("Network.loadingFinished", requestId="1"),
+            ]
+        )
+
+        with self.assertRaises(TimeoutException):
+            WaitEngine(driver).wait_network_idle(idle=0.05, timeout=0.3)
+
+    def test_network_idle_after_requests_finish(self):
+        driver = _FakeDriver(
+            [
+                _entry("Network.requestWillBeSent", requestId="1"),
+                _entry("Network.loadingFailed", requestId="1"),
+            ]
+        )
+
+        self.assertTrue(WaitEngine(driver).wait_network_idle(idle=0.05, timeout=2))
+
+
+if __name__ == "__main__":
+    unittest.main()